@@ -87,6 +87,7 @@ class PackSpecsBuildHook(BuildHookInterface):
     self._pack_basic_catalogs(
         repo_root, basic_catalog_constants.BASIC_CATALOG_PATHS, target_base
     )
+    self._build_artifacts(basic_catalog_constants.BASIC_CATALOG_PATHS, target_base)
 
   def _pack_schemas(self, repo_root, spec_map, target_base):
     for ver, schema_map in spec_map.items():
@@ -104,6 +105,30 @@ class PackSpecsBuildHook(BuildHookInterface):
       for _key, source_rel_path in path_map.items():
         self._copy_schema(repo_root, source_rel_path, target_dir)
 
+  def _build_artifacts(self, catalog_paths, target_base):
+    """Precomputes the derived values of the basic catalogs.
+
+    The catalogs are loaded from the schemas just copied to the assets, the same
+    way they are loaded at runtime.
+    """
+    # src/ is on sys.path once load_module ran.
+    from a2ui.basic_catalog import BasicCatalog
+    from a2ui.schema.artifacts import (
+        BASIC_CATALOG_ARTIFACTS_FILENAME,
+        build_catalog_artifacts,
+        dump_catalog_artifacts,
+    )
+    from a2ui.schema.manager import A2uiSchemaManager
+
+    for ver in catalog_paths:
+      catalog = A2uiSchemaManager(
+          ver, catalogs=[BasicCatalog.get_config(ver)]
+      ).get_selected_catalog()
+      dst_file = os.path.join(target_base, ver, BASIC_CATALOG_ARTIFACTS_FILENAME)
+      print(f"Writing catalog artifacts -> {dst_file}")
+      with open(dst_file, "w", encoding="utf-8") as f:
+        f.write(dump_catalog_artifacts(build_catalog_artifacts(catalog)))
+
   def _copy_schema(self, repo_root, source_rel_path, target_dir):
     source_path = os.path.join(repo_root, source_rel_path)
 
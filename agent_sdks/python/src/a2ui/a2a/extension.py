@@ -13,10 +13,11 @@
 # limitations under the License.
 
 import logging
-from typing import Optional, List
+from typing import TYPE_CHECKING, Optional, List
 
-from a2a.server.agent_execution import RequestContext
-from a2a.types import AgentCard, AgentExtension
+if TYPE_CHECKING:
+  from a2a.server.agent_execution import RequestContext
+  from a2a.types import AgentCard, AgentExtension
 
 logger = logging.getLogger(__name__)
 
@@ -29,7 +30,7 @@ def get_a2ui_agent_extension(
     version: str,
     accepts_inline_catalogs: bool = False,
     supported_catalog_ids: List[str] = [],
-) -> AgentExtension:
+) -> "AgentExtension":
   """Creates the A2UI AgentExtension configuration.
 
   Args:
@@ -40,6 +41,8 @@ def get_a2ui_agent_extension(
   Returns:
       The configured A2UI AgentExtension.
   """
+  from a2a.types import AgentExtension
+
   params = {}
   if accepts_inline_catalogs:
     params[AGENT_EXTENSION_ACCEPTS_INLINE_CATALOGS_KEY] = (
@@ -56,7 +59,7 @@ def get_a2ui_agent_extension(
   )
 
 
-def _agent_extensions(agent_card: AgentCard) -> List[str]:
+def _agent_extensions(agent_card: "AgentCard") -> List[str]:
   """Returns the A2UI extension URIs supported by the agent."""
   extensions = []
   if (
@@ -72,7 +75,7 @@ def _agent_extensions(agent_card: AgentCard) -> List[str]:
   return extensions
 
 
-def _requested_a2ui_extensions(context: RequestContext) -> List[str]:
+def _requested_a2ui_extensions(context: "RequestContext") -> List[str]:
   """Returns the A2UI extension URIs requested by the client."""
   requested_extensions = []
   if hasattr(context, "requested_extensions") and context.requested_extensions:
@@ -117,7 +120,7 @@ def _select_newest_a2ui_extension(
 
 
 def try_activate_a2ui_extension(
-    context: RequestContext, agent_card: AgentCard
+    context: "RequestContext", agent_card: "AgentCard"
 ) -> Optional[str]:
   """Activates the A2UI extension if requested.
 
@@ -13,15 +13,15 @@
 # limitations under the License.
 
 import logging
-from typing import Any, Optional, List, AsyncIterable, TYPE_CHECKING
+from concurrent.futures import Executor
+from typing import Any, Optional, List, AsyncIterable, Iterator, TYPE_CHECKING
 
+# a2a.types is imported where it is used, so that importing this module (e.g.
+# for the MIME type constants) doesn't pay for the pydantic models.
 if TYPE_CHECKING:
+  from a2a.types import DataPart, Part
   from a2ui.parser.streaming import A2uiStreamParser
-from a2a.types import (
-    Part,
-    DataPart,
-    TextPart,
-)
+  from a2ui.schema.validator import A2uiValidator
 
 logger = logging.getLogger(__name__)
 
@@ -30,7 +30,9 @@ A2UI_MIME_TYPE = "application/a2ui+json"
 DEPRECATED_A2UI_MIME_TYPE = "application/json+a2ui"
 
 
-def create_a2ui_part(a2ui_data: dict[str, Any], version: Optional[str] = None) -> Part:
+def create_a2ui_part(
+    a2ui_data: dict[str, Any], version: Optional[str] = None
+) -> "Part":
   """Creates an A2A Part containing A2UI data.
 
   Args:
@@ -40,6 +42,8 @@ def create_a2ui_part(a2ui_data: dict[str, Any], version: Optional[str] = None) -
   Returns:
       An A2A Part with a DataPart containing the A2UI data.
   """
+  from a2a.types import DataPart, Part
+
   mime_type = A2UI_MIME_TYPE
   if version in ("0.8", "0.9", "v0.8", "v0.9"):
     mime_type = DEPRECATED_A2UI_MIME_TYPE
@@ -54,7 +58,7 @@ def create_a2ui_part(a2ui_data: dict[str, Any], version: Optional[str] = None) -
   )
 
 
-def is_a2ui_part(part: Part) -> bool:
+def is_a2ui_part(part: "Part") -> bool:
   """Checks if an A2A Part contains A2UI data.
 
   Args:
@@ -63,6 +67,8 @@ def is_a2ui_part(part: Part) -> bool:
   Returns:
       True if the part contains A2UI data, False otherwise.
   """
+  from a2a.types import DataPart
+
   return (
       isinstance(part.root, DataPart)
       and part.root.metadata
@@ -71,7 +77,7 @@ def is_a2ui_part(part: Part) -> bool:
   )
 
 
-def get_a2ui_datapart(part: Part) -> Optional[DataPart]:
+def get_a2ui_datapart(part: "Part") -> Optional["DataPart"]:
   """Extracts the DataPart containing A2UI data from an A2A Part, if present.
 
   Args:
@@ -90,7 +96,7 @@ def parse_response_to_parts(
     validator: Optional[Any] = None,
     fallback_text: Optional[str] = None,
     version: Optional[str] = None,
-) -> List[Part]:
+) -> List["Part"]:
   """Helper to parse LLM response content into A2A Parts, with optional validation.
 
   Args:
@@ -102,41 +108,52 @@ def parse_response_to_parts(
   Returns:
       A list of A2A Part objects (TextPart and/or DataPart).
   """
-  from a2ui.parser.parser import parse_response
-
   parts = []
   try:
-    response_parts = parse_response(content)
+    for payload in _build_parts(content, version, parts):
+      if validator:
+        validator.validate(payload)
+  except Exception as e:
+    logger.warning(f"Failed to parse or validate A2UI response: {e}")
 
-    for part in response_parts:
-      if part.text:
-        parts.append(Part(root=TextPart(text=part.text)))
+  return _with_fallback(parts, fallback_text)
 
-      if part.a2ui_json:
-        json_data = part.a2ui_json
-        if validator:
-          validator.validate(json_data)
 
-        if isinstance(json_data, list):
-          for message in json_data:
-            parts.append(create_a2ui_part(message, version=version))
-        else:
-          parts.append(create_a2ui_part(json_data, version=version))
+async def parse_response_to_parts_async(
+    content: str,
+    validator: Optional["A2uiValidator"] = None,
+    fallback_text: Optional[str] = None,
+    version: Optional[str] = None,
+    executor: Optional[Executor] = None,
+) -> List["Part"]:
+  """Async variant of `parse_response_to_parts` that validates off the event loop.
+
+  Args:
+      content: The LLM response content, potentially containing A2UI delimiters.
+      validator: Optional validator to run against extracted JSON payloads.
+      fallback_text: Optional text to return if no parts are successfully created.
+      version: Optional version string.
+      executor: Optional executor passed to `A2uiValidator.validate_async`.
 
+  Returns:
+      A list of A2A Part objects (TextPart and/or DataPart).
+  """
+  parts = []
+  try:
+    for payload in _build_parts(content, version, parts):
+      if validator:
+        await validator.validate_async(payload, executor=executor)
   except Exception as e:
     logger.warning(f"Failed to parse or validate A2UI response: {e}")
 
-  if not parts and fallback_text:
-    parts.append(Part(root=TextPart(text=fallback_text)))
-
-  return parts
+  return _with_fallback(parts, fallback_text)
 
 
 async def stream_response_to_parts(
     parser: "A2uiStreamParser",
     token_stream: AsyncIterable[str],
     version: Optional[str] = None,
-) -> AsyncIterable[Part]:
+) -> AsyncIterable["Part"]:
   """Helper to parse a stream of LLM tokens into A2A Parts incrementally.
 
   Args:
@@ -158,13 +175,46 @@ async def stream_response_to_parts(
 
     for part in response_parts:
       if part.text:
-        yield Part(root=TextPart(text=part.text))
+        yield _text_part(part.text)
 
       if part.a2ui_json:
-        json_data = part.a2ui_json
+        for a2ui_part in _a2ui_parts(part.a2ui_json, version):
+          yield a2ui_part
+
+
+def _build_parts(
+    content: str, version: Optional[str], parts: List["Part"]
+) -> Iterator[Any]:
+  """Parses `content` into `parts`, yielding each A2UI payload before it is added.
+
+  Callers validate the yielded payload (synchronously or not); raising stops the
+  conversion, keeping the parts built so far.
+  """
+  from a2ui.parser.parser import parse_response
+
+  for part in parse_response(content):
+    if part.text:
+      parts.append(_text_part(part.text))
+
+    if part.a2ui_json:
+      yield part.a2ui_json
+      parts.extend(_a2ui_parts(part.a2ui_json, version))
+
+
+def _a2ui_parts(json_data: Any, version: Optional[str]) -> List["Part"]:
+  """Wraps an A2UI payload (one message or a list of them) into A2A Parts."""
+  if isinstance(json_data, list):
+    return [create_a2ui_part(message, version=version) for message in json_data]
+  return [create_a2ui_part(json_data, version=version)]
+
+
+def _with_fallback(parts: List["Part"], fallback_text: Optional[str]) -> List["Part"]:
+  if not parts and fallback_text:
+    parts.append(_text_part(fallback_text))
+  return parts
+
+
+def _text_part(text: str) -> "Part":
+  from a2a.types import Part, TextPart
 
-        if isinstance(json_data, list):
-          for message in json_data:
-            yield create_a2ui_part(message, version=version)
-        else:
-          yield create_a2ui_part(json_data, version=version)
+  return Part(root=TextPart(text=text))
@@ -18,6 +18,29 @@ This module provides the `A2uiEventConverter` which intercepts ADK events and au
 translates GenAI model outputs (both tool-based A2UI function calls and text-based delimited A2UI blocks)
 into A2A (Agent-to-Agent) event structures with A2UI payloads, using the session catalog if available.
 
+The session state should hold a reference to the catalog (see
+`a2ui.schema.catalog_refs.catalog_ref`) rather than the catalog itself, so
+persistent session services don't store the full schemas. Catalog objects
+stored by earlier versions are still accepted. Pass the agent's `schema_manager`
+so references to pruned catalogs resolve in any worker; a reference that does
+not resolve raises `CatalogResolutionError` rather than converting the event
+without its catalog.
+
+Part converters are cached per catalog content, so the events of a turn (and of
+other sessions using the same catalog) share one converter and its compiled
+validator, even when the session service deserializes a new catalog object for
+every event.
+
+With `stream_tool_args=True`, the `a2ui_json` argument of
+`send_a2ui_json_to_client` calls streamed by the model (see the `stream_args`
+option of `SendA2uiToClientToolset`) is fed through `A2uiStreamParser` as it
+arrives, and A2UI parts are emitted as soon as components become renderable.
+The tool response of a streamed call then only confirms the UI that was already
+sent, instead of sending it again. If the streamed arguments could not be parsed
+to the end, the response sends the validated messages that were not streamed
+yet; if the tool rejects the payload, the surfaces the stream touched are deleted,
+so the client doesn't keep UI that never passed validation.
+
 Key Components:
   * `A2uiEventConverter`: An event converter that automatically injects the A2UI catalog into part conversion.
 
@@ -33,18 +56,188 @@ Usage Example:
   ```
 """
 
-from typing import TYPE_CHECKING, Optional
+import logging
+from concurrent.futures import Executor
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, NamedTuple, Optional
 
+from a2ui.a2a.parts import create_a2ui_part
 from a2ui.adk.a2a.part_converter import A2uiPartConverter
+from a2ui.parser.constants import (
+    MSG_TYPE_BEGIN_RENDERING,
+    MSG_TYPE_CREATE_SURFACE,
+    MSG_TYPE_DELETE_SURFACE,
+)
+from a2ui.parser.streaming import A2uiStreamParser
+from a2ui.schema import constants
+from a2ui.schema.cache import CacheInfo, LruCache
+from a2ui.schema.catalog_refs import CatalogResolutionError, resolve_catalog
 from google.adk.a2a.converters import part_converter
 from google.adk.utils.feature_decorator import experimental
 
 if TYPE_CHECKING:
+  from a2a import types as a2a_types
   from a2a.server.events import Event as A2AEvent
+  from google.genai import types as genai_types
+  from a2ui.schema.catalog import A2uiCatalog
+  from a2ui.schema.manager import A2uiSchemaManager
   from google.adk.a2a.converters.part_converter import GenAIPartToA2APartConverter
   from google.adk.agents.invocation_context import InvocationContext
   from google.adk.events.event import Event
 
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONVERTER_CACHE_SIZE = 32
+DEFAULT_TOOL_ARG_STREAMS = 256
+
+# The JSONPath of the streamed `a2ui_json` argument in `PartialArg`s.
+_A2UI_JSON_ARG_PATH = "$.a2ui_json"
+
+# The message types starting a surface (v0.9+ and v0.8).
+_SURFACE_START_TYPES = (MSG_TYPE_CREATE_SURFACE, MSG_TYPE_BEGIN_RENDERING)
+
+
+class _StreamedCall(NamedTuple):
+  """The messages sent while an A2UI tool call was streamed."""
+
+  messages: List[Dict[str, Any]]
+  # Whether the arguments were parsed to the end, i.e. the whole UI was sent.
+  complete: bool
+
+
+def _surface_id(message: Dict[str, Any]) -> Optional[str]:
+  for body in message.values():
+    if isinstance(body, dict) and isinstance(body.get(constants.SURFACE_ID_KEY), str):
+      return body[constants.SURFACE_ID_KEY]
+  return None
+
+
+def _started_surface_ids(messages: List[Dict[str, Any]]) -> List[str]:
+  """Returns the IDs of the surfaces `messages` start, in order."""
+  started = (
+      _surface_id(message)
+      for message in messages
+      if any(key in message for key in _SURFACE_START_TYPES)
+  )
+  return list(dict.fromkeys(filter(None, started)))
+
+
+def _unsent_messages(
+    messages: List[Dict[str, Any]], sent: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+  """Returns the messages not sent yet, never starting a surface twice."""
+  started = set(_started_surface_ids(sent))
+  return [
+      message
+      for message in messages
+      if message not in sent
+      and not (
+          any(key in message for key in _SURFACE_START_TYPES)
+          and _surface_id(message) in started
+      )
+  ]
+
+
+def _delete_surface_messages(
+    messages: List[Dict[str, Any]], version: str
+) -> List[Dict[str, Any]]:
+  """Returns the messages deleting the surfaces `messages` started.
+
+  Surfaces that were only updated existed before, and are left to the client.
+  """
+  deletes = []
+  for surface_id in _started_surface_ids(messages):
+    message = {MSG_TYPE_DELETE_SURFACE: {constants.SURFACE_ID_KEY: surface_id}}
+    if version != constants.VERSION_0_8:
+      message = {"version": f"v{version}", **message}
+    deletes.append(message)
+  return deletes
+
+
+def _with_validated_messages(
+    part: "genai_types.Part", messages: List[Dict[str, Any]]
+) -> "genai_types.Part":
+  """Returns a copy of an A2UI tool response part sending only `messages`."""
+  function_response = part.function_response
+  response = {
+      **(function_response.response or {}),
+      constants.A2UI_VALIDATED_JSON_KEY: messages,
+  }
+  return part.model_copy(
+      update={
+          "function_response": function_response.model_copy(
+              update={"response": response}
+          )
+      }
+  )
+
+
+class _ToolArgStream:
+  """Parses the `a2ui_json` argument of the A2UI tool calls of one invocation."""
+
+  def __init__(self, catalog: "A2uiCatalog"):
+    self._catalog = catalog
+    self._parser: Optional[A2uiStreamParser] = None
+    self._call_id: Optional[str] = None
+    self._failed = False
+    # The messages sent for the current call.
+    self._sent: List[Dict[str, Any]] = []
+    # Whether an A2UI tool call is being streamed.
+    self.in_call = False
+    # The calls whose UI was (at least partly) sent, by call ID.
+    self.streamed_calls: Dict[str, _StreamedCall] = {}
+
+  def feed(self, function_call: "genai_types.FunctionCall") -> List["a2a_types.Part"]:
+    """Processes a chunk of a streamed call and returns the renderable parts."""
+    parts = []
+    if function_call.id and function_call.id != self._call_id:
+      parts.extend(self.close())
+      self._call_id = function_call.id
+    self.in_call = True
+    for partial_arg in function_call.partial_args or []:
+      if partial_arg.json_path != _A2UI_JSON_ARG_PATH or not partial_arg.string_value:
+        continue
+      if self._parser is None and not self._failed:
+        self._parser = A2uiStreamParser(catalog=self._catalog)
+        parts.extend(self._process(constants.A2UI_OPEN_TAG))
+      parts.extend(self._process(partial_arg.string_value))
+    if not function_call.will_continue:
+      parts.extend(self.close())
+    return parts
+
+  def close(self) -> List["a2a_types.Part"]:
+    """Ends the current call and returns its remaining parts."""
+    parts = []
+    if self._parser is not None:
+      parts = self._process(constants.A2UI_CLOSE_TAG)
+    if self._sent and self._call_id:
+      self.streamed_calls[self._call_id] = _StreamedCall(
+          self._sent, complete=not self._failed
+      )
+    self._parser = None
+    self._failed = False
+    self._sent = []
+    self.in_call = False
+    return parts
+
+  def _process(self, chunk: str) -> List["a2a_types.Part"]:
+    try:
+      response_parts = self._parser.process_chunk(chunk)
+    except Exception as e:
+      # The complete call is still validated, and the messages not sent yet are
+      # sent with the tool response.
+      logger.warning(f"Failed to parse streamed A2UI tool arguments: {e}")
+      self._parser = None
+      self._failed = True
+      return []
+    messages = [
+        message
+        for response_part in response_parts
+        if response_part.a2ui_json
+        for message in response_part.a2ui_json
+    ]
+    self._sent.extend(messages)
+    return [create_a2ui_part(message) for message in messages]
+
 
 @experimental
 class A2uiEventConverter:
@@ -52,6 +245,20 @@ class A2uiEventConverter:
 
   This allows text-based A2UI extraction and validation to work even when the
   catalog is session-specific.
+
+  Part converters are kept in an LRU cache of `converter_cache_size` entries,
+  keyed by catalog name and fingerprint. Set it to 0 to build a converter per
+  event.
+
+  With `stream_tool_args`, streamed A2UI tool arguments are rendered
+  progressively; the parser state of the last `DEFAULT_TOOL_ARG_STREAMS`
+  invocations is kept.
+
+  `convert_async` validates A2UI in `validation_executor` (or the event loop's
+  default thread pool) instead of on the event loop.
+
+  Catalog references in the session state are resolved with `schema_manager`
+  (see `a2ui.schema.catalog_refs.resolve_catalog`).
   """
 
   def __init__(
@@ -59,10 +266,29 @@ class A2uiEventConverter:
       catalog_key: str = "system:a2ui_catalog",
       bypass_tool_check: bool = False,
       fallback_text: Optional[str] = None,
+      converter_cache_size: int = DEFAULT_CONVERTER_CACHE_SIZE,
+      stream_tool_args: bool = False,
+      validation_executor: Optional[Executor] = None,
+      schema_manager: Optional["A2uiSchemaManager"] = None,
   ):
     self._catalog_key = catalog_key
+    self._schema_manager = schema_manager
     self._bypass_tool_check = bypass_tool_check
     self._fallback_text = fallback_text
+    self._validation_executor = validation_executor
+    self._part_converters: Optional[LruCache] = (
+        LruCache(converter_cache_size) if converter_cache_size > 0 else None
+    )
+    # Streams of A2UI tool arguments, keyed by invocation ID.
+    self._tool_arg_streams: Optional[LruCache] = (
+        LruCache(DEFAULT_TOOL_ARG_STREAMS) if stream_tool_args else None
+    )
+
+  def converter_cache_info(self) -> Optional[CacheInfo]:
+    """Returns the hit/miss statistics of the part converter cache, if enabled."""
+    if self._part_converters is None:
+      return None
+    return self._part_converters.cache_info()
 
   def __call__(
       self,
@@ -73,20 +299,78 @@ class A2uiEventConverter:
       part_converter_func: "GenAIPartToA2APartConverter" = part_converter.convert_genai_part_to_a2a_part,
   ) -> list["A2AEvent"]:
     """Converts an ADK event to A2A events, using the session catalog if available."""
+    catalog = self._resolve_session_catalog(invocation_context)
+    if catalog:
+      # Use the catalog-aware part converter
+      part_converter_func = self._get_part_converter(catalog).convert
+    return self._convert_event(
+        event, invocation_context, task_id, context_id, part_converter_func, catalog
+    )
+
+  async def convert_async(
+      self,
+      event: "Event",
+      invocation_context: "InvocationContext",
+      task_id: Optional[str] = None,
+      context_id: Optional[str] = None,
+      part_converter_func: "GenAIPartToA2APartConverter" = part_converter.convert_genai_part_to_a2a_part,
+  ) -> list["A2AEvent"]:
+    """Async variant of `__call__` that validates A2UI off the event loop.
+
+    The ADK executor calls event converters synchronously, so text-based A2UI is
+    validated on the event loop there. Executors that can await should call this
+    method instead: the parts of the event are converted with
+    `A2uiPartConverter.convert_async`, in the `validation_executor` if one was
+    given, before the A2A events are assembled.
+    """
+    catalog = self._resolve_session_catalog(invocation_context)
+    if catalog:
+      converter = self._get_part_converter(catalog)
+      parts = (event.content.parts if event.content else None) or []
+      converted = {id(part): await converter.convert_async(part) for part in parts}
+
+      def convert(part: "genai_types.Part") -> List["a2a_types.Part"]:
+        a2a_parts = converted.pop(id(part), None)
+        return a2a_parts if a2a_parts is not None else converter.convert(part)
+
+      part_converter_func = convert
+
+    return self._convert_event(
+        event, invocation_context, task_id, context_id, part_converter_func, catalog
+    )
+
+  def _resolve_session_catalog(
+      self, invocation_context: "InvocationContext"
+  ) -> Optional["A2uiCatalog"]:
+    try:
+      return resolve_catalog(
+          invocation_context.session.state.get(self._catalog_key),
+          self._schema_manager,
+      )
+    except CatalogResolutionError:
+      raise
+    except ValueError as e:
+      logger.warning(f"Ignoring session state '{self._catalog_key}': {e}")
+      return None
+
+  def _convert_event(
+      self,
+      event: "Event",
+      invocation_context: "InvocationContext",
+      task_id: Optional[str],
+      context_id: Optional[str],
+      effective_converter: "GenAIPartToA2APartConverter",
+      catalog: Optional["A2uiCatalog"],
+  ) -> list["A2AEvent"]:
     from google.adk.a2a.converters.event_converter import (
         convert_event_to_a2a_events,
     )
 
-    catalog = invocation_context.session.state.get(self._catalog_key)
-    if catalog:
-      # Use the catalog-aware part converter
-      effective_converter = A2uiPartConverter(
-          catalog,
-          bypass_tool_check=self._bypass_tool_check,
-          fallback_text=self._fallback_text,
-      ).convert
-    else:
-      effective_converter = part_converter_func
+    invocation_id = getattr(invocation_context, "invocation_id", None)
+    if catalog and self._tool_arg_streams is not None and invocation_id:
+      effective_converter = self._streaming_converter(
+          effective_converter, catalog, invocation_id
+      )
 
     return convert_event_to_a2a_events(
         event,
@@ -95,3 +379,73 @@ class A2uiEventConverter:
         context_id,
         effective_converter,
     )
+
+  def _streaming_converter(
+      self,
+      convert: Callable[["genai_types.Part"], List["a2a_types.Part"]],
+      catalog: "A2uiCatalog",
+      invocation_id: str,
+  ) -> Callable[["genai_types.Part"], List["a2a_types.Part"]]:
+    """Wraps `convert` to render streamed A2UI tool arguments progressively."""
+
+    def convert_streaming(part: "genai_types.Part") -> List["a2a_types.Part"]:
+      stream = self._tool_arg_streams.get(invocation_id)
+      if function_call := part.function_call:
+        is_chunk = bool(function_call.partial_args or function_call.will_continue)
+        if function_call.name == constants.A2UI_TOOL_NAME and is_chunk:
+          if stream is None:
+            stream = _ToolArgStream(catalog)
+            self._tool_arg_streams.put(invocation_id, stream)
+          return stream.feed(function_call)
+        if stream is not None and stream.in_call:
+          if not function_call.name:
+            # A continuation chunk, or the end marker of the streamed call.
+            return stream.feed(function_call)
+          # The complete call, aggregated after its chunks.
+          return stream.close() + convert(part)
+      if (
+          (function_response := part.function_response)
+          and function_response.name == constants.A2UI_TOOL_NAME
+          and stream is not None
+          and function_response.id in stream.streamed_calls
+      ):
+        streamed = stream.streamed_calls.pop(function_response.id)
+        response = function_response.response or {}
+        if constants.A2UI_TOOL_ERROR_KEY in response:
+          # The streamed UI never passed validation.
+          logger.warning(
+              "A2UI tool call failed after its UI was streamed, deleting the"
+              f" surfaces it started: {response[constants.A2UI_TOOL_ERROR_KEY]}"
+          )
+          return [
+              create_a2ui_part(message)
+              for message in _delete_surface_messages(
+                  streamed.messages, catalog.version
+              )
+          ]
+        if streamed.complete:
+          return []
+        remainder = _unsent_messages(
+            response.get(constants.A2UI_VALIDATED_JSON_KEY) or [], streamed.messages
+        )
+        if not remainder:
+          return []
+        return convert(_with_validated_messages(part, remainder))
+      return convert(part)
+
+    return convert_streaming
+
+  def _get_part_converter(self, catalog: "A2uiCatalog") -> A2uiPartConverter:
+    if self._part_converters is not None:
+      converter = self._part_converters.get(catalog)
+      if converter is not None:
+        return converter
+    converter = A2uiPartConverter(
+        catalog,
+        bypass_tool_check=self._bypass_tool_check,
+        fallback_text=self._fallback_text,
+        validation_executor=self._validation_executor,
+    )
+    if self._part_converters is not None:
+      self._part_converters.put(catalog, converter)
+    return converter
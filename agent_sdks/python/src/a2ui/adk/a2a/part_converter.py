@@ -17,7 +17,8 @@
 This module provides the `A2uiPartConverter` which acts as a catalog-aware GenAI to A2A
 part converter. It handles both tool-based A2UI (via the `send_a2ui_json_to_client` tool response)
 and text-based A2UI (extracted and healed via A2UI custom tags), validating the structures
-against the active A2UI catalog schema.
+against the active A2UI catalog schema. Messages built with `a2ui.schema.builder.Surface`
+for another catalog are validated against the active catalog before they are sent.
 
 Key Components:
   * `A2uiPartConverter`: A catalog-aware GenAI to A2A part converter.
@@ -33,14 +34,20 @@ Usage Example:
 """
 
 import logging
+from concurrent.futures import Executor
 from typing import Optional
 
 
 from a2a import types as a2a_types
-from a2ui.a2a.parts import create_a2ui_part, parse_response_to_parts
+from a2ui.a2a.parts import (
+    create_a2ui_part,
+    parse_response_to_parts,
+    parse_response_to_parts_async,
+)
 from a2ui.parser.parser import has_a2ui_parts
 from a2ui.schema import constants
 from a2ui.schema.catalog import A2uiCatalog
+from a2ui.schema.validator import ValidatedMessages
 from google.adk.a2a.converters import part_converter
 from google.adk.utils.feature_decorator import experimental
 from google.genai import types as genai_types
@@ -62,10 +69,12 @@ class A2uiPartConverter:
       a2ui_catalog: A2uiCatalog,
       bypass_tool_check: bool = False,
       fallback_text: Optional[str] = None,
+      validation_executor: Optional[Executor] = None,
   ):
     self._catalog = a2ui_catalog
     self._bypass_tool_check = bypass_tool_check
     self._fallback_text = fallback_text
+    self._validation_executor = validation_executor
 
   def convert(self, part: genai_types.Part) -> list[a2a_types.Part]:
     """Converts a GenAI part to A2A parts, with A2UI validation.
@@ -76,58 +85,101 @@ class A2uiPartConverter:
     Returns:
         A list of A2A parts.
     """
+    a2a_parts, a2ui_content = self._convert_or_extract(part)
+    if a2ui_content is None:
+      return a2a_parts
+    return parse_response_to_parts(
+        a2ui_content,
+        validator=self._catalog.validator,
+        fallback_text=self._fallback_text,
+    )
+
+  async def convert_async(self, part: genai_types.Part) -> list[a2a_types.Part]:
+    """Converts a GenAI part to A2A parts, validating A2UI off the event loop.
+
+    Validation runs in the `validation_executor` given at construction time, or
+    in the event loop's default thread pool.
+
+    Args:
+        part: The GenAI part to convert.
+
+    Returns:
+        A list of A2A parts.
+    """
+    a2a_parts, a2ui_content = self._convert_or_extract(part)
+    if a2ui_content is None:
+      return a2a_parts
+    return await parse_response_to_parts_async(
+        a2ui_content,
+        validator=self._catalog.validator,
+        fallback_text=self._fallback_text,
+        executor=self._validation_executor,
+    )
+
+  def _convert_or_extract(
+      self, part: genai_types.Part
+  ) -> tuple[list[a2a_types.Part], Optional[str]]:
+    """Converts parts that need no validation, or extracts A2UI text to validate.
+
+    Args:
+        part: The GenAI part to convert.
+
+    Returns:
+        A tuple of (converted A2A parts, None), or ([], content) when the part
+        contains A2UI tags that still have to be parsed and validated.
+    """
     # 1. Handle Tool Responses (FunctionResponse)
     if function_response := part.function_response:
       is_send_a2ui_json_to_client_response = (
           function_response.name == constants.A2UI_TOOL_NAME
       )
 
+      response_dict = function_response.response or {}
+
       if is_send_a2ui_json_to_client_response or self._bypass_tool_check:
-        response_dict = function_response.response or {}
 
         if constants.A2UI_TOOL_ERROR_KEY in response_dict:
           logger.warning(
               f"A2UI tool call failed: {response_dict[constants.A2UI_TOOL_ERROR_KEY]}"
           )
-          return []
+          return [], None
 
         if (
             isinstance(response_dict, dict)
             and constants.A2UI_VALIDATED_JSON_KEY in response_dict
         ):
           json_data = response_dict.get(constants.A2UI_VALIDATED_JSON_KEY)
+          if isinstance(json_data, ValidatedMessages):
+            try:
+              # Only the integrity checks run if built for this catalog.
+              self._catalog.validator.validate(json_data)
+            except ValueError as e:
+              logger.warning(f"Built A2UI messages are invalid for this catalog: {e}")
+              return [], None
           if json_data:
-            return [create_a2ui_part(message) for message in json_data]
+            return [create_a2ui_part(message) for message in json_data], None
 
         if is_send_a2ui_json_to_client_response:
           logger.info("No result in A2UI tool response")
-          return []
+          return [], None
 
       # Handle generic/other tool responses that returned a string containing A2UI tags.
       if function_response.response and function_response.response.get("result"):
         result = function_response.response.get("result")
         if has_a2ui_parts(result):
-          return parse_response_to_parts(
-              result,
-              validator=self._catalog.validator,
-              fallback_text=self._fallback_text,
-          )
+          return [], result
 
     # 2. Handle Tool Calls (FunctionCall) - Skip sending to client
     if (
         function_call := part.function_call
     ) and function_call.name == constants.A2UI_TOOL_NAME:
-      return []
+      return [], None
 
     # 3. Handle Text-based A2UI (TextPart)
     if text := part.text:
       if has_a2ui_parts(text):
-        return parse_response_to_parts(
-            text,
-            validator=self._catalog.validator,
-            fallback_text=self._fallback_text,
-        )
+        return [], text
 
     # 4. Default conversion for other parts
     converted_part = part_converter.convert_genai_part_to_a2a_part(part)
-    return [converted_part] if converted_part else []
+    return ([converted_part] if converted_part else []), None
@@ -0,0 +1,258 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Function-calling parameter schemas derived from A2UI catalogs.
+
+Declaring `a2ui_json` as a string makes the model emit escaped JSON inside a
+JSON string. `a2ui_messages_schema` instead derives a `genai_types.Schema` for
+the list of A2UI messages, so the model produces native structured arguments.
+
+The catalog's JSON Schema is simplified to the subset accepted by Gemini
+function calling: references are inlined, `allOf` is merged, `const` becomes a
+single-value `enum`, and unions (`oneOf`/`anyOf`) are collapsed to one schema
+per type. In particular, the message types and the component types each become
+a single object holding the properties of all variants, with only the
+properties common to every variant required, and the `component` (or `call`)
+discriminator as an enum. Recursive references are cut to an unconstrained
+value. The simplified schema is looser than the catalog, so payloads are still
+validated with `A2uiValidator`.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from a2ui.schema.catalog import A2uiCatalog
+from a2ui.schema.constants import VERSION_0_8
+from a2ui.schema.validator import bundle_0_8_schemas
+from google.genai import types as genai_types
+
+_TYPES = {
+    "string": "STRING",
+    "number": "NUMBER",
+    "integer": "INTEGER",
+    "boolean": "BOOLEAN",
+    "array": "ARRAY",
+    "object": "OBJECT",
+}
+# JSON Schema keywords kept as is, by their `genai_types.Schema` field name.
+_KEPT_KEYWORDS = {
+    "minItems": "min_items",
+    "maxItems": "max_items",
+    "minimum": "minimum",
+    "maximum": "maximum",
+    "minLength": "min_length",
+    "maxLength": "max_length",
+}
+_SERVER_TO_CLIENT = "server_to_client.json"
+_CATALOG = "catalog.json"
+_COMMON_TYPES = "common_types.json"
+
+
+def _const_schema(value: Any) -> Dict[str, Any]:
+  if isinstance(value, str):
+    return {"type": "STRING", "enum": [value]}
+  if isinstance(value, bool):
+    return {"type": "BOOLEAN"}
+  if isinstance(value, int):
+    return {"type": "INTEGER"}
+  if isinstance(value, float):
+    return {"type": "NUMBER"}
+  return {}
+
+
+def _intersect(schemas: List[Dict[str, Any]]) -> Dict[str, Any]:
+  """Merges schemas that all apply (`allOf`); earlier schemas take precedence."""
+  result: Dict[str, Any] = {}
+  for schema in schemas:
+    for key, value in schema.items():
+      if key == "properties":
+        properties = result.setdefault("properties", {})
+        for name, property_schema in value.items():
+          if name in properties:
+            properties[name] = _intersect([properties[name], property_schema])
+          else:
+            properties[name] = property_schema
+      elif key == "required":
+        required = result.setdefault("required", [])
+        required.extend(name for name in value if name not in required)
+      elif key not in result:
+        result[key] = value
+  return result
+
+
+def _union(schemas: List[Dict[str, Any]]) -> Dict[str, Any]:
+  """Collapses alternatives (`oneOf`/`anyOf`) to at most one schema per type."""
+  variants = []
+  for schema in schemas:
+    variants.extend(schema["any_of"] if "any_of" in schema else [schema])
+  if not variants or any("type" not in variant for variant in variants):
+    # An unconstrained alternative accepts anything.
+    return {}
+
+  by_type: Dict[str, List[Dict[str, Any]]] = {}
+  for variant in variants:
+    by_type.setdefault(variant["type"], []).append(variant)
+  if "NUMBER" in by_type and "INTEGER" in by_type:
+    by_type["NUMBER"].extend(by_type.pop("INTEGER"))
+  merged = [_merge_same_type(group) for group in by_type.values()]
+  return merged[0] if len(merged) == 1 else {"any_of": merged}
+
+
+def _merge_same_type(variants: List[Dict[str, Any]]) -> Dict[str, Any]:
+  result = dict(variants[0])
+  if len(variants) == 1:
+    return result
+  if any(
+      variant.get("description") != result.get("description") for variant in variants
+  ):
+    # The description of one variant would mislead for the others.
+    result.pop("description", None)
+  for field in _KEPT_KEYWORDS.values():
+    if any(variant.get(field) != result.get(field) for variant in variants):
+      result.pop(field, None)
+  if result["type"] == "OBJECT":
+    properties: Dict[str, List[Dict[str, Any]]] = {}
+    for variant in variants:
+      for name, property_schema in variant.get("properties", {}).items():
+        properties.setdefault(name, []).append(property_schema)
+    result["properties"] = {
+        name: _union(alternatives) if len(alternatives) > 1 else alternatives[0]
+        for name, alternatives in properties.items()
+    }
+    required = [
+        name
+        for name in variants[0].get("required", [])
+        if all(name in variant.get("required", []) for variant in variants)
+    ]
+    result.pop("required", None)
+    if required:
+      result["required"] = required
+  elif result["type"] == "ARRAY":
+    items = [variant["items"] for variant in variants if "items" in variant]
+    result.pop("items", None)
+    if len(items) == len(variants):
+      result["items"] = _union(items)
+  if "enum" in result:
+    if all("enum" in variant for variant in variants):
+      values = [value for variant in variants for value in variant["enum"]]
+      result["enum"] = list(dict.fromkeys(values))
+    else:
+      del result["enum"]
+  return result
+
+
+class _Simplifier:
+  """Converts JSON Schema documents, inlining references between them."""
+
+  def __init__(self, documents: Dict[str, Dict[str, Any]]):
+    self._documents = documents
+    self._resolving: List[Tuple[str, str]] = []
+
+  def convert(self, node: Any, document: str) -> Dict[str, Any]:
+    if not isinstance(node, dict):
+      return {}
+    # The node's own keywords come first, so that e.g. the description next to
+    # a `$ref` overrides the referenced one.
+    parts = [self._convert_keywords(node, document)]
+    if "$ref" in node:
+      parts.append(self._convert_ref(node["$ref"], document))
+    for sub_schema in node.get("allOf", []):
+      parts.append(self.convert(sub_schema, document))
+    for keyword in ("oneOf", "anyOf"):
+      if keyword in node:
+        variants = [self.convert(variant, document) for variant in node[keyword]]
+        parts.append(_union(variants))
+    return _intersect(parts)
+
+  def _convert_keywords(self, node: Dict[str, Any], document: str) -> Dict[str, Any]:
+    result: Dict[str, Any] = {}
+    if isinstance(node.get("description"), str):
+      result["description"] = node["description"]
+    if "const" in node:
+      result.update(_const_schema(node["const"]))
+    elif "enum" in node and all(isinstance(value, str) for value in node["enum"]):
+      result.update(type="STRING", enum=list(node["enum"]))
+
+    json_type = node.get("type")
+    if isinstance(json_type, list):
+      types = [_TYPES[t] for t in json_type if t in _TYPES]
+      if "null" in json_type:
+        result["nullable"] = True
+      if len(types) == 1:
+        result.setdefault("type", types[0])
+      elif types:
+        result["any_of"] = [{"type": t} for t in types]
+    elif json_type in _TYPES:
+      result.setdefault("type", _TYPES[json_type])
+
+    if isinstance(node.get("properties"), dict):
+      result["properties"] = {
+          name: self.convert(property_schema, document)
+          for name, property_schema in node["properties"].items()
+      }
+    if isinstance(node.get("required"), list):
+      result["required"] = list(node["required"])
+    if isinstance(node.get("items"), dict):
+      result["items"] = self.convert(node["items"], document)
+    for keyword, field in _KEPT_KEYWORDS.items():
+      if keyword in node:
+        result[field] = node[keyword]
+    return result
+
+  def _convert_ref(self, ref: str, document: str) -> Dict[str, Any]:
+    base, _, pointer = ref.partition("#")
+    target = base.rsplit("/", 1)[-1] if base else document
+    key = (target, pointer)
+    if key in self._resolving:
+      return {}
+    node = self._documents.get(target)
+    for token in pointer.split("/")[1:]:
+      if not isinstance(node, dict):
+        break
+      node = node.get(token.replace("~1", "/").replace("~0", "~"))
+    self._resolving.append(key)
+    try:
+      return self.convert(node, target)
+    finally:
+      self._resolving.pop()
+
+
+def _to_schema(schema: Dict[str, Any]) -> genai_types.Schema:
+  return genai_types.Schema.model_validate(schema)
+
+
+def a2ui_messages_schema(
+    catalog: A2uiCatalog, description: Optional[str] = None
+) -> genai_types.Schema:
+  """Returns a function-calling schema for a list of A2UI messages of `catalog`.
+
+  Args:
+      catalog: The (possibly pruned) catalog to derive the schema from.
+      description: Optional description of the list.
+
+  Returns:
+      An `ARRAY` schema whose items are the simplified A2UI message schema.
+  """
+  if catalog.version == VERSION_0_8:
+    message = _Simplifier({}).convert(bundle_0_8_schemas(catalog), "")
+  else:
+    simplifier = _Simplifier({
+        _SERVER_TO_CLIENT: catalog.s2c_schema,
+        _CATALOG: catalog.catalog_schema,
+        _COMMON_TYPES: catalog.common_types_schema,
+    })
+    message = simplifier.convert(catalog.s2c_schema, _SERVER_TO_CLIENT)
+  schema: Dict[str, Any] = {"type": "ARRAY", "items": message}
+  if description:
+    schema["description"] = description
+  return _to_schema(schema)
@@ -57,6 +57,13 @@ Usage Examples:
         a2ui_catalog=get_catalog,
         a2ui_examples=get_examples,
     )
+
+    # Examples ranked against the user's message on each turn
+    toolset = SendA2uiToClientToolset(
+        a2ui_enabled=True,
+        a2ui_catalog=MY_CATALOG,
+        a2ui_examples=relevant_examples_provider("path/to/examples", top_k=3),
+    )
     ```
 
   2. Integration with Agent:
@@ -78,6 +85,7 @@ Usage Examples:
 
 import inspect
 import logging
+from concurrent.futures import Executor
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -90,10 +98,16 @@ from typing import (
 
 from a2ui.adk.a2a.event_converter import A2uiEventConverter
 from a2ui.adk.a2a.part_converter import A2uiPartConverter
+from a2ui.adk.function_schema import a2ui_messages_schema
 from a2ui.parser.payload_fixer import parse_and_fix
 from a2ui.schema import catalog
 from a2ui.schema import constants
+from a2ui.schema.cache import LruCache
 from a2ui.schema.catalog import A2uiCatalog
+from a2ui.schema.catalog_refs import resolve_catalog
+from a2ui.schema.examples import DEFAULT_TOP_K, get_example_retriever
+from a2ui.schema.rendering import CompactRenderOptions
+from a2ui.schema.subsetting import ComponentUsageStats
 from a2ui.schema.constants import (
     A2UI_SCHEMA_BLOCK_END,
     A2UI_SCHEMA_BLOCK_START,
@@ -116,6 +130,14 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_RESOLUTION_CACHE_SIZE = 128
+# With structured arguments, the declared `a2ui_json` schema already describes
+# the messages and types. The instructions then only list the components, which
+# the declared schema merges into one type, with a short description.
+STRUCTURED_ARGS_RENDER_OPTIONS = CompactRenderOptions(
+    max_description_length=120, component_signatures=True, include_schemas=False
+)
+
 A2uiEnabledProvider: TypeAlias = Callable[
     [readonly_context.ReadonlyContext], Union[bool, Awaitable[bool]]
 ]
@@ -128,19 +150,110 @@ A2uiExamplesProvider: TypeAlias = Callable[
 ]
 
 
+def relevant_examples_provider(
+    examples_path: str,
+    top_k: int = DEFAULT_TOP_K,
+    max_tokens: Optional[int] = None,
+) -> A2uiExamplesProvider:
+  """Returns an examples provider selecting the examples relevant to each turn.
+
+  Rather than sending every example on every turn, the provider ranks the
+  examples in `examples_path` against the user's message (see
+  `a2ui.schema.examples`) and returns the `top_k` best ones that fit in
+  `max_tokens` estimated tokens.
+
+  Args:
+      examples_path: The examples directory or glob pattern.
+      top_k: The maximum number of examples to return.
+      max_tokens: Optional budget, in estimated tokens, for the examples.
+  """
+
+  def provide(ctx: readonly_context.ReadonlyContext) -> str:
+    return get_example_retriever(examples_path).render(
+        _user_text(ctx), top_k, max_tokens
+    )
+
+  return provide
+
+
+def _user_text(ctx: readonly_context.ReadonlyContext) -> str:
+  """Returns the text of the user message that started the invocation."""
+  if not ctx.user_content or not ctx.user_content.parts:
+    return ""
+  return " ".join(part.text for part in ctx.user_content.parts if part.text)
+
+
 @experimental
 class SendA2uiToClientToolset(base_toolset.BaseToolset):
-  """A toolset that provides A2UI Tools and can be enabled/disabled."""
+  """A toolset that provides A2UI Tools and can be enabled/disabled.
+
+  Catalogs and examples returned by providers are memoized per invocation, so
+  the providers run once per invocation rather than on every LLM step, tool
+  call and part converter of it. Call `invalidate_cache` if a provider's result
+  changes within an invocation.
+  """
 
   def __init__(
       self,
       a2ui_enabled: Union[bool, A2uiEnabledProvider],
       a2ui_catalog: Union[catalog.A2uiCatalog, A2uiCatalogProvider],
       a2ui_examples: Union[str, A2uiExamplesProvider],
+      validation_executor: Optional[Executor] = None,
+      component_usage_stats: Optional[ComponentUsageStats] = None,
+      resolution_cache_size: int = DEFAULT_RESOLUTION_CACHE_SIZE,
+      structured_args: bool = False,
+      stream_args: bool = False,
   ):
+    """Initializes the toolset.
+
+    Args:
+        a2ui_enabled: Whether A2UI is enabled, or a provider resolving it.
+        a2ui_catalog: The A2UI catalog, or a provider resolving it.
+        a2ui_examples: The A2UI examples, or a provider resolving them.
+        validation_executor: Optional executor used to validate A2UI payloads off
+          the event loop. Defaults to the event loop's default thread pool.
+        component_usage_stats: Optional statistics to record the components of
+          every validated payload in, keyed by the user's message. See
+          `a2ui.schema.subsetting`.
+        resolution_cache_size: The number of resolved catalogs, examples and
+          structured argument schemas to keep. Set to 0 to call the providers
+          on every use.
+        structured_args: Whether to declare `a2ui_json` as a list of A2UI
+          messages derived from the catalog (see `a2ui.adk.function_schema`)
+          rather than a JSON string, so the model emits native structured
+          arguments instead of escaped JSON. The declared schema replaces most
+          of the catalog instructions: for v0.9 only the component signatures
+          are rendered (see `STRUCTURED_ARGS_RENDER_OPTIONS`), and for v0.8,
+          whose declared schema keeps the properties of each component, none.
+        stream_args: Whether to ask the model to stream the `a2ui_json`
+          argument, so that `A2uiEventConverter(stream_tool_args=True)` can
+          render the UI while it is generated. Requires a model that supports
+          streaming function call arguments, SSE streaming and ADK's
+          progressive SSE streaming.
+    """
     super().__init__()
     self._a2ui_enabled = a2ui_enabled
-    self._ui_tools = [self._SendA2uiJsonToClientTool(a2ui_catalog, a2ui_examples)]
+    self._validation_executor = validation_executor
+    self._ui_tools = [
+        self._SendA2uiJsonToClientTool(
+            a2ui_catalog,
+            a2ui_examples,
+            validation_executor=validation_executor,
+            component_usage_stats=component_usage_stats,
+            resolution_cache_size=resolution_cache_size,
+            structured_args=structured_args,
+            stream_args=stream_args,
+        )
+    ]
+
+  def invalidate_cache(self, invocation_id: Optional[str] = None) -> None:
+    """Drops memoized catalogs, examples and argument schemas.
+
+    Args:
+        invocation_id: Only drop the catalog and examples resolved for this
+          invocation. By default, everything is dropped.
+    """
+    self._ui_tools[0].invalidate_cache(invocation_id)
 
   async def _resolve_a2ui_enabled(self, ctx: readonly_context.ReadonlyContext) -> bool:
     """The resolved self.a2ui_enabled field to construct instruction for this agent.
@@ -193,7 +306,7 @@ class SendA2uiToClientToolset(base_toolset.BaseToolset):
         A configured A2uiPartConverter.
     """
     catalog = await self._ui_tools[0]._resolve_a2ui_catalog(ctx)
-    return A2uiPartConverter(catalog)
+    return A2uiPartConverter(catalog, validation_executor=self._validation_executor)
 
   class _SendA2uiJsonToClientTool(base_tool.BaseTool):
     TOOL_NAME = A2UI_TOOL_NAME
@@ -205,18 +318,45 @@ class SendA2uiToClientToolset(base_toolset.BaseToolset):
         self,
         a2ui_catalog: Union[catalog.A2uiCatalog, A2uiCatalogProvider],
         a2ui_examples: Union[str, A2uiExamplesProvider],
+        validation_executor: Optional[Executor] = None,
+        component_usage_stats: Optional[ComponentUsageStats] = None,
+        resolution_cache_size: int = DEFAULT_RESOLUTION_CACHE_SIZE,
+        structured_args: bool = False,
+        stream_args: bool = False,
     ):
       self._a2ui_catalog = a2ui_catalog
       self._a2ui_examples = a2ui_examples
+      self._validation_executor = validation_executor
+      self._component_usage_stats = component_usage_stats
+      self._structured_args = structured_args
+      self._stream_args = stream_args
+      # Provider results, keyed by (invocation ID, kind).
+      self._resolved: Optional[LruCache] = None
+      # Structured argument schemas, keyed by catalog (i.e. name and
+      # fingerprint).
+      self._args_schemas: Optional[LruCache] = None
+      if resolution_cache_size > 0:
+        self._resolved = LruCache(resolution_cache_size)
+        self._args_schemas = LruCache(resolution_cache_size)
+      if structured_args:
+        # The schema is declared on the parameter; none is in the instructions.
+        args_description = (
+            f"{self.A2UI_JSON_ARG_NAME}: The A2UI messages to send to the client,"
+            " as defined by the declared schema of this parameter."
+        )
+      else:
+        args_description = (
+            f"{self.A2UI_JSON_ARG_NAME}: Valid A2UI JSON Schema to send to the"
+            " client. The A2UI JSON Schema definition is between"
+            f" {constants.A2UI_SCHEMA_BLOCK_START} and"
+            f" {constants.A2UI_SCHEMA_BLOCK_END} in the system instructions."
+        )
       super().__init__(
           name=self.TOOL_NAME,
           description=(
               "Sends A2UI JSON to the client to render rich UI for the user. This tool"
               " can be called multiple times in the same call to render multiple UI"
-              f" surfaces.Args:    {self.A2UI_JSON_ARG_NAME}: Valid A2UI JSON Schema to"
-              " send to the client. The A2UI JSON Schema definition is between"
-              f" {constants.A2UI_SCHEMA_BLOCK_START} and"
-              f" {constants.A2UI_SCHEMA_BLOCK_END} in the system instructions."
+              f" surfaces.Args:    {args_description}"
           ),
       )
 
@@ -250,10 +390,7 @@ class SendA2uiToClientToolset(base_toolset.BaseToolset):
       if isinstance(self._a2ui_examples, str):
         return self._a2ui_examples
       else:
-        a2ui_examples = self._a2ui_examples(ctx)
-        if inspect.isawaitable(a2ui_examples):
-          a2ui_examples = await a2ui_examples
-        return a2ui_examples
+        return await self._resolve_memoized(ctx, "examples", self._a2ui_examples)
 
     async def _resolve_a2ui_catalog(
         self, ctx: readonly_context.ReadonlyContext
@@ -264,32 +401,120 @@ class SendA2uiToClientToolset(base_toolset.BaseToolset):
           ctx: The readonly_context.ReadonlyContext to resolve the provider with.
 
       Returns:
-          The A2UI catalog object.
+          The A2UI catalog object. Providers may also return a catalog
+          reference (see `a2ui.schema.catalog_refs`), e.g. read from session
+          state.
       """
       if isinstance(self._a2ui_catalog, catalog.A2uiCatalog):
         return self._a2ui_catalog
       else:
-        a2ui_catalog = self._a2ui_catalog(ctx)
-        if inspect.isawaitable(a2ui_catalog):
-          a2ui_catalog = await a2ui_catalog
-        return a2ui_catalog
+        return await self._resolve_memoized(
+            ctx, "catalog", self._a2ui_catalog, resolve_catalog
+        )
+
+    async def _resolve_memoized(
+        self,
+        ctx: readonly_context.ReadonlyContext,
+        kind: str,
+        provider: Callable[[readonly_context.ReadonlyContext], Any],
+        postprocess: Optional[Callable[[Any], Any]] = None,
+    ) -> Any:
+      """Calls `provider` once per invocation (and again while it returns None)."""
+      invocation_id = getattr(ctx, "invocation_id", None)
+      memoize = self._resolved is not None and isinstance(invocation_id, str)
+      key = (invocation_id, kind)
+      if memoize:
+        resolved = self._resolved.get(key)
+        if resolved is not None:
+          return resolved
+      resolved = provider(ctx)
+      if inspect.isawaitable(resolved):
+        resolved = await resolved
+      if postprocess is not None:
+        resolved = postprocess(resolved)
+      if memoize and resolved is not None:
+        self._resolved.put(key, resolved)
+      return resolved
+
+    def _catalog_instructions(self, a2ui_catalog: catalog.A2uiCatalog) -> str:
+      """Renders the catalog instructions the declared arguments don't hold.
+
+      Rendered once per catalog instance, which memoizes its instructions.
+      """
+      if not self._structured_args:
+        return a2ui_catalog.render_as_llm_instructions()
+      if a2ui_catalog.version == constants.VERSION_0_8:
+        # Components are keyed by type, each with its own properties.
+        return ""
+      return a2ui_catalog.render_as_llm_instructions(STRUCTURED_ARGS_RENDER_OPTIONS)
+
+    def _structured_args_schema(
+        self, a2ui_catalog: catalog.A2uiCatalog
+    ) -> genai_types.Schema:
+      """Derives the `a2ui_json` schema from the catalog, once per catalog content."""
+      if self._args_schemas is not None:
+        schema = self._args_schemas.get(a2ui_catalog)
+        if schema is not None:
+          return schema
+      schema = a2ui_messages_schema(
+          a2ui_catalog, description="A2UI messages to send to the client."
+      )
+      if self._args_schemas is not None:
+        self._args_schemas.put(a2ui_catalog, schema)
+      return schema
+
+    def _declare_structured_args(
+        self, llm_request: LlmRequest, a2ui_catalog: catalog.A2uiCatalog
+    ) -> None:
+      """Replaces the `a2ui_json` string parameter declared for this tool."""
+      schema = self._structured_args_schema(a2ui_catalog)
+      for tool in llm_request.config.tools or []:
+        for declaration in getattr(tool, "function_declarations", None) or []:
+          if declaration.name == self.name and declaration.parameters:
+            declaration.parameters.properties[self.A2UI_JSON_ARG_NAME] = schema
+
+    def _enable_argument_streaming(self, llm_request: LlmRequest) -> None:
+      """Asks the model to stream function call arguments as they are generated."""
+      config = llm_request.config
+      if config.tool_config is None:
+        config.tool_config = genai_types.ToolConfig()
+      if config.tool_config.function_calling_config is None:
+        config.tool_config.function_calling_config = genai_types.FunctionCallingConfig()
+      config.tool_config.function_calling_config.stream_function_call_arguments = True
+
+    def invalidate_cache(self, invocation_id: Optional[str] = None) -> None:
+      """See `SendA2uiToClientToolset.invalidate_cache`."""
+      if self._resolved is None:
+        return
+      if invocation_id is None:
+        self._resolved.clear()
+        self._args_schemas.clear()
+        return
+      for kind in ("catalog", "examples"):
+        self._resolved.pop((invocation_id, kind))
 
     async def process_llm_request(
         self,
         *,
         tool_context: tool_context.ToolContext,
-        llm_request: models.LlmRequest,
+        llm_request: LlmRequest,
     ) -> None:
       await super().process_llm_request(
           tool_context=tool_context, llm_request=llm_request
       )
 
       a2ui_catalog = await self._resolve_a2ui_catalog(tool_context)
+      if self._structured_args:
+        self._declare_structured_args(llm_request, a2ui_catalog)
+      if self._stream_args:
+        self._enable_argument_streaming(llm_request)
 
-      instruction = a2ui_catalog.render_as_llm_instructions()
+      instruction = self._catalog_instructions(a2ui_catalog)
       examples = await self._resolve_a2ui_examples(tool_context)
 
-      llm_request.append_instructions([instruction, examples])
+      llm_request.append_instructions(
+          [part for part in (instruction, examples) if part]
+      )
 
       logger.info("Added A2UI schema and examples to system instructions")
 
@@ -305,12 +530,23 @@ class SendA2uiToClientToolset(base_toolset.BaseToolset):
           )
 
         a2ui_catalog = await self._resolve_a2ui_catalog(tool_context)
-        a2ui_json_payload = parse_and_fix(a2ui_json)
-        a2ui_catalog.validator.validate(a2ui_json_payload)
+        if isinstance(a2ui_json, str):
+          a2ui_json_payload = parse_and_fix(a2ui_json)
+        else:
+          # Structured arguments arrive already parsed.
+          a2ui_json_payload = a2ui_json if isinstance(a2ui_json, list) else [a2ui_json]
+        # Validate off the event loop so large payloads don't stall other sessions.
+        await a2ui_catalog.validator.validate_async(
+            a2ui_json_payload, executor=self._validation_executor
+        )
 
         logger.info(
             f"Validated call to tool {self.TOOL_NAME} with {self.A2UI_JSON_ARG_NAME}"
         )
+        if self._component_usage_stats is not None:
+          self._component_usage_stats.record(
+              _user_text(tool_context), a2ui_json_payload
+          )
 
         # Don't do a second LLM inference call for the JSON response
         tool_context.actions.skip_summarization = True
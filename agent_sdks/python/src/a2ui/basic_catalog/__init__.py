@@ -12,4 +12,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from .provider import BasicCatalog
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+  from .provider import BasicCatalog
+
+
+def __getattr__(name):
+  # Resolved on first access so that importing a sibling module, e.g.
+  # `a2ui.basic_catalog.constants`, doesn't load the whole schema package.
+  if name == "BasicCatalog":
+    from .provider import BasicCatalog
+
+    return BasicCatalog
+  raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
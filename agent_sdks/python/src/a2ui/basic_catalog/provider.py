@@ -14,6 +14,11 @@
 
 from typing import Any, Dict, Optional
 
+from ..schema.artifacts import (
+    BASIC_CATALOG_ARTIFACTS_FILENAME,
+    CatalogArtifacts,
+    load_bundled_artifacts,
+)
 from ..schema.catalog import CatalogConfig, resolve_examples_path
 from ..schema.catalog_provider import A2uiCatalogProvider
 from ..schema.utils import load_from_bundled_resource
@@ -47,6 +52,9 @@ class BundledCatalogProvider(A2uiCatalogProvider):
 
     return resource
 
+  def load_artifacts(self) -> Optional[CatalogArtifacts]:
+    return load_bundled_artifacts(self.version, BASIC_CATALOG_ARTIFACTS_FILENAME)
+
 
 class BasicCatalog:
   """Helper for accessing the basic A2UI catalog."""
@@ -28,6 +28,8 @@ from ..schema.constants import (
     CATALOG_COMPONENTS_KEY,
 )
 from ..schema.validator import (
+    VALIDATION_MODE_COLLECT,
+    VALIDATION_MODE_FAIL_FAST,
     analyze_topology,
     extract_component_ref_fields,
     extract_component_required_fields,
@@ -225,15 +227,20 @@ class A2uiStreamParser:
 
       # Each surface update message must specify a surfaceId and satisfy catalog validation.
       if self._validator:
+        # Partial/sniffed messages are dropped on failure, so stop at the first
+        # violation instead of enumerating and formatting every error.
+        mode = (
+            VALIDATION_MODE_COLLECT if strict_integrity else VALIDATION_MODE_FAIL_FAST
+        )
         try:
           self._validator.validate(
-              m, root_id=self.root_id, strict_integrity=strict_integrity
+              m, root_id=self.root_id, strict_integrity=strict_integrity, mode=mode
           )
         except ValueError as e:
           if strict_integrity:
             raise e
           else:
-            logger.debug(f"Validation failed for partial/sniffed message: {e}")
+            logger.debug("Validation failed for partial/sniffed message: %s", e)
             continue
 
       # Consolidated appending logic
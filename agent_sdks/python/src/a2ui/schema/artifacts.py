@@ -0,0 +1,158 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Precomputed artifacts of the bundled catalogs.
+
+The LLM instructions, the component reference and required field maps and the
+reference graph used for pruning only depend on a catalog's schemas. For the
+bundled catalogs, the build hook computes them once and ships them next to the
+schemas as compact JSON, so processes load them instead of recomputing them on
+every cold start. Artifacts record the SDK version that built them, and
+catalogs ignore artifacts built by another version, without hashing their
+schemas.
+"""
+
+import functools
+import importlib.resources
+import json
+import logging
+from dataclasses import dataclass, field, replace
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, Optional, Tuple
+
+from ..version import __version__
+from .constants import A2UI_ASSET_PACKAGE, ENCODING
+
+if TYPE_CHECKING:
+  from .catalog import A2uiCatalog
+
+# Bumped whenever the layout of the artifacts changes; artifacts written with
+# another format are ignored.
+ARTIFACTS_FORMAT = 2
+BASIC_CATALOG_ARTIFACTS_FILENAME = "basic_catalog_artifacts.json"
+
+
+@dataclass(frozen=True)
+class CatalogArtifacts:
+  """Values derived from a catalog's schemas, computed ahead of time.
+
+  Attributes:
+    catalog_id: The ID of the catalog the artifacts were computed for.
+    fingerprint: The content hash of the catalog the artifacts were computed
+      from, see `A2uiCatalog.fingerprint`.
+    llm_instructions: The default rendering of the catalog as LLM instructions.
+    ref_fields: The component reference fields, as returned by
+      `extract_component_ref_fields`.
+    required_fields: The required component fields, as returned by
+      `extract_component_required_fields`.
+    ref_graph: The serialized reference graph used to prune the catalog.
+    sdk_version: The version of the SDK that computed the artifacts.
+  """
+
+  catalog_id: str
+  fingerprint: str
+  llm_instructions: str = field(repr=False)
+  ref_fields: Dict[str, Tuple[FrozenSet[str], FrozenSet[str]]] = field(repr=False)
+  required_fields: Dict[str, FrozenSet[str]] = field(repr=False)
+  ref_graph: Dict[str, Any] = field(repr=False)
+  sdk_version: str = __version__
+
+  def to_dict(self) -> Dict[str, Any]:
+    """Returns the artifacts as JSON-serializable data."""
+    return {
+        "format": ARTIFACTS_FORMAT,
+        "catalogId": self.catalog_id,
+        "fingerprint": self.fingerprint,
+        "llmInstructions": self.llm_instructions,
+        "refFields": {
+            name: [sorted(single), sorted(many)]
+            for name, (single, many) in self.ref_fields.items()
+        },
+        "requiredFields": {
+            name: sorted(fields) for name, fields in self.required_fields.items()
+        },
+        "refGraph": self.ref_graph,
+        "sdkVersion": self.sdk_version,
+    }
+
+  @classmethod
+  def from_dict(cls, data: Dict[str, Any]) -> "CatalogArtifacts":
+    """Restores artifacts saved with `to_dict`.
+
+    Raises:
+      ValueError: If the artifacts were written in another format.
+    """
+    if data.get("format") != ARTIFACTS_FORMAT:
+      raise ValueError(f"Unsupported catalog artifacts format: {data.get('format')}")
+    return cls(
+        catalog_id=data["catalogId"],
+        fingerprint=data["fingerprint"],
+        llm_instructions=data["llmInstructions"],
+        ref_fields={
+            name: (frozenset(single), frozenset(many))
+            for name, (single, many) in data["refFields"].items()
+        },
+        required_fields={
+            name: frozenset(fields) for name, fields in data["requiredFields"].items()
+        },
+        ref_graph=data["refGraph"],
+        sdk_version=data["sdkVersion"],
+    )
+
+
+def build_catalog_artifacts(catalog: "A2uiCatalog") -> CatalogArtifacts:
+  """Computes the artifacts of `catalog` from its schemas."""
+  from .validator import extract_component_ref_fields, extract_component_required_fields
+
+  # Recompute everything, rather than copying artifacts the catalog was loaded
+  # with.
+  catalog = replace(catalog, artifacts=None)
+  return CatalogArtifacts(
+      catalog_id=catalog.catalog_id,
+      fingerprint=catalog.fingerprint,
+      llm_instructions=catalog.render_as_llm_instructions(),
+      ref_fields={
+          name: (frozenset(single), frozenset(many))
+          for name, (single, many) in extract_component_ref_fields(catalog).items()
+      },
+      required_fields={
+          name: frozenset(fields)
+          for name, fields in extract_component_required_fields(catalog).items()
+      },
+      ref_graph=catalog._ref_graph.to_dict(),
+  )
+
+
+def dump_catalog_artifacts(artifacts: CatalogArtifacts) -> str:
+  """Serializes `artifacts` to compact JSON."""
+  return json.dumps(
+      artifacts.to_dict(), sort_keys=True, separators=(",", ":"), ensure_ascii=False
+  )
+
+
+@functools.lru_cache(maxsize=None)
+def load_bundled_artifacts(version: str, filename: str) -> Optional[CatalogArtifacts]:
+  """Loads artifacts shipped in the package assets.
+
+  Returns:
+    The artifacts, or None if they are missing (e.g. in a source checkout) or
+    unreadable.
+  """
+  try:
+    traversable = importlib.resources.files(A2UI_ASSET_PACKAGE)
+    traversable = traversable.joinpath(version).joinpath(filename)
+    with traversable.open("r", encoding=ENCODING) as f:
+      return CatalogArtifacts.from_dict(json.load(f))
+  except Exception as e:
+    logging.debug("Could not load catalog artifacts '%s': %s", filename, e)
+    return None
@@ -0,0 +1,291 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Builders for server-authored A2UI messages.
+
+A `Surface` assembles the messages that render one surface, validating each
+component against the catalog as it is added. The built messages are returned
+as `ValidatedMessages`, so validators for the same catalog accept them without
+repeating the schema checks.
+
+Usage Example:
+
+  ```python
+  form = (
+      Surface(catalog, "booking")
+      .column("root", children=["title", "submit"])
+      .text("title", text="Book a table")
+      .button("submit", child="submit-label", action={...})
+      .text("submit-label", text="Book")
+  )
+  # Per request, only the data model changes; the components are shared.
+  messages = form.data_model({"guests": 2}).build()
+  ```
+"""
+
+import functools
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .catalog import A2uiCatalog
+from .constants import CATALOG_COMPONENTS_KEY, VERSION_0_8
+from .validator import _BUILDER_TOKEN, A2uiValidator, ValidatedMessages, _freeze
+
+ROOT_ID = "root"
+V0_9_MESSAGE_VERSION = "v0.9"
+
+
+class _SurfaceContext:
+  """State shared by every `Surface` derived from the same constructor call."""
+
+  def __init__(self, catalog: A2uiCatalog, validator: A2uiValidator):
+    self.catalog = catalog
+    self.validator = validator
+    components = (catalog.catalog_schema or {}).get(CATALOG_COMPONENTS_KEY) or {}
+    self.component_types = set(components)
+    # Maps method-style names (e.g. 'choice_picker', 'choicepicker') to types.
+    self.component_methods = {
+        name.lower().replace("_", ""): name for name in components
+    }
+
+
+class Surface:
+  """An immutable builder for the messages that render one A2UI surface.
+
+  Every method returns a new `Surface`; the receiver is left unchanged. Derived
+  surfaces share their components with the surface they were derived from, so a
+  template can be built once and specialized per request without deep copies.
+
+  Components are added with `component(component_type, component_id, ...)` or,
+  equivalently, with a method named after the component type, e.g.
+  `.text("title", text="Hi")` or `.choice_picker(...)`. Each component is
+  validated against the catalog when it is added, and `build` only checks the
+  references between components.
+
+  Values passed to the builder are copied once into read-only dicts and lists,
+  which are shared by every derived surface and built message.
+
+  Args:
+    catalog: The catalog the components must conform to.
+    surface_id: The ID of the surface.
+    catalog_id: The catalog ID announced to the client. Defaults to the ID of
+      `catalog`.
+    root_id: The ID of the root component. v0.9 surfaces always use 'root'.
+    theme: Optional theme (v0.9) or styles (v0.8) for the surface.
+    send_data_model: Whether the client should send the data model back (v0.9).
+    validator: Optional validator to reuse. Defaults to one built for
+      `catalog`.
+  """
+
+  __slots__ = (
+      "_context",
+      "_surface_id",
+      "_catalog_id",
+      "_root_id",
+      "_theme",
+      "_send_data_model",
+      "_components",
+      "_data_updates",
+      "_messages",
+  )
+
+  def __init__(
+      self,
+      catalog: A2uiCatalog,
+      surface_id: str,
+      catalog_id: Optional[str] = None,
+      root_id: str = ROOT_ID,
+      theme: Optional[Dict[str, Any]] = None,
+      send_data_model: bool = False,
+      validator: Optional[A2uiValidator] = None,
+  ):
+    if catalog.version != VERSION_0_8 and root_id != ROOT_ID:
+      raise ValueError(f"v0.9 surfaces must use '{ROOT_ID}' as the root ID")
+    if catalog_id is None:
+      catalog_id = _default_catalog_id(catalog)
+    self._context = _SurfaceContext(catalog, validator or catalog.validator)
+    self._surface_id = surface_id
+    self._catalog_id = catalog_id
+    self._root_id = root_id
+    self._theme = _freeze(theme)
+    self._send_data_model = send_data_model
+    self._components: Tuple[Dict[str, Any], ...] = ()
+    self._data_updates: Tuple[Tuple[Optional[str], Any], ...] = ()
+    self._messages: Optional[List[Dict[str, Any]]] = None
+
+  @property
+  def surface_id(self) -> str:
+    return self._surface_id
+
+  @property
+  def catalog(self) -> A2uiCatalog:
+    return self._context.catalog
+
+  @property
+  def component_ids(self) -> List[str]:
+    """The IDs of the components added so far, in order."""
+    return [component["id"] for component in self._components]
+
+  def component(
+      self, component_type: str, component_id: str, **properties: Any
+  ) -> "Surface":
+    """Returns a surface with the given component added.
+
+    A component with the same ID is replaced in place, keeping its position.
+
+    Args:
+      component_type: The catalog name of the component, e.g. 'Text'.
+      component_id: The ID of the component.
+      **properties: The component properties. `weight` is placed on the
+        component wrapper in v0.8.
+
+    Raises:
+      ValueError: If the component is unknown or does not match the catalog.
+    """
+    if component_type not in self._context.component_types:
+      raise ValueError(
+          f"Unknown component: {component_type} is not in catalog"
+          f" '{self._context.catalog.name}'"
+      )
+    if self._context.catalog.version == VERSION_0_8:
+      weight = properties.pop("weight", None)
+      component = {"id": component_id, "component": {component_type: properties}}
+      if weight is not None:
+        component["weight"] = weight
+    else:
+      component = {"id": component_id, "component": component_type, **properties}
+    self._context.validator.validate_component(component)
+    component = _freeze(component)
+
+    components = list(self._components)
+    for index, existing in enumerate(components):
+      if existing["id"] == component_id:
+        components[index] = component
+        break
+    else:
+      components.append(component)
+    return self._derive(_components=tuple(components))
+
+  def data_model(self, value: Any, path: Optional[str] = None) -> "Surface":
+    """Returns a surface that also sends a data model update.
+
+    Args:
+      value: The value to set. For v0.8 this is the list of `contents` entries
+        of a `dataModelUpdate` message.
+      path: Optional path in the data model. Defaults to the whole model.
+    """
+    return self._derive(_data_updates=self._data_updates + ((path, _freeze(value)),))
+
+  def build(self) -> ValidatedMessages:
+    """Returns the messages for this surface, marked as validated.
+
+    The component references and topology are checked on the first call and
+    memoized. The messages are read-only and shared, not copied, between builds
+    and derived surfaces.
+
+    Raises:
+      ValueError: If the surface metadata is invalid or the component tree is
+        inconsistent (e.g. a missing root or a dangling reference).
+    """
+    if self._messages is None:
+      messages = self._create_messages()
+      validator = self._context.validator
+      # Components were validated as they were added; only check the rest.
+      validator.validate(
+          [message for message in messages if not _has_components(message)]
+      )
+      validator.check_integrity(messages)
+      self._messages = [_freeze(message) for message in messages]
+    return ValidatedMessages(self._messages, self._context.catalog, _BUILDER_TOKEN)
+
+  def __getattr__(self, name: str) -> Callable[..., "Surface"]:
+    if not name.startswith("_"):
+      component_type = self._context.component_methods.get(
+          name.lower().replace("_", "")
+      )
+      if component_type is not None:
+        return functools.partial(self.component, component_type)
+    raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+  def __repr__(self) -> str:
+    return (
+        f"Surface(surface_id={self._surface_id!r}, components={len(self._components)})"
+    )
+
+  def _derive(self, **changes: Any) -> "Surface":
+    surface = object.__new__(Surface)
+    for slot in Surface.__slots__:
+      setattr(surface, slot, changes.get(slot, getattr(self, slot)))
+    surface._messages = None
+    return surface
+
+  def _create_messages(self) -> List[Dict[str, Any]]:
+    if self._context.catalog.version == VERSION_0_8:
+      return self._create_v0_8_messages()
+    return self._create_v0_9_messages()
+
+  def _create_v0_8_messages(self) -> List[Dict[str, Any]]:
+    begin_rendering = {"surfaceId": self._surface_id, "root": self._root_id}
+    if self._catalog_id:
+      begin_rendering["catalogId"] = self._catalog_id
+    if self._theme:
+      begin_rendering["styles"] = self._theme
+    messages = [{"beginRendering": begin_rendering}]
+    if self._components:
+      messages.append({
+          "surfaceUpdate": {
+              "surfaceId": self._surface_id,
+              "components": list(self._components),
+          }
+      })
+    for path, value in self._data_updates:
+      update = {"surfaceId": self._surface_id, "contents": value}
+      if path is not None:
+        update["path"] = path
+      messages.append({"dataModelUpdate": update})
+    return messages
+
+  def _create_v0_9_messages(self) -> List[Dict[str, Any]]:
+    create_surface = {"surfaceId": self._surface_id, "catalogId": self._catalog_id}
+    if self._theme:
+      create_surface["theme"] = self._theme
+    if self._send_data_model:
+      create_surface["sendDataModel"] = True
+    messages = [{"version": V0_9_MESSAGE_VERSION, "createSurface": create_surface}]
+    if self._components:
+      messages.append({
+          "version": V0_9_MESSAGE_VERSION,
+          "updateComponents": {
+              "surfaceId": self._surface_id,
+              "components": list(self._components),
+          },
+      })
+    for path, value in self._data_updates:
+      update = {"surfaceId": self._surface_id, "value": value}
+      if path is not None:
+        update["path"] = path
+      messages.append({"version": V0_9_MESSAGE_VERSION, "updateDataModel": update})
+    return messages
+
+
+def _default_catalog_id(catalog: A2uiCatalog) -> Optional[str]:
+  try:
+    return catalog.catalog_id
+  except ValueError:
+    if catalog.version == VERSION_0_8:
+      return None
+    raise
+
+
+def _has_components(message: Dict[str, Any]) -> bool:
+  return "surfaceUpdate" in message or "updateComponents" in message
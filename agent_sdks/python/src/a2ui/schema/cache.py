@@ -0,0 +1,136 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Bounded, thread-safe caches shared by the A2UI schema utilities."""
+
+import collections
+import threading
+from typing import Any, Callable, Hashable, NamedTuple, Optional
+
+_MISSING = object()
+
+
+class CacheInfo(NamedTuple):
+  """Statistics for an `LruCache`, mirroring `functools.lru_cache`."""
+
+  hits: int
+  misses: int
+  maxsize: int
+  currsize: int
+
+
+class LruCache:
+  """A bounded least-recently-used cache with hit/miss counters.
+
+  All operations are guarded by a lock so a single cache can be shared between
+  threads (e.g. several validators running in a thread pool).
+
+  Args:
+    maxsize: The maximum number of entries to keep. Must be positive.
+  """
+
+  def __init__(self, maxsize: int = 1024):
+    if maxsize <= 0:
+      raise ValueError(f"Cache maxsize must be positive, got {maxsize}")
+    self._maxsize = maxsize
+    self._data: "collections.OrderedDict[Hashable, Any]" = collections.OrderedDict()
+    self._lock = threading.Lock()
+    self._hits = 0
+    self._misses = 0
+
+  @property
+  def maxsize(self) -> int:
+    return self._maxsize
+
+  def get(
+      self,
+      key: Hashable,
+      default: Optional[Any] = None,
+      is_fresh: Optional[Callable[[Any], bool]] = None,
+  ) -> Any:
+    """Returns the cached value for `key`, or `default` on a miss.
+
+    Args:
+      key: The cache key.
+      default: The value returned on a miss.
+      is_fresh: Optional predicate for entries that can go stale (e.g. derived
+        from files). It runs outside the lock; a stale entry is evicted and
+        counted as a miss.
+    """
+    with self._lock:
+      value = self._data.get(key, _MISSING)
+      if value is not _MISSING and is_fresh is None:
+        self._data.move_to_end(key)
+        self._hits += 1
+        return value
+      if value is _MISSING:
+        self._misses += 1
+        return default
+
+    fresh = is_fresh(value)
+    with self._lock:
+      if fresh:
+        self._hits += 1
+        if key in self._data:
+          self._data.move_to_end(key)
+        return value
+      self._misses += 1
+      if self._data.get(key, _MISSING) is value:
+        del self._data[key]
+      return default
+
+  def put(self, key: Hashable, value: Any) -> None:
+    """Stores `value` under `key`, evicting the least recently used entry."""
+    with self._lock:
+      self._data[key] = value
+      self._data.move_to_end(key)
+      while len(self._data) > self._maxsize:
+        self._data.popitem(last=False)
+
+  def pop(self, key: Hashable, default: Optional[Any] = None) -> Any:
+    """Removes the entry for `key` and returns its value, or `default`."""
+    with self._lock:
+      return self._data.pop(key, default)
+
+  def evict(self, predicate: Callable[[Hashable, Any], bool]) -> int:
+    """Removes the entries for which `predicate(key, value)` is true.
+
+    Returns:
+      The number of removed entries.
+    """
+    with self._lock:
+      keys = [key for key, value in self._data.items() if predicate(key, value)]
+      for key in keys:
+        del self._data[key]
+      return len(keys)
+
+  def __contains__(self, key: Hashable) -> bool:
+    with self._lock:
+      return key in self._data
+
+  def __len__(self) -> int:
+    with self._lock:
+      return len(self._data)
+
+  def clear(self) -> None:
+    """Removes all entries and resets the statistics."""
+    with self._lock:
+      self._data.clear()
+      self._hits = 0
+      self._misses = 0
+
+  def cache_info(self) -> CacheInfo:
+    """Returns the current hit/miss statistics."""
+    with self._lock:
+      return CacheInfo(self._hits, self._misses, self._maxsize, len(self._data))
@@ -13,24 +13,46 @@
 # limitations under the License.
 
 import collections
-import copy
-import glob
+import functools
 import json
 import logging
 import os
+import threading
+import weakref
 from dataclasses import dataclass, field, replace
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    TYPE_CHECKING,
+)
 from urllib.parse import urlparse
 
+from ..version import __version__
+from .artifacts import CatalogArtifacts
+from .cache import LruCache
 from .catalog_provider import A2uiCatalogProvider, FileSystemCatalogProvider
+from .examples import ExampleSelection, get_example_retriever, match_example_files
+from .rendering import (
+    CompactRenderOptions,
+    estimate_tokens,
+    join_sections,
+    render_sections,
+    render_within_budget,
+)
 from .constants import (
-    A2UI_SCHEMA_BLOCK_START,
-    A2UI_SCHEMA_BLOCK_END,
     CATALOG_COMPONENTS_KEY,
     CATALOG_ID_KEY,
     VERSION_0_8,
     ENCODING,
 )
+from .utils import canonical_hash
 
 
 @dataclass
@@ -53,14 +75,28 @@ class CatalogConfig:
 
   @classmethod
   def from_path(
-      cls, name: str, catalog_path: str, examples_path: Optional[str] = None
+      cls,
+      name: str,
+      catalog_path: str,
+      examples_path: Optional[str] = None,
+      catalog_cache_dir: Optional[str] = None,
   ) -> "CatalogConfig":
-    """Returns a CatalogConfig that loads from a local path or 'file://' URI."""
+    """Returns a CatalogConfig that loads from a local path, 'file://' or HTTP(S) URL.
+
+    Args:
+      name: The name of the catalog.
+      catalog_path: The path or URL of the catalog definition.
+      examples_path: The path or glob pattern to the examples.
+      catalog_cache_dir: Optional directory caching catalogs loaded over HTTP(S)
+        (see `HttpCatalogProvider`).
+    """
     parsed = urlparse(catalog_path)
     if not parsed.scheme or parsed.scheme == "file":
       catalog_provider = FileSystemCatalogProvider(parsed.path)
     elif parsed.scheme in ["http", "https"]:
-      raise NotImplementedError("HTTP support is coming soon.")
+      from .http_catalog_provider import HttpCatalogProvider
+
+      catalog_provider = HttpCatalogProvider(catalog_path, cache_dir=catalog_cache_dir)
     else:
       raise ValueError(f"Unsupported catalog URL scheme: {catalog_path}")
 
@@ -71,6 +107,25 @@ class CatalogConfig:
     )
 
 
+class CatalogOrigin(NamedTuple):
+  """How a catalog was derived from a catalog loaded by a schema manager.
+
+  Lets catalog references (see `catalog_refs`) rebuild pruned and inline-merged
+  catalogs in processes that did not build them.
+
+  Attributes:
+    catalog_id: The ID of the loaded catalog it was derived from.
+    inline_digest: The digest of the inline catalogs merged on top, if any.
+    allowed_components: The components it was pruned to, if any.
+    allowed_messages: The messages it was pruned to, if any.
+  """
+
+  catalog_id: str
+  inline_digest: Optional[str] = None
+  allowed_components: Tuple[str, ...] = ()
+  allowed_messages: Tuple[str, ...] = ()
+
+
 def resolve_examples_path(path: Optional[str]) -> Optional[str]:
   if path:
     parsed = urlparse(path)
@@ -81,53 +136,355 @@ def resolve_examples_path(path: Optional[str]) -> Optional[str]:
   return None
 
 
+_DEFS_REF_PREFIX = "#/$defs/"
+_PROPERTIES_REF_PREFIX = "#/properties/"
+_COMPONENTS_REF_PREFIX = f"#/{CATALOG_COMPONENTS_KEY}/"
+_COMMON_TYPES_REF = "common_types.json#/$defs/"
+
+# Maximum number of pruned variants memoized per catalog.
+_PRUNED_VARIANTS_CACHE_SIZE = 32
+_RENDERINGS_CACHE_SIZE = 16
+
+
 def _collect_refs(obj: Any) -> set[str]:
-  """Recursively collects all $ref values from a JSON object."""
+  """Collects all $ref values from a JSON object."""
   refs = set()
-  if isinstance(obj, dict):
-    for k, v in obj.items():
-      if k == "$ref" and isinstance(v, str):
-        refs.add(v)
-      else:
-        refs.update(_collect_refs(v))
-  elif isinstance(obj, list):
-    for item in obj:
-      refs.update(_collect_refs(item))
+  stack = [obj]
+  while stack:
+    node = stack.pop()
+    if isinstance(node, dict):
+      for k, v in node.items():
+        if k == "$ref" and isinstance(v, str):
+          refs.add(v)
+        else:
+          stack.append(v)
+    elif isinstance(node, list):
+      stack.extend(node)
   return refs
 
 
-def _prune_defs_by_reachability(
-    defs: Dict[str, Any],
-    root_def_names: List[str],
-    internal_ref_prefix: str = "#/$defs/",
-) -> Dict[str, Any]:
-  """Prunes definitions not reachable from the provided roots.
+def _local_targets(refs: set[str], prefix: str) -> FrozenSet[str]:
+  """Returns the names of the definitions referenced with `prefix`."""
+  return frozenset(ref.split(prefix)[-1] for ref in refs if ref.startswith(prefix))
+
+
+def _common_type_targets(refs: set[str]) -> FrozenSet[str]:
+  """Returns the names of the common types referenced from another schema."""
+  return frozenset(
+      ref.split(_DEFS_REF_PREFIX)[-1] for ref in refs if _COMMON_TYPES_REF in ref
+  )
+
+
+def _closure(edges: Dict[str, FrozenSet[str]], roots: Iterable[str]) -> Set[str]:
+  """Returns the definitions in `edges` reachable from `roots`."""
+  visited = set()
+  queue = collections.deque(roots)
+  while queue:
+    name = queue.popleft()
+    if name in edges and name not in visited:
+      visited.add(name)
+      queue.extend(edges[name])
+  return visited
+
+
+def _ref_name(item: Any, prefix: str) -> Optional[str]:
+  """Returns the definition name of a `{"$ref": ...}` item, if it has `prefix`."""
+  if isinstance(item, dict) and "$ref" in item and item["$ref"].startswith(prefix):
+    return item["$ref"].split("/")[-1]
+  return None
 
-  Args:
-    defs: The dictionary of definitions to prune.
-    root_def_names: The names of the definitions to start the traversal from.
-    internal_ref_prefix: The prefix used for internal references.
 
-  Returns:
-    A new dictionary containing only reachable definitions.
+def _get_any_component_one_of(catalog_schema: Dict[str, Any]) -> Optional[List[Any]]:
+  any_comp = catalog_schema.get("$defs", {}).get("anyComponent")
+  if isinstance(any_comp, dict) and isinstance(any_comp.get("oneOf"), list):
+    return any_comp["oneOf"]
+  return None
+
+
+class _RefGraph:
+  """The $ref dependencies of a catalog's components, messages and definitions.
+
+  Built once per catalog, so pruning is a graph closure plus shallow dict
+  construction that shares the untouched subtrees with the original schemas.
+  For catalog components and s2c messages only their references into the
+  common types (and, for messages, to other messages) are kept, since that is
+  all pruning needs.
   """
-  visited_defs = set()
-  refs_queue = collections.deque(root_def_names)
 
-  while refs_queue:
-    def_name = refs_queue.popleft()
-    if def_name in defs and def_name not in visited_defs:
-      visited_defs.add(def_name)
+  def __init__(self, catalog: "A2uiCatalog"):
+    self.version = catalog.version
+
+    # Catalog schema: components, anyComponent.oneOf items, and everything else.
+    catalog_schema = catalog.catalog_schema or {}
+    catalog_rest = dict(catalog_schema)
+    components = catalog_schema.get(CATALOG_COMPONENTS_KEY)
+    self.components: Optional[Dict[str, FrozenSet[str]]] = None
+    if isinstance(components, dict):
+      catalog_rest.pop(CATALOG_COMPONENTS_KEY)
+      self.components = {
+          name: _common_type_targets(_collect_refs(component))
+          for name, component in components.items()
+      }
+    one_of = _get_any_component_one_of(catalog_schema)
+    self.any_component_items: Optional[List[FrozenSet[str]]] = None
+    if one_of is not None:
+      any_comp = catalog_schema["$defs"]["anyComponent"]
+      catalog_rest["$defs"] = {
+          **catalog_schema["$defs"],
+          "anyComponent": {k: v for k, v in any_comp.items() if k != "oneOf"},
+      }
+      self.any_component_items = [
+          _common_type_targets(_collect_refs(item)) for item in one_of
+      ]
+    self.catalog_rest = _common_type_targets(_collect_refs(catalog_rest))
+
+    # Server-to-client schema: messages, top-level oneOf items (v0.9+), and
+    # everything else.
+    s2c_schema = catalog.s2c_schema or {}
+    s2c_rest = dict(s2c_schema)
+    if self.version == VERSION_0_8:
+      self.messages_key, self.messages_prefix = "properties", _PROPERTIES_REF_PREFIX
+    else:
+      self.messages_key, self.messages_prefix = "$defs", _DEFS_REF_PREFIX
+    messages = s2c_schema.get(self.messages_key)
+    self.message_edges: Optional[Dict[str, FrozenSet[str]]] = None
+    self.message_common_types: Dict[str, FrozenSet[str]] = {}
+    if isinstance(messages, dict):
+      s2c_rest.pop(self.messages_key)
+      self.message_edges = {}
+      for name, message in messages.items():
+        refs = _collect_refs(message)
+        self.message_edges[name] = _local_targets(refs, self.messages_prefix)
+        self.message_common_types[name] = _common_type_targets(refs)
+    self.message_one_of_items: Optional[List[FrozenSet[str]]] = None
+    if self.version != VERSION_0_8 and isinstance(s2c_schema.get("oneOf"), list):
+      s2c_rest.pop("oneOf")
+      self.message_one_of_items = [
+          _common_type_targets(_collect_refs(item)) for item in s2c_schema["oneOf"]
+      ]
+    self.s2c_rest = _common_type_targets(_collect_refs(s2c_rest))
+
+    # Common types: references between the common type definitions.
+    common_types_schema = catalog.common_types_schema
+    self.common_type_edges: Optional[Dict[str, FrozenSet[str]]] = None
+    if common_types_schema and "$defs" in common_types_schema:
+      self.common_type_edges = {
+          name: _local_targets(_collect_refs(definition), _DEFS_REF_PREFIX)
+          for name, definition in common_types_schema["$defs"].items()
+      }
+
+  def to_dict(self) -> Dict[str, Any]:
+    """Returns the graph as JSON-serializable data, see `from_dict`."""
+
+    def names(targets):
+      return sorted(targets) if targets is not None else None
+
+    def edges(mapping):
+      if mapping is None:
+        return None
+      return {name: sorted(targets) for name, targets in mapping.items()}
+
+    return {
+        "version": self.version,
+        "components": edges(self.components),
+        "anyComponentItems": (
+            [sorted(t) for t in self.any_component_items]
+            if self.any_component_items is not None
+            else None
+        ),
+        "catalogRest": names(self.catalog_rest),
+        "messageEdges": edges(self.message_edges),
+        "messageCommonTypes": edges(self.message_common_types),
+        "messageOneOfItems": (
+            [sorted(t) for t in self.message_one_of_items]
+            if self.message_one_of_items is not None
+            else None
+        ),
+        "s2cRest": names(self.s2c_rest),
+        "commonTypeEdges": edges(self.common_type_edges),
+    }
+
+  @classmethod
+  def from_dict(cls, data: Dict[str, Any]) -> "_RefGraph":
+    """Restores a graph saved with `to_dict`, without walking the schemas."""
+
+    def edges(mapping):
+      if mapping is None:
+        return None
+      return {name: frozenset(targets) for name, targets in mapping.items()}
+
+    def items(lists):
+      return [frozenset(t) for t in lists] if lists is not None else None
+
+    graph = cls.__new__(cls)
+    graph.version = data["version"]
+    if graph.version == VERSION_0_8:
+      graph.messages_key, graph.messages_prefix = "properties", _PROPERTIES_REF_PREFIX
+    else:
+      graph.messages_key, graph.messages_prefix = "$defs", _DEFS_REF_PREFIX
+    graph.components = edges(data["components"])
+    graph.any_component_items = items(data["anyComponentItems"])
+    graph.catalog_rest = frozenset(data["catalogRest"])
+    graph.message_edges = edges(data["messageEdges"])
+    graph.message_common_types = edges(data["messageCommonTypes"])
+    graph.message_one_of_items = items(data["messageOneOfItems"])
+    graph.s2c_rest = frozenset(data["s2cRest"])
+    graph.common_type_edges = edges(data["commonTypeEdges"])
+    return graph
+
+  def prune(
+      self,
+      catalog: "A2uiCatalog",
+      allowed_components: FrozenSet[str],
+      allowed_messages: FrozenSet[str],
+  ) -> "A2uiCatalog":
+    """Returns a copy of `catalog` pruned to the allowed components and messages.
+
+    Unused common types are always pruned. The returned schemas share all
+    retained subtrees with `catalog`.
+    """
+    common_type_roots = set(self.catalog_rest) | self.s2c_rest
+    catalog_schema = self._prune_catalog_schema(
+        catalog.catalog_schema, allowed_components, common_type_roots
+    )
+    s2c_schema = self._prune_s2c_schema(
+        catalog.s2c_schema, allowed_messages, common_type_roots
+    )
 
-      internal_refs = _collect_refs(defs[def_name])
-      for ref in internal_refs:
-        if ref.startswith(internal_ref_prefix):
-          refs_queue.append(ref.split(internal_ref_prefix)[-1])
+    used = None
+    if self.common_type_edges is not None:
+      used = _closure(self.common_type_edges, common_type_roots)
+    if (
+        not allowed_components
+        and not allowed_messages
+        and (used is None or len(used) == len(self.common_type_edges))
+    ):
+      # Nothing to prune: keep the catalog, with its build-time artifacts.
+      return catalog
+
+    common_types_schema = catalog.common_types_schema
+    if used is not None:
+      common_types_schema = {
+          **common_types_schema,
+          "$defs": {k: v for k, v in common_types_schema["$defs"].items() if k in used},
+      }
+
+    origin = catalog.origin
+    if origin is None and CATALOG_ID_KEY in catalog.catalog_schema:
+      origin = CatalogOrigin(catalog.catalog_id)
+    if origin is not None:
+      origin = origin._replace(
+          allowed_components=tuple(sorted(allowed_components))
+          or origin.allowed_components,
+          allowed_messages=tuple(sorted(allowed_messages)) or origin.allowed_messages,
+      )
+    return replace(
+        catalog,
+        catalog_schema=catalog_schema,
+        s2c_schema=s2c_schema,
+        common_types_schema=common_types_schema,
+        artifacts=None,
+        origin=origin,
+    )
+
+  def _prune_catalog_schema(
+      self,
+      catalog_schema: Dict[str, Any],
+      allowed_components: FrozenSet[str],
+      common_type_roots: Set[str],
+  ) -> Dict[str, Any]:
+    if self.components is not None:
+      names = (
+          [name for name in self.components if name in allowed_components]
+          if allowed_components
+          else self.components
+      )
+      for name in names:
+        common_type_roots.update(self.components[name])
+
+    one_of = _get_any_component_one_of(catalog_schema)
+    if one_of is not None:
+      for item, targets in zip(one_of, self.any_component_items):
+        if not allowed_components or (
+            _ref_name(item, _COMPONENTS_REF_PREFIX) in allowed_components
+        ):
+          common_type_roots.update(targets)
+
+    if not allowed_components:
+      return catalog_schema
+
+    catalog_schema = dict(catalog_schema)
+    if self.components is not None:
+      catalog_schema[CATALOG_COMPONENTS_KEY] = {
+          k: v
+          for k, v in catalog_schema[CATALOG_COMPONENTS_KEY].items()
+          if k in allowed_components
+      }
+    if one_of is not None:
+      filtered_one_of = []
+      for item in one_of:
+        if "$ref" not in item:
+          logging.warning(f"Skipping non-ref item in anyComponent oneOf: {item}")
+        elif _ref_name(item, _COMPONENTS_REF_PREFIX) is None:
+          logging.warning(f"Skipping unknown ref format: {item['$ref']}")
+        elif _ref_name(item, _COMPONENTS_REF_PREFIX) in allowed_components:
+          filtered_one_of.append(item)
+      any_comp = catalog_schema["$defs"]["anyComponent"]
+      catalog_schema["$defs"] = {
+          **catalog_schema["$defs"],
+          "anyComponent": {**any_comp, "oneOf": filtered_one_of},
+      }
+    return catalog_schema
+
+  def _prune_s2c_schema(
+      self,
+      s2c_schema: Dict[str, Any],
+      allowed_messages: FrozenSet[str],
+      common_type_roots: Set[str],
+  ) -> Dict[str, Any]:
+    if self.message_edges is not None:
+      used = (
+          _closure(self.message_edges, allowed_messages)
+          if allowed_messages
+          else self.message_edges
+      )
+      for name in used:
+        common_type_roots.update(self.message_common_types[name])
+    if self.message_one_of_items is not None:
+      for item, targets in zip(s2c_schema["oneOf"], self.message_one_of_items):
+        if not allowed_messages or (
+            _ref_name(item, _DEFS_REF_PREFIX) in allowed_messages
+        ):
+          common_type_roots.update(targets)
+
+    if not allowed_messages:
+      return s2c_schema
 
-  return {k: v for k, v in defs.items() if k in visited_defs}
+    s2c_schema = dict(s2c_schema)
+    if self.message_edges is not None:
+      s2c_schema[self.messages_key] = {
+          k: v for k, v in s2c_schema[self.messages_key].items() if k in used
+      }
+    if self.message_one_of_items is not None:
+      s2c_schema["oneOf"] = [
+          item
+          for item in s2c_schema["oneOf"]
+          if _ref_name(item, _DEFS_REF_PREFIX) in allowed_messages
+      ]
+    return s2c_schema
+
+
+# Derived values memoized on A2uiCatalog instances, which are immutable.
+_CACHED_ATTRIBUTES = (
+    "validator",
+    "_llm_instructions",
+    "_renderings",
+    "_ref_graph",
+    "_pruned_variants",
+)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class A2uiCatalog:
   """Represents a processed component catalog with its schema.
 
@@ -137,6 +494,20 @@ class A2uiCatalog:
     s2c_schema: The server-to-client schema.
     common_types_schema: The common types schema.
     catalog_schema: The catalog schema.
+    artifacts: Optional values precomputed from the schemas at build time (see
+      `artifacts.CatalogArtifacts`), used instead of computing them again.
+      Artifacts built by another SDK version are ignored; otherwise they must
+      have been built from these schemas.
+    origin: How the catalog was derived from a loaded catalog, if it was pruned
+      or merged with inline catalogs.
+
+  Catalogs are immutable; the compiled validator and the rendered LLM
+  instructions are built once per instance and reused. The schemas must not be
+  mutated after construction.
+
+  Catalogs are hashable. Equality and hashing are based on the name and the
+  content `fingerprint`, so catalogs can key caches, and `intern_catalog`
+  returns a single shared instance per content.
   """
 
   version: str
@@ -144,6 +515,8 @@ class A2uiCatalog:
   s2c_schema: Dict[str, Any]
   common_types_schema: Dict[str, Any]
   catalog_schema: Dict[str, Any]
+  artifacts: Optional[CatalogArtifacts] = field(default=None, compare=False, repr=False)
+  origin: Optional[CatalogOrigin] = field(default=None, compare=False, repr=False)
 
   @property
   def catalog_id(self) -> str:
@@ -151,100 +524,58 @@ class A2uiCatalog:
       raise ValueError(f"Catalog '{self.name}' missing catalogId")
     return self.catalog_schema[CATALOG_ID_KEY]
 
-  @property
+  def __post_init__(self):
+    # Artifacts shipped by another SDK version may describe other schemas.
+    # Checking the version rather than the fingerprint keeps hashing the schemas
+    # lazy.
+    if self.artifacts is not None and self.artifacts.sdk_version != __version__:
+      logging.warning(f"Ignoring stale precomputed artifacts of catalog '{self.name}'")
+      object.__setattr__(self, "artifacts", None)
+
+  @functools.cached_property
+  def fingerprint(self) -> str:
+    """A stable content hash of the version and schemas of this catalog."""
+    return canonical_hash([
+        self.version,
+        self.s2c_schema,
+        self.common_types_schema,
+        self.catalog_schema,
+    ])
+
+  def __eq__(self, other: Any) -> bool:
+    if self is other:
+      return True
+    if not isinstance(other, A2uiCatalog):
+      return NotImplemented
+    return self.name == other.name and self.fingerprint == other.fingerprint
+
+  def __hash__(self) -> int:
+    return hash((self.name, self.fingerprint))
+
+  @functools.cached_property
   def validator(self) -> "A2uiValidator":
+    """The compiled validator for this catalog, built on first access."""
     from .validator import A2uiValidator
 
     return A2uiValidator(self)
 
-  def _with_pruned_components(self, allowed_components: List[str]) -> "A2uiCatalog":
-    """Returns a new catalog with only allowed components.
-
-    Args:
-      allowed_components: List of component names to include.
-
-    Returns:
-      A copy of the catalog with only allowed components.
-    """
-
-    if not allowed_components:
-      return self
-
-    schema_copy = copy.deepcopy(self.catalog_schema)
+  def __getstate__(self) -> Dict[str, Any]:
+    # Compiled artifacts are rebuilt lazily rather than pickled (e.g. when
+    # catalogs are shipped to validation worker processes).
+    state = dict(self.__dict__)
+    for name in _CACHED_ATTRIBUTES:
+      state.pop(name, None)
+    return state
 
-    if CATALOG_COMPONENTS_KEY in schema_copy and isinstance(
-        schema_copy[CATALOG_COMPONENTS_KEY], dict
-    ):
-      all_comps = schema_copy[CATALOG_COMPONENTS_KEY]
-      schema_copy[CATALOG_COMPONENTS_KEY] = {
-          k: v for k, v in all_comps.items() if k in allowed_components
-      }
+  @functools.cached_property
+  def _ref_graph(self) -> _RefGraph:
+    if self.artifacts is not None:
+      return _RefGraph.from_dict(self.artifacts.ref_graph)
+    return _RefGraph(self)
 
-    # Filter anyComponent oneOf if it exists
-    # Path: $defs -> anyComponent -> oneOf
-    if "$defs" in schema_copy and "anyComponent" in schema_copy["$defs"]:
-      any_comp = schema_copy["$defs"]["anyComponent"]
-      if "oneOf" in any_comp and isinstance(any_comp["oneOf"], list):
-        filtered_one_of = []
-        for item in any_comp["oneOf"]:
-          if "$ref" in item:
-            ref = item["$ref"]
-            if ref.startswith(f"#/{CATALOG_COMPONENTS_KEY}/"):
-              comp_name = ref.split("/")[-1]
-              if comp_name in allowed_components:
-                filtered_one_of.append(item)
-            else:
-              logging.warning(f"Skipping unknown ref format: {ref}")
-          else:
-            logging.warning(f"Skipping non-ref item in anyComponent oneOf: {item}")
-
-        any_comp["oneOf"] = filtered_one_of
-
-    return replace(self, catalog_schema=schema_copy)
-
-  def _with_pruned_messages(self, allowed_messages: List[str]) -> "A2uiCatalog":
-    """Returns a new catalog with only allowed messages.
-
-    Args:
-      allowed_messages: List of message names to include in s2c_schema.
-
-    Returns:
-      A copy of the catalog with only allowed messages.
-    """
-    if not allowed_messages:
-      return self
-
-    s2c_schema_copy = copy.deepcopy(self.s2c_schema)
-
-    if self.version == VERSION_0_8:
-      # 0.8 style: Messages are in root properties.
-      if "properties" in s2c_schema_copy and isinstance(
-          s2c_schema_copy["properties"], dict
-      ):
-        s2c_schema_copy["properties"] = _prune_defs_by_reachability(
-            defs=s2c_schema_copy["properties"],
-            root_def_names=allowed_messages,
-            internal_ref_prefix="#/properties/",
-        )
-    else:
-      # 0.9+ style: Messages are in $defs and referenced via oneOf.
-      if "oneOf" in s2c_schema_copy and isinstance(s2c_schema_copy["oneOf"], list):
-        s2c_schema_copy["oneOf"] = [
-            item
-            for item in s2c_schema_copy["oneOf"]
-            if "$ref" in item
-            and item["$ref"].startswith("#/$defs/")
-            and item["$ref"].split("/")[-1] in allowed_messages
-        ]
-
-      if "$defs" in s2c_schema_copy and isinstance(s2c_schema_copy["$defs"], dict):
-        s2c_schema_copy["$defs"] = _prune_defs_by_reachability(
-            defs=s2c_schema_copy["$defs"],
-            root_def_names=allowed_messages,
-            internal_ref_prefix="#/$defs/",
-        )
-
-    return replace(self, s2c_schema=s2c_schema_copy)
+  @functools.cached_property
+  def _pruned_variants(self) -> LruCache:
+    return LruCache(_PRUNED_VARIANTS_CACHE_SIZE)
 
   def with_pruning(
       self,
@@ -253,6 +584,10 @@ class A2uiCatalog:
   ) -> "A2uiCatalog":
     """Returns a new catalog with pruned components and messages.
 
+    Unused common types are always pruned. The pruned catalog shares the
+    retained parts of the schemas with this catalog, and is memoized per set of
+    allowed components and messages.
+
     Args:
       allowed_components: List of component names to include.
       allowed_messages: List of message names to include in s2c_schema.
@@ -260,75 +595,96 @@ class A2uiCatalog:
     Returns:
       A copy of the catalog with pruned components and messages.
     """
-    catalog = self
-    if allowed_components:
-      catalog = catalog._with_pruned_components(allowed_components)
-
-    if allowed_messages:
-      catalog = catalog._with_pruned_messages(allowed_messages)
-
-    return catalog._with_pruned_common_types()
+    key = (frozenset(allowed_components or ()), frozenset(allowed_messages or ()))
+    pruned = self._pruned_variants.get(key)
+    if pruned is None:
+      pruned = self._ref_graph.prune(self, *key)
+      if pruned is not self:
+        # Different allowed sets may prune to the same content; share their
+        # compiled validator and renderings.
+        pruned = intern_catalog(pruned)
+      self._pruned_variants.put(key, pruned)
+    return pruned
+
+  def render_as_llm_instructions(
+      self, options: Optional[CompactRenderOptions] = None, canonical: bool = False
+  ) -> str:
+    """Renders the catalog and schema as LLM instructions.
 
-  def _with_pruned_common_types(self) -> "A2uiCatalog":
-    """Returns a new catalog with unused common types pruned from the schema."""
-    if not self.common_types_schema or "$defs" not in self.common_types_schema:
-      return self
-
-    # Initialize roots with ONLY refs targeting common_types.json from external schemas
-    external_refs = _collect_refs(self.catalog_schema)
-    external_refs.update(_collect_refs(self.s2c_schema))
-
-    root_common_types = []
-    for ref in external_refs:
-      if "common_types.json#/$defs/" in ref:
-        root_common_types.append(ref.split("#/$defs/")[-1])
-
-    new_common_types_schema = copy.deepcopy(self.common_types_schema)
-    new_common_types_schema["$defs"] = _prune_defs_by_reachability(
-        defs=new_common_types_schema["$defs"],
-        root_def_names=root_common_types,
-    )
-
-    return replace(self, common_types_schema=new_common_types_schema)
-
-  def render_as_llm_instructions(self) -> str:
-    """Renders the catalog and schema as LLM instructions."""
-    all_schemas = []
-    all_schemas.append(A2UI_SCHEMA_BLOCK_START)
-
-    server_client_str = (
-        json.dumps(self.s2c_schema, separators=(",", ":")) if self.s2c_schema else "{}"
-    )
-    all_schemas.append(f"### Server To Client Schema:\n{server_client_str}")
-
-    if (
-        self.common_types_schema
-        and "$defs" in self.common_types_schema
-        and self.common_types_schema["$defs"]
-    ):
-      common_str = json.dumps(self.common_types_schema, separators=(",", ":"))
-      all_schemas.append(f"### Common Types Schema:\n{common_str}")
+    Args:
+      options: Optional options for a compact rendering. By default, the schemas
+        are embedded verbatim.
+      canonical: Whether to sort schema keys, so equal catalogs render
+        identically however they were assembled (e.g. for prompt caching).
+    """
+    if options is None and not canonical:
+      return self._llm_instructions
+    key = (options, canonical)
+    rendered = self._renderings.get(key)
+    if rendered is None:
+      if options is None:
+        rendered = join_sections(render_sections(self, canonical=True))
+      else:
+        rendered = render_within_budget(self, options, canonical)
+      self._renderings.put(key, rendered)
+    return rendered
 
-    catalog_str = json.dumps(self.catalog_schema, separators=(",", ":"))
-    all_schemas.append(f"### Catalog Schema:\n{catalog_str}")
+  def estimate_llm_instruction_tokens(
+      self, options: Optional[CompactRenderOptions] = None
+  ) -> Dict[str, int]:
+    """Estimates the tokens of each section of the LLM instructions.
 
-    all_schemas.append(A2UI_SCHEMA_BLOCK_END)
+    The estimate is a local heuristic (see `rendering.estimate_tokens`) meant for
+    comparing renderings and budgeting prompts, not an exact tokenizer count.
+    `max_tokens` is not applied; the sections of the full catalog are estimated.
 
-    return "\n\n".join(all_schemas)
+    Returns:
+      A mapping from section title to estimated tokens, plus a 'total' entry for
+      the whole schema block.
+    """
+    sections = render_sections(self, options)
+    estimates = {title: estimate_tokens(body) for title, body in sections}
+    estimates["total"] = estimate_tokens(join_sections(sections))
+    return estimates
+
+  @functools.cached_property
+  def _llm_instructions(self) -> str:
+    if self.artifacts is not None:
+      return self.artifacts.llm_instructions
+    return join_sections(render_sections(self))
+
+  @functools.cached_property
+  def _renderings(self) -> LruCache:
+    return LruCache(_RENDERINGS_CACHE_SIZE)
+
+  def load_examples(
+      self,
+      path: Optional[str],
+      validate: bool = False,
+      selection: Optional[ExampleSelection] = None,
+  ) -> str:
+    """Loads and validates examples from a directory or a glob pattern.
 
-  def load_examples(self, path: Optional[str], validate: bool = False) -> str:
-    """Loads and validates examples from a directory or a glob pattern."""
+    Args:
+      path: The examples directory or glob pattern.
+      validate: Whether to validate the examples against this catalog.
+      selection: Optional selection of the examples most relevant to a query.
+        By default, all examples are loaded.
+    """
     if not path:
       return ""
 
-    # If it's a directory, support backward compatibility by appending /*.json
-    if os.path.isdir(path):
-      pattern = os.path.join(path, "*.json")
-    else:
-      pattern = path
+    if selection is not None:
+      selected = get_example_retriever(path).select(
+          selection.query, selection.top_k, selection.max_tokens
+      )
+      if validate:
+        for example in selected:
+          self._validate_example(example.path, example.content)
+      return "\n\n".join(example.render() for example in selected)
 
-    # Use glob to find files
-    matched_files = glob.glob(pattern, recursive=True)
+    # A directory matches its *.json files, for backward compatibility.
+    matched_files = match_example_files(path)
 
     if not matched_files:
       if not os.path.isdir(path) and not any(c in path for c in "*?[]"):
@@ -337,13 +693,8 @@ class A2uiCatalog:
         )
       return ""
 
-    # Sort for determinism
-    matched_files.sort()
-
     merged_examples = []
     for full_path in matched_files:
-      if not os.path.isfile(full_path):
-        continue
       basename = os.path.splitext(os.path.basename(full_path))[0]
       with open(full_path, "r", encoding=ENCODING) as f:
         content = f.read()
@@ -353,8 +704,6 @@ class A2uiCatalog:
 
       merged_examples.append(f"---BEGIN {basename}---\n{content}\n---END {basename}---")
 
-    if not merged_examples:
-      return ""
     return "\n\n".join(merged_examples)
 
   def _validate_example(self, full_path: str, content: str) -> None:
@@ -363,3 +712,32 @@ class A2uiCatalog:
       self.validator.validate(json_data)
     except Exception as e:
       raise ValueError(f"Failed to validate example {full_path}: {e}") from e
+
+
+# Live catalogs by name and fingerprint. Entries go away with the last
+# reference to their catalog.
+_interned_catalogs: "weakref.WeakValueDictionary[tuple, A2uiCatalog]" = (
+    weakref.WeakValueDictionary()
+)
+_interned_catalogs_lock = threading.Lock()
+
+
+def intern_catalog(catalog: A2uiCatalog) -> A2uiCatalog:
+  """Returns the live catalog equal to `catalog`, or registers `catalog`.
+
+  Equal catalogs then share one instance, along with its compiled validator,
+  renderings and pruned variants.
+  """
+  key = (catalog.name, catalog.fingerprint)
+  with _interned_catalogs_lock:
+    interned = _interned_catalogs.get(key)
+    if interned is not None:
+      return interned
+    _interned_catalogs[key] = catalog
+    return catalog
+
+
+def find_interned_catalog(name: str, fingerprint: str) -> Optional[A2uiCatalog]:
+  """Returns the live interned catalog with this name and fingerprint, if any."""
+  with _interned_catalogs_lock:
+    return _interned_catalogs.get((name, fingerprint))
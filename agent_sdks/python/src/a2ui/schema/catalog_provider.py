@@ -15,9 +15,11 @@
 """Module for providing A2UI catalog schemas and resources."""
 
 import json
+import os
 from abc import ABC, abstractmethod
 from json.decoder import JSONDecodeError
-from typing import Any, Dict
+from typing import Any, Dict, Hashable, Optional
+from .artifacts import CatalogArtifacts
 from .constants import ENCODING
 
 
@@ -33,6 +35,33 @@ class A2uiCatalogProvider(ABC):
     """
     pass
 
+  async def aload(self) -> Dict[str, Any]:
+    """Loads a catalog definition without blocking the event loop.
+
+    Runs `load` in a worker thread by default. Providers with a native async
+    implementation can override it.
+    """
+    import asyncio
+
+    return await asyncio.to_thread(self.load)
+
+  def load_artifacts(self) -> Optional[CatalogArtifacts]:
+    """Loads values precomputed from the catalog at build time, if any.
+
+    The artifacts are only used when no schema modifiers are applied. They must
+    be built (with `artifacts.build_catalog_artifacts`) from the schema `load`
+    returns; only artifacts built by another SDK version are detected as stale.
+    """
+    return None
+
+  def stamp(self) -> Optional[Hashable]:
+    """Returns a cheap token that changes when the catalog changes.
+
+    Used by `A2uiSchemaManager.reload` to find changed catalogs without loading
+    them. None means the catalog is never reloaded.
+    """
+    return None
+
 
 class FileSystemCatalogProvider(A2uiCatalogProvider):
   """Loads catalog definition from the local filesystem."""
@@ -46,3 +75,10 @@ class FileSystemCatalogProvider(A2uiCatalogProvider):
         return json.load(f)
     except (FileNotFoundError, JSONDecodeError) as e:
       raise IOError(f"Could not load schema from {self.path}: {e}") from e
+
+  def stamp(self) -> Optional[Hashable]:
+    try:
+      stat = os.stat(self.path)
+    except OSError:
+      return "missing"
+    return (stat.st_mtime_ns, stat.st_size)
@@ -0,0 +1,181 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compact references to catalogs, for session state.
+
+A selected `A2uiCatalog` embeds the full schemas, often hundreds of KB. Session
+services that persist state (e.g. in a database) would write all of it in every
+session and state delta. Store a reference instead:
+
+  ```python
+  state_delta = {"system:a2ui_catalog": catalog_ref(a2ui_catalog)}
+  ...
+  a2ui_catalog = resolve_catalog(ctx.state.get("system:a2ui_catalog"), schema_manager)
+  ```
+
+A reference is a short string holding the catalog name and content fingerprint
+and, for pruned and inline-merged catalogs, how they were derived (see
+`catalog.CatalogOrigin`): the ID of the loaded catalog, the allowed components
+and messages, and the digest of the inline catalogs. It is resolved from the
+process-wide `CatalogRegistry`, which keeps recently referenced catalogs, then
+from the catalogs alive in the process (see `catalog.intern_catalog`), and then
+by rebuilding it with the given schema manager (see
+`A2uiSchemaManager.find_catalog`). Pruned catalogs thus resolve in any process
+whose manager loaded the same catalogs, e.g. another worker or after a restart.
+Inline-merged catalogs resolve while the manager caches their merge.
+
+References that cannot be resolved, or resolve to different content (e.g.
+after the catalog changed), raise `CatalogResolutionError`.
+
+`resolve_catalog` also accepts `A2uiCatalog` objects, so sessions written
+before references were introduced keep working.
+"""
+
+from typing import TYPE_CHECKING, Any, Optional, Tuple
+from urllib.parse import parse_qs, quote, unquote, urlencode
+
+from .cache import LruCache
+from .catalog import A2uiCatalog, CatalogOrigin, find_interned_catalog, intern_catalog
+
+if TYPE_CHECKING:
+  from .manager import A2uiSchemaManager
+
+CATALOG_REF_PREFIX = "a2ui-catalog:"
+DEFAULT_CATALOG_REGISTRY_SIZE = 256
+
+
+class CatalogResolutionError(ValueError):
+  """Raised for catalog references that don't resolve to their catalog."""
+
+
+def is_catalog_ref(value: Any) -> bool:
+  """Returns whether `value` is a catalog reference."""
+  return isinstance(value, str) and value.startswith(CATALOG_REF_PREFIX)
+
+
+def _format_ref(catalog: A2uiCatalog) -> str:
+  ref = f"{CATALOG_REF_PREFIX}{catalog.fingerprint}:{quote(catalog.name, safe='')}"
+  origin = catalog.origin
+  if origin is None:
+    return ref
+  query = [("catalogId", origin.catalog_id)]
+  if origin.inline_digest:
+    query.append(("inline", origin.inline_digest))
+  query.extend(("component", name) for name in origin.allowed_components)
+  query.extend(("message", name) for name in origin.allowed_messages)
+  return f"{ref}?{urlencode(query)}"
+
+
+def _parse_ref(ref: str) -> Optional[Tuple[str, str, Optional[CatalogOrigin]]]:
+  fingerprint, separator, rest = ref[len(CATALOG_REF_PREFIX) :].partition(":")
+  if not separator or not fingerprint:
+    return None
+  name, _, query = rest.partition("?")
+  origin = None
+  if query:
+    fields = parse_qs(query)
+    if "catalogId" not in fields:
+      return None
+    origin = CatalogOrigin(
+        catalog_id=fields["catalogId"][0],
+        inline_digest=fields.get("inline", [None])[0],
+        allowed_components=tuple(fields.get("component", ())),
+        allowed_messages=tuple(fields.get("message", ())),
+    )
+  return unquote(name), fingerprint, origin
+
+
+class CatalogRegistry:
+  """Resolves catalog references to the catalogs they were made from.
+
+  Args:
+    maxsize: The number of referenced catalogs kept alive by the registry.
+  """
+
+  def __init__(self, maxsize: int = DEFAULT_CATALOG_REGISTRY_SIZE):
+    self._catalogs = LruCache(maxsize)
+
+  def register(self, catalog: A2uiCatalog) -> str:
+    """Keeps `catalog` resolvable and returns its reference."""
+    catalog = intern_catalog(catalog)
+    key = (catalog.name, catalog.fingerprint)
+    self._catalogs.put(key, catalog)
+    return _format_ref(catalog)
+
+  def resolve(
+      self, value: Any, schema_manager: Optional["A2uiSchemaManager"] = None
+  ) -> Optional[A2uiCatalog]:
+    """Returns the catalog of a reference, or `value` itself if it is a catalog.
+
+    Args:
+      value: A catalog reference, a catalog, or None.
+      schema_manager: Optional manager rebuilding the referenced catalog from
+        its loaded catalogs, if the catalog is not alive in this process.
+
+    Returns:
+      The catalog, or None for None.
+
+    Raises:
+      CatalogResolutionError: If `value` is a malformed reference, or a reference
+        to a catalog that cannot be rebuilt with the same content.
+      ValueError: If `value` is neither a catalog nor a catalog reference.
+    """
+    if value is None or isinstance(value, A2uiCatalog):
+      return value
+    if not is_catalog_ref(value):
+      raise ValueError(f"Not an A2UI catalog or catalog reference: {value!r:.100}")
+    parsed = _parse_ref(value)
+    if parsed is None:
+      raise CatalogResolutionError(f"Malformed A2UI catalog reference: {value!r:.100}")
+    name, fingerprint, origin = parsed
+    key = (name, fingerprint)
+    catalog = self._catalogs.get(key)
+    if catalog is not None:
+      return catalog
+    catalog = find_interned_catalog(*key)
+    if catalog is None and schema_manager is not None:
+      catalog = schema_manager.find_catalog(name, origin)
+      if catalog is not None and (catalog.name, catalog.fingerprint) != key:
+        raise CatalogResolutionError(
+            f"A2UI catalog {value!r:.100} changed since it was referenced"
+        )
+    if catalog is None:
+      raise CatalogResolutionError(
+          f"A2UI catalog {value!r:.100} is not loaded in this process"
+      )
+    self._catalogs.put(key, catalog)
+    return catalog
+
+
+_default_registry = CatalogRegistry()
+
+
+def get_catalog_registry() -> CatalogRegistry:
+  """Returns the registry shared by the whole process."""
+  return _default_registry
+
+
+def catalog_ref(catalog: A2uiCatalog) -> str:
+  """Returns a short reference to `catalog`, resolvable with `resolve_catalog`."""
+  return _default_registry.register(catalog)
+
+
+def resolve_catalog(
+    value: Any, schema_manager: Optional["A2uiSchemaManager"] = None
+) -> Optional[A2uiCatalog]:
+  """Resolves a catalog reference (or passes a catalog through).
+
+  See `CatalogRegistry.resolve`.
+  """
+  return _default_registry.resolve(value, schema_manager)
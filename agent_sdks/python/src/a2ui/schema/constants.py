@@ -29,6 +29,10 @@ A2UI_CLIENT_CAPABILITIES_KEY = "a2uiClientCapabilities"
 
 BASE_SCHEMA_URL = "https://a2ui.org/"
 INLINE_CATALOG_NAME = "inline"
+# Upper bound on the canonical JSON size of the inline catalogs in a request.
+DEFAULT_MAX_INLINE_CATALOG_BYTES = 1024 * 1024
+# Minimum time between two checks of the example files behind a cached prompt.
+DEFAULT_EXAMPLES_CHECK_INTERVAL_SECONDS = 1.0
 
 VERSION_0_8 = "0.8"
 VERSION_0_9 = "0.9"
@@ -0,0 +1,206 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""A persistent, multi-process cache of processed catalogs.
+
+Every process that loads a custom catalog applies the schema modifiers and
+derives the same prompt rendering, reference maps and pruning graph from it.
+`CatalogDiskCache` stores the modified catalog schema and its
+`CatalogArtifacts` in a directory shared by all workers, so the work is done
+once per catalog content rather than once per process.
+
+Entries are keyed by the content of the catalog as loaded, the SDK and protocol
+versions, and the identities (module and qualified name) of the schema
+modifiers. A modifier without a stable identity (a lambda or a nested function)
+disables caching. Changing what a named modifier does requires clearing the
+cache directory.
+
+Entries are written atomically, and an unreadable entry is treated as a miss.
+"""
+
+import contextlib
+import json
+import logging
+import os
+import time
+from typing import Any, Callable, Dict, Iterator, Optional, Sequence, Tuple
+
+from ..version import __version__
+from .artifacts import CatalogArtifacts
+from .constants import ENCODING
+from .utils import canonical_hash, write_json_atomically
+
+# Bumped whenever the layout of the entries changes.
+_ENTRY_FORMAT = 1
+_ENTRY_SUFFIX = ".json"
+_LOCK_SUFFIX = ".lock"
+# How long a process waits for another one to write an entry before doing the
+# work itself, and after how long a lock is assumed to be abandoned.
+_LOCK_TIMEOUT_SECONDS = 30.0
+_LOCK_POLL_SECONDS = 0.05
+
+CatalogEntry = Tuple[Dict[str, Any], CatalogArtifacts]
+
+
+def modifier_identity(modifier: Callable[..., Any]) -> Optional[str]:
+  """Returns a name identifying `modifier` across processes, if it has one."""
+  module = getattr(modifier, "__module__", None)
+  qualname = getattr(modifier, "__qualname__", None)
+  if not module or not qualname or "<" in qualname:
+    return None
+  return f"{module}.{qualname}"
+
+
+class CatalogDiskCache:
+  """Stores processed catalogs as JSON files in a directory.
+
+  Args:
+    directory: The cache directory, created if missing. It can be shared by any
+      number of processes.
+    lock_timeout: Seconds to wait for another process computing the same entry.
+  """
+
+  def __init__(self, directory: str, lock_timeout: float = _LOCK_TIMEOUT_SECONDS):
+    self._directory = directory
+    self._lock_timeout = lock_timeout
+    os.makedirs(directory, exist_ok=True)
+
+  @property
+  def directory(self) -> str:
+    return self._directory
+
+  def key(
+      self,
+      version: str,
+      catalog_schema: Dict[str, Any],
+      modifiers: Sequence[Callable[..., Any]] = (),
+  ) -> Optional[str]:
+    """Returns the entry key of a catalog, or None if it can't be cached.
+
+    Args:
+      version: The A2UI protocol version.
+      catalog_schema: The catalog schema as loaded, before modifiers.
+      modifiers: The schema modifiers applied to the catalog.
+    """
+    identities = [modifier_identity(m) for m in modifiers]
+    if None in identities:
+      logging.debug("Not caching catalog: a schema modifier has no stable name")
+      return None
+    return canonical_hash([
+        _ENTRY_FORMAT,
+        __version__,
+        version,
+        identities,
+        canonical_hash(catalog_schema),
+    ])
+
+  def get(self, key: str) -> Optional[CatalogEntry]:
+    """Returns the modified catalog schema and its artifacts, or None."""
+    path = self._path(key, _ENTRY_SUFFIX)
+    try:
+      with open(path, "r", encoding=ENCODING) as f:
+        data = json.load(f)
+      if data.get("format") != _ENTRY_FORMAT:
+        return None
+      return data["catalogSchema"], CatalogArtifacts.from_dict(data["artifacts"])
+    except FileNotFoundError:
+      return None
+    except Exception as e:
+      logging.warning(f"Ignoring unreadable catalog cache entry {path}: {e}")
+      return None
+
+  def put(
+      self, key: str, catalog_schema: Dict[str, Any], artifacts: CatalogArtifacts
+  ) -> None:
+    """Writes an entry atomically. Failures are logged, not raised."""
+    data = {
+        "format": _ENTRY_FORMAT,
+        "catalogSchema": catalog_schema,
+        "artifacts": artifacts.to_dict(),
+    }
+    path = self._path(key, _ENTRY_SUFFIX)
+    try:
+      write_json_atomically(path, data)
+    except OSError as e:
+      logging.warning(f"Could not write catalog cache entry {path}: {e}")
+
+  def get_or_create(self, key: str, create: Callable[[], CatalogEntry]) -> CatalogEntry:
+    """Returns the entry for `key`, calling `create` at most once across processes.
+
+    While one process creates an entry, others wait for it (up to
+    `lock_timeout`) instead of repeating the work.
+    """
+    entry = self.get(key)
+    if entry is not None:
+      return entry
+    with self._lock(key):
+      entry = self.get(key)
+      if entry is None:
+        entry = create()
+        self.put(key, *entry)
+    return entry
+
+  def _path(self, key: str, suffix: str) -> str:
+    return os.path.join(self._directory, key + suffix)
+
+  @contextlib.contextmanager
+  def _lock(self, key: str) -> Iterator[None]:
+    """Holds the lock file of `key`, or gives up on it after the timeout."""
+    path = self._path(key, _LOCK_SUFFIX)
+    deadline = time.monotonic() + self._lock_timeout
+    acquired = False
+    while True:
+      try:
+        os.close(os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+        acquired = True
+        break
+      except FileExistsError:
+        if self._is_abandoned(path):
+          self._break_lock(path)
+          continue
+        if time.monotonic() >= deadline:
+          break
+        if os.path.exists(self._path(key, _ENTRY_SUFFIX)):
+          break
+        time.sleep(_LOCK_POLL_SECONDS)
+      except OSError as e:
+        logging.debug("Could not lock catalog cache entry %s: %s", path, e)
+        break
+    try:
+      yield
+    finally:
+      if acquired:
+        with contextlib.suppress(OSError):
+          os.unlink(path)
+
+  def _break_lock(self, path: str) -> None:
+    """Moves an abandoned lock file aside, so it can be acquired again.
+
+    Moving it to a unique name is atomic, so when several processes break the
+    same lock, only one of them removes it.
+    """
+    stale_path = f"{path}.{os.getpid()}.{time.monotonic_ns()}.stale"
+    try:
+      os.replace(path, stale_path)
+    except OSError:
+      return
+    logging.debug("Removed abandoned catalog cache lock %s", path)
+    with contextlib.suppress(OSError):
+      os.unlink(stale_path)
+
+  def _is_abandoned(self, path: str) -> bool:
+    try:
+      return time.time() - os.path.getmtime(path) > self._lock_timeout
+    except OSError:
+      return False
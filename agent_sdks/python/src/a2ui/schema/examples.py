@@ -0,0 +1,322 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Relevance-ranked selection of few-shot examples.
+
+Catalogs can ship dozens of examples, and embedding all of them in every prompt
+costs latency on every turn. An `ExampleRetriever` indexes the examples of a
+directory (or glob pattern) with BM25 over their names, descriptions, the
+component types they use and their text literals, and selects the examples most
+relevant to a query within a token budget.
+
+Usage Example:
+
+  ```python
+  retriever = get_example_retriever("path/to/examples")
+  examples = retriever.render("Show the status of flight UA 123", top_k=3)
+  ```
+"""
+
+import collections
+import glob
+import json
+import logging
+import math
+import os
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .cache import LruCache
+from .constants import ENCODING
+from .rendering import estimate_tokens
+from .utils import find_component_types
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TOP_K = 3
+
+# Terms in an example's name and description count this many times.
+_TITLE_WEIGHT = 3
+# Component types used by an example count this many times.
+_COMPONENT_WEIGHT = 2
+# Keys whose string values are identifiers rather than prose.
+_IDENTIFIER_KEYS = frozenset({
+    "id",
+    "surfaceId",
+    "catalogId",
+    "version",
+    "path",
+    "child",
+    "children",
+    "componentId",
+})
+_RETRIEVERS_CACHE_SIZE = 32
+
+_WORD_PATTERN = re.compile(r"[A-Za-z0-9]+")
+_CAMEL_CASE_PATTERN = re.compile(r"[A-Z]+(?![a-z])|[A-Z]?[a-z]+|\d+")
+
+
+@dataclass(frozen=True)
+class ExampleSelection:
+  """Options for selecting the examples relevant to a request.
+
+  Attributes:
+    query: The text to rank examples against, usually the user's request.
+    top_k: The maximum number of examples to select.
+    max_tokens: Optional budget, in estimated tokens, for the selected examples.
+  """
+
+  query: str
+  top_k: int = DEFAULT_TOP_K
+  max_tokens: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class Example:
+  """An example file and the terms it is indexed under."""
+
+  name: str
+  path: str
+  content: str
+  tokens: int
+  term_counts: Dict[str, int] = field(repr=False, compare=False)
+
+  def render(self) -> str:
+    return f"---BEGIN {self.name}---\n{self.content}\n---END {self.name}---"
+
+
+def match_example_files(path: Optional[str]) -> List[str]:
+  """Returns the sorted example files matched by a directory or glob pattern."""
+  if not path:
+    return []
+  pattern = os.path.join(path, "*.json") if os.path.isdir(path) else path
+  return sorted(p for p in glob.glob(pattern, recursive=True) if os.path.isfile(p))
+
+
+def examples_stamp(path: Optional[str]) -> Tuple[Tuple[str, int, int], ...]:
+  """Returns the modification times and sizes of the example files of `path`."""
+  stamp = []
+  for file_path in match_example_files(path):
+    try:
+      stat = os.stat(file_path)
+      stamp.append((file_path, stat.st_mtime_ns, stat.st_size))
+    except OSError:
+      continue
+  return tuple(stamp)
+
+
+def tokenize(text: str) -> List[str]:
+  """Splits `text` into lowercase terms, also splitting camelCase words.
+
+  'ChoicePicker' yields 'choicepicker', 'choice' and 'picker', so queries match
+  both component names and the words in them.
+  """
+  terms = []
+  for word in _WORD_PATTERN.findall(text):
+    lower = word.lower()
+    terms.append(lower)
+    parts = _CAMEL_CASE_PATTERN.findall(word)
+    if len(parts) > 1:
+      terms.extend(part.lower() for part in parts)
+  return terms
+
+
+class ExampleRetriever:
+  """A BM25 index over the examples of a directory or glob pattern.
+
+  Args:
+    path: The examples directory or glob pattern, as in `CatalogConfig`.
+    k1: The BM25 term frequency saturation.
+    b: The BM25 document length normalization.
+    previous: An earlier index of `path`, whose examples are reused for the
+      files that did not change since.
+  """
+
+  def __init__(
+      self,
+      path: str,
+      k1: float = 1.5,
+      b: float = 0.75,
+      previous: Optional["ExampleRetriever"] = None,
+  ):
+    self._path = path
+    self._k1 = k1
+    self._b = b
+    # Stamp the files before reading them, so a concurrent edit is picked up by
+    # the next `get_example_retriever` call.
+    self.stamp = examples_stamp(path)
+    # When `stamp` was last compared with the files (`time.monotonic()`).
+    self.checked_at = time.monotonic()
+    unchanged = {}
+    if previous is not None:
+      current = set(self.stamp)
+      previous_examples = {e.path: e for e in previous.examples}
+      for entry in previous.stamp:
+        if entry in current and entry[0] in previous_examples:
+          unchanged[entry[0]] = previous_examples[entry[0]]
+    self.examples: List[Example] = []
+    for file_path in match_example_files(path):
+      if file_path in unchanged:
+        self.examples.append(unchanged[file_path])
+        continue
+      with open(file_path, "r", encoding=ENCODING) as f:
+        content = f.read()
+      name = os.path.splitext(os.path.basename(file_path))[0]
+      self.examples.append(
+          Example(
+              name=name,
+              path=file_path,
+              content=content,
+              tokens=estimate_tokens(content),
+              term_counts=_index_terms(name, content),
+          )
+      )
+
+    self._lengths = [sum(e.term_counts.values()) for e in self.examples]
+    self._average_length = (
+        sum(self._lengths) / len(self._lengths) if self._lengths else 0.0
+    )
+    document_frequency = collections.Counter()
+    for example in self.examples:
+      document_frequency.update(example.term_counts.keys())
+    count = len(self.examples)
+    self._idf = {
+        term: math.log(1 + (count - df + 0.5) / (df + 0.5))
+        for term, df in document_frequency.items()
+    }
+
+  @property
+  def path(self) -> str:
+    return self._path
+
+  def rank(self, query: str) -> List[Tuple[Example, float]]:
+    """Returns every example with its BM25 score for `query`, best first.
+
+    Examples with equal scores keep their file order.
+    """
+    terms = set(tokenize(query))
+    scored = []
+    for example, length in zip(self.examples, self._lengths):
+      score = 0.0
+      norm = self._k1 * (1 - self._b + self._b * length / (self._average_length or 1.0))
+      for term in terms:
+        tf = example.term_counts.get(term)
+        if tf:
+          score += self._idf[term] * tf * (self._k1 + 1) / (tf + norm)
+      scored.append((example, score))
+    scored.sort(key=lambda item: -item[1])
+    return scored
+
+  def select(
+      self,
+      query: str,
+      top_k: int = DEFAULT_TOP_K,
+      max_tokens: Optional[int] = None,
+  ) -> List[Example]:
+    """Returns up to `top_k` examples most relevant to `query`.
+
+    Examples that would exceed `max_tokens` are skipped in favor of the next
+    best ones that fit.
+    """
+    selected = []
+    budget = max_tokens
+    for example, _ in self.rank(query):
+      if len(selected) >= top_k:
+        break
+      if budget is not None:
+        if example.tokens > budget:
+          continue
+        budget -= example.tokens
+      selected.append(example)
+    return selected
+
+  def render(
+      self,
+      query: str,
+      top_k: int = DEFAULT_TOP_K,
+      max_tokens: Optional[int] = None,
+  ) -> str:
+    """Returns the selected examples in the format of `load_examples`."""
+    return "\n\n".join(e.render() for e in self.select(query, top_k, max_tokens))
+
+
+_retrievers = LruCache(_RETRIEVERS_CACHE_SIZE)
+
+
+def get_example_retriever(path: str, check_interval: float = 0.0) -> ExampleRetriever:
+  """Returns the shared retriever for `path`, reindexing it if files changed.
+
+  Only the changed files are read and indexed again. The files are stat-ed at
+  most once per `check_interval` seconds; by default, on every call.
+  """
+  stale = []
+
+  def is_fresh(retriever: ExampleRetriever) -> bool:
+    now = time.monotonic()
+    if now - retriever.checked_at < check_interval:
+      return True
+    if retriever.stamp == examples_stamp(path):
+      retriever.checked_at = now
+      return True
+    stale.append(retriever)
+    return False
+
+  retriever = _retrievers.get(path, is_fresh=is_fresh)
+  if retriever is None:
+    retriever = ExampleRetriever(path, previous=stale[0] if stale else None)
+    _retrievers.put(path, retriever)
+  return retriever
+
+
+def _index_terms(name: str, content: str) -> Dict[str, int]:
+  counts = collections.Counter()
+  counts.update(tokenize(name) * _TITLE_WEIGHT)
+  try:
+    data = json.loads(content)
+  except json.JSONDecodeError:
+    logger.warning(f"Example {name} is not valid JSON; indexing it as text")
+    counts.update(tokenize(content))
+    return dict(counts)
+
+  if isinstance(data, dict):
+    for key in ("name", "description"):
+      if isinstance(data.get(key), str):
+        counts.update(tokenize(data[key]) * _TITLE_WEIGHT)
+    data = {k: v for k, v in data.items() if k not in ("name", "description")}
+  for component_type in find_component_types(data):
+    counts.update(tokenize(component_type) * _COMPONENT_WEIGHT)
+  for literal in _text_literals(data):
+    counts.update(tokenize(literal))
+  return dict(counts)
+
+
+def _walk(node: Any) -> Iterator[Tuple[Optional[str], Any]]:
+  stack: List[Tuple[Optional[str], Any]] = [(None, node)]
+  while stack:
+    key, node = stack.pop()
+    yield key, node
+    if isinstance(node, dict):
+      stack.extend(node.items())
+    elif isinstance(node, list):
+      stack.extend((key, item) for item in node)
+
+
+def _text_literals(data: Any) -> List[str]:
+  return [
+      node
+      for key, node in _walk(data)
+      if isinstance(node, str) and key not in _IDENTIFIER_KEYS and key != "component"
+  ]
@@ -0,0 +1,351 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Loads catalog definitions over HTTP(S).
+
+`HttpCatalogProvider` keeps the last fetched catalog in memory and, optionally,
+in a cache directory. A cached catalog is returned immediately; once it is
+older than `max_age` it is revalidated in the background with a conditional
+request (`If-None-Match` / `If-Modified-Since`), so only the very first load of
+a catalog waits for the network. Concurrent fetches of the same URL are
+de-duplicated, and connections are kept alive and reused between requests.
+
+Usage Example:
+
+  ```python
+  config = CatalogConfig.from_path(
+      "my_catalog",
+      "https://example.com/catalogs/my_catalog.json",
+      catalog_cache_dir="/var/cache/a2ui",
+  )
+  ```
+"""
+
+import collections
+import copy
+import hashlib
+import http.client
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+from urllib.parse import urlsplit
+
+from .catalog_provider import A2uiCatalogProvider
+from .constants import ENCODING
+from .utils import write_json_atomically
+
+_T = TypeVar("_T")
+
+DEFAULT_MAX_AGE_SECONDS = 300.0
+DEFAULT_TIMEOUT_SECONDS = 10.0
+# Maximum number of idle connections kept per host.
+_MAX_IDLE_CONNECTIONS = 4
+
+
+@dataclass(frozen=True)
+class _CachedCatalog:
+  catalog: Dict[str, Any]
+  etag: Optional[str]
+  last_modified: Optional[str]
+  fetched_at: float
+
+  def to_dict(self, url: str) -> Dict[str, Any]:
+    return {
+        "url": url,
+        "etag": self.etag,
+        "lastModified": self.last_modified,
+        "fetchedAt": self.fetched_at,
+        "catalog": self.catalog,
+    }
+
+  @classmethod
+  def from_dict(cls, data: Dict[str, Any]) -> "_CachedCatalog":
+    return cls(
+        catalog=data["catalog"],
+        etag=data.get("etag"),
+        last_modified=data.get("lastModified"),
+        fetched_at=data["fetchedAt"],
+    )
+
+
+class _ConnectionPool:
+  """Keeps idle keep-alive connections per scheme, host and port."""
+
+  def __init__(self, max_idle: int = _MAX_IDLE_CONNECTIONS):
+    self._max_idle = max_idle
+    self._idle: Dict[Tuple[str, str], "collections.deque"] = {}
+    self._lock = threading.Lock()
+
+  def request(
+      self, url: str, headers: Dict[str, str], timeout: float
+  ) -> Tuple[int, Dict[str, str], bytes]:
+    """Sends a GET request, reusing an idle connection when there is one.
+
+    Returns:
+      The status, the (lowercase) response headers and the body.
+    """
+    parts = urlsplit(url)
+    key = (parts.scheme, parts.netloc)
+    path = parts.path or "/"
+    if parts.query:
+      path += "?" + parts.query
+
+    conn = self._acquire(key)
+    reused = conn is not None
+    if conn is None:
+      conn = self._connect(parts.scheme, parts.netloc, timeout)
+    try:
+      response = self._send(conn, path, headers)
+    except (http.client.HTTPException, ConnectionError):
+      conn.close()
+      if not reused:
+        raise
+      # The server may have closed the idle connection; retry on a new one.
+      conn = self._connect(parts.scheme, parts.netloc, timeout)
+      response = self._send(conn, path, headers)
+    except BaseException:
+      conn.close()
+      raise
+
+    body = response.read()
+    response_headers = {k.lower(): v for k, v in response.getheaders()}
+    if response.will_close:
+      conn.close()
+    else:
+      self._release(key, conn)
+    return response.status, response_headers, body
+
+  def _connect(self, scheme: str, netloc: str, timeout: float):
+    if scheme == "https":
+      return http.client.HTTPSConnection(netloc, timeout=timeout)
+    return http.client.HTTPConnection(netloc, timeout=timeout)
+
+  def _send(self, conn, path: str, headers: Dict[str, str]):
+    conn.request("GET", path, headers=headers)
+    return conn.getresponse()
+
+  def _acquire(self, key):
+    with self._lock:
+      idle = self._idle.get(key)
+      return idle.pop() if idle else None
+
+  def _release(self, key, conn) -> None:
+    with self._lock:
+      idle = self._idle.setdefault(key, collections.deque())
+      if len(idle) < self._max_idle:
+        idle.append(conn)
+        return
+    conn.close()
+
+
+_connection_pool = _ConnectionPool()
+
+# Fetches in progress, shared by all providers so concurrent loads of the same
+# URL send one request.
+_in_flight: Dict[str, Future] = {}
+_in_flight_lock = threading.Lock()
+
+
+def _single_flight(key: str, fn: Callable[[], _T]) -> _T:
+  """Runs `fn`, or waits for the call already running for `key`."""
+  with _in_flight_lock:
+    future = _in_flight.get(key)
+    owner = future is None
+    if owner:
+      future = Future()
+      _in_flight[key] = future
+  if not owner:
+    return future.result()
+  try:
+    result = fn()
+    future.set_result(result)
+    return result
+  except BaseException as e:
+    future.set_exception(e)
+    raise
+  finally:
+    with _in_flight_lock:
+      _in_flight.pop(key, None)
+
+
+class HttpCatalogProvider(A2uiCatalogProvider):
+  """Loads a catalog definition from an HTTP(S) URL.
+
+  Args:
+    url: The catalog URL.
+    cache_dir: Optional directory persisting the last fetched catalog, so that
+      restarts don't wait for the network. It can be shared between processes.
+    max_age: Seconds after which a cached catalog is revalidated in the
+      background.
+    timeout: The network timeout, in seconds.
+  """
+
+  def __init__(
+      self,
+      url: str,
+      cache_dir: Optional[str] = None,
+      max_age: float = DEFAULT_MAX_AGE_SECONDS,
+      timeout: float = DEFAULT_TIMEOUT_SECONDS,
+  ):
+    self.url = url
+    self._cache_dir = cache_dir
+    self._max_age = max_age
+    self._timeout = timeout
+    self._cached: Optional[_CachedCatalog] = None
+    self._next_background_refresh = 0.0
+    self._lock = threading.Lock()
+    if cache_dir:
+      os.makedirs(cache_dir, exist_ok=True)
+
+  @property
+  def cache_path(self) -> Optional[str]:
+    """The file caching this catalog, if a cache directory is set."""
+    if not self._cache_dir:
+      return None
+    digest = hashlib.sha256(self.url.encode(ENCODING)).hexdigest()
+    return os.path.join(self._cache_dir, f"{digest}.json")
+
+  def load(self) -> Dict[str, Any]:
+    """Returns the catalog, fetching it only if nothing is cached.
+
+    Raises:
+      IOError: If the catalog is not cached and can't be fetched.
+    """
+    cached = self._get_cached()
+    if cached is None:
+      return self.refresh()
+    if time.time() - cached.fetched_at >= self._max_age:
+      self._refresh_in_background()
+    # Callers (e.g. schema modifiers) may modify the returned catalog.
+    return copy.deepcopy(cached.catalog)
+
+  def refresh(self) -> Dict[str, Any]:
+    """Revalidates the catalog with the server now, and returns it.
+
+    Raises:
+      IOError: If the request fails.
+    """
+    fetched = _single_flight(self.url, self._fetch)
+    with self._lock:
+      # Another provider for the same URL may have made the request.
+      if self._cached is None or fetched.fetched_at > self._cached.fetched_at:
+        self._cached = fetched
+    return copy.deepcopy(fetched.catalog)
+
+  def stamp(self) -> Optional[Hashable]:
+    """Returns the validators of the cached catalog, revalidating it if stale.
+
+    Catalogs served without an `ETag` or `Last-Modified` header are not
+    reloaded.
+    """
+    cached = self._get_cached()
+    if cached is None:
+      return None
+    if time.time() - cached.fetched_at >= self._max_age:
+      self._refresh_in_background()
+    if not cached.etag and not cached.last_modified:
+      return None
+    return (cached.etag, cached.last_modified)
+
+  def _get_cached(self) -> Optional[_CachedCatalog]:
+    with self._lock:
+      if self._cached is None:
+        self._cached = self._read_cache_file()
+      return self._cached
+
+  def _refresh_in_background(self) -> None:
+    # At most one attempt per `max_age`, so an unreachable server isn't
+    # retried on every load.
+    with self._lock:
+      now = time.monotonic()
+      if now < self._next_background_refresh:
+        return
+      self._next_background_refresh = now + self._max_age
+    with _in_flight_lock:
+      if self.url in _in_flight:
+        return
+    threading.Thread(
+        target=self._refresh_quietly, name="a2ui-catalog-refresh", daemon=True
+    ).start()
+
+  def _refresh_quietly(self) -> None:
+    try:
+      self.refresh()
+    except Exception as e:
+      logging.warning(f"Could not refresh catalog {self.url}; keeping cached copy: {e}")
+
+  def _fetch(self) -> _CachedCatalog:
+    with self._lock:
+      cached = self._cached
+    headers = {"Accept": "application/json"}
+    if cached is not None and cached.etag:
+      headers["If-None-Match"] = cached.etag
+    if cached is not None and cached.last_modified:
+      headers["If-Modified-Since"] = cached.last_modified
+
+    try:
+      status, response_headers, body = _connection_pool.request(
+          self.url, headers, self._timeout
+      )
+    except (OSError, http.client.HTTPException) as e:
+      raise IOError(f"Could not load schema from {self.url}: {e}") from e
+
+    if status == 304 and cached is not None:
+      fetched = replace(cached, fetched_at=time.time())
+    elif status == 200:
+      try:
+        catalog = json.loads(body.decode(ENCODING))
+      except (UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise IOError(f"Could not load schema from {self.url}: {e}") from e
+      fetched = _CachedCatalog(
+          catalog=catalog,
+          etag=response_headers.get("etag"),
+          last_modified=response_headers.get("last-modified"),
+          fetched_at=time.time(),
+      )
+    else:
+      raise IOError(f"Could not load schema from {self.url}: HTTP {status}")
+
+    with self._lock:
+      self._cached = fetched
+    self._write_cache_file(fetched)
+    return fetched
+
+  def _read_cache_file(self) -> Optional[_CachedCatalog]:
+    path = self.cache_path
+    if path is None or not os.path.exists(path):
+      return None
+    try:
+      with open(path, "r", encoding=ENCODING) as f:
+        data = json.load(f)
+      if data.get("url") != self.url:
+        return None
+      return _CachedCatalog.from_dict(data)
+    except Exception as e:
+      logging.warning(f"Ignoring unreadable cached catalog {path}: {e}")
+      return None
+
+  def _write_cache_file(self, cached: _CachedCatalog) -> None:
+    path = self.cache_path
+    if path is None:
+      return
+    try:
+      write_json_atomically(path, cached.to_dict(self.url))
+    except OSError as e:
+      logging.warning(f"Could not cache catalog {self.url} in {path}: {e}")
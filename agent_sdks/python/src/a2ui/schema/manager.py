@@ -13,20 +13,77 @@
 # limitations under the License.
 
 import copy
+import functools
+import hashlib
 import json
 import logging
 import os
 import importlib.resources
-from typing import Any, Optional, Callable
-from dataclasses import dataclass, field
-from .utils import load_from_bundled_resource
+import threading
+import time
+from concurrent.futures import Executor
+from typing import Any, Optional, Callable, Hashable
+from dataclasses import dataclass, field, replace
+from .artifacts import CatalogArtifacts, build_catalog_artifacts
+from .cache import CacheInfo, LruCache
+from .utils import canonical_json
 from ..inference_strategy import InferenceStrategy
 from .constants import *
-from .catalog import CatalogConfig, A2uiCatalog
+from .catalog import CatalogConfig, CatalogOrigin, A2uiCatalog, intern_catalog
+from .catalog_provider import A2uiCatalogProvider
+from .disk_cache import CatalogDiskCache
+from .examples import ExampleSelection, examples_stamp, get_example_retriever
+from .registry import SchemaRegistry, get_schema_registry
+from .rendering import CompactRenderOptions
+from .subsetting import ComponentSubsetter
+from .watch import DEFAULT_WATCH_INTERVAL_SECONDS, CatalogReload, CatalogWatcher
+
+
+@dataclass(frozen=True)
+class PromptPrefix:
+  """The stable leading part of prefix-stable system prompts.
+
+  Attributes:
+    text: The schema and examples sections, in canonical form.
+    content_hash: The SHA-256 hex digest of `text`.
+  """
+
+  text: str
+  content_hash: str
 
 
 class A2uiSchemaManager(InferenceStrategy):
-  """Manages A2UI schema levels and prompt injection."""
+  """Manages A2UI schema levels and prompt injection.
+
+  Generated system prompts are memoized in a bounded LRU cache keyed by the
+  prompt arguments, so agents that build a prompt per request or per session
+  only pay for catalog selection, pruning, rendering and example loading once.
+  Prompts that include examples are regenerated when an example file is added,
+  removed or modified; the files are checked at most once every
+  `examples_check_interval` seconds (and on `reload`). Set `prompt_cache_size`
+  to 0 to disable the cache.
+
+  Catalogs merged from client-provided inline catalogs are cached by content,
+  along with their compiled validators, in an LRU cache of
+  `inline_catalog_cache_size` entries. Inline catalogs larger than
+  `max_inline_catalog_bytes` (as canonical JSON) are rejected.
+
+  With a `component_subsetter`, prompts generated for a `query` only include
+  the components predicted for it (unless `allowed_components` is given).
+
+  With a `catalog_cache_dir`, the modified schemas and derived artifacts of
+  the catalogs are persisted there (see `disk_cache.CatalogDiskCache`), so
+  workers sharing the directory process each catalog once.
+
+  The bundled schemas, and the results of named schema modifiers applied to
+  them and to the configured catalogs, are shared with the other managers of
+  the process through a `schema_registry` (see `registry.SchemaRegistry`).
+
+  `reload` (or a background `watch`) picks up changed catalog and example
+  files without a restart. Only the changed catalogs are loaded and compiled
+  again, and they are swapped in atomically: requests already holding a catalog
+  finish with it, and later requests get the new one.
+  """
 
   def __init__(
       self,
@@ -36,17 +93,99 @@ class A2uiSchemaManager(InferenceStrategy):
       schema_modifiers: Optional[
           list[Callable[[dict[str, Any]], dict[str, Any]]]
       ] = None,
+      prompt_cache_size: int = 128,
+      inline_catalog_cache_size: int = 64,
+      max_inline_catalog_bytes: int = DEFAULT_MAX_INLINE_CATALOG_BYTES,
+      component_subsetter: Optional[ComponentSubsetter] = None,
+      catalog_cache_dir: Optional[str] = None,
+      schema_registry: Optional[SchemaRegistry] = None,
+      examples_check_interval: float = DEFAULT_EXAMPLES_CHECK_INTERVAL_SECONDS,
   ):
     self._version = version
     self._accepts_inline_catalogs = accepts_inline_catalogs
+    self._prompt_cache: Optional[LruCache] = (
+        LruCache(prompt_cache_size) if prompt_cache_size > 0 else None
+    )
+    self._inline_catalog_cache: Optional[LruCache] = (
+        LruCache(inline_catalog_cache_size) if inline_catalog_cache_size > 0 else None
+    )
+    self._max_inline_catalog_bytes = max_inline_catalog_bytes
+    self._component_subsetter = component_subsetter
+    self._catalog_disk_cache: Optional[CatalogDiskCache] = (
+        CatalogDiskCache(catalog_cache_dir) if catalog_cache_dir else None
+    )
+    self._schema_registry = (
+        schema_registry if schema_registry is not None else get_schema_registry()
+    )
 
     self._server_to_client_schema = None
     self._common_types_schema = None
     self._supported_catalogs: list[A2uiCatalog] = []
     self._catalog_example_paths: dict[str, str] = {}
     self._schema_modifiers = schema_modifiers or []
+    self._catalog_configs: list[CatalogConfig] = []
+    self._catalog_stamps: list[Optional[Hashable]] = []
+    self._examples_stamps: dict[str, tuple] = {}
+    # The last checked stamp of each examples path, and when it was taken.
+    self._examples_checks: dict[str, tuple[float, tuple]] = {}
+    self._examples_check_interval = examples_check_interval
+    # The examples selected per examples path and selection, with the stamp of
+    # the files they were selected from.
+    self._selected_examples: Optional[LruCache] = (
+        LruCache(prompt_cache_size) if prompt_cache_size > 0 else None
+    )
+    # The number of times each catalog ID was reloaded. Recorded with cached
+    # prompts and merged catalogs, so entries built from replaced catalogs are
+    # never served. Replaced rather than mutated on reload.
+    self._catalog_generations: dict[str, int] = {}
+    self._reload_lock = threading.Lock()
     self._load_schemas(version, catalogs or [])
 
+  @classmethod
+  async def create_async(
+      cls,
+      version: str,
+      catalogs: Optional[list[CatalogConfig]] = None,
+      executor: Optional[Executor] = None,
+      compile_validators: bool = True,
+      **kwargs: Any,
+  ) -> "A2uiSchemaManager":
+    """Creates a schema manager without blocking the event loop.
+
+    The catalogs are loaded concurrently with their providers' `aload`. The
+    manager is then built in `executor` (the default executor if None), and the
+    validators and LLM instructions of the catalogs are compiled there
+    concurrently.
+
+    Args:
+      version: The A2UI protocol version.
+      catalogs: The catalogs to load.
+      executor: Optional executor for the CPU-bound work.
+      compile_validators: Whether to compile the catalogs' validators and LLM
+        instructions up front rather than on first use.
+      **kwargs: The other arguments of `A2uiSchemaManager`.
+    """
+    import asyncio
+
+    catalogs = catalogs or []
+    loop = asyncio.get_running_loop()
+    schemas = await asyncio.gather(
+        *(_aload_catalog(config.provider) for config in catalogs)
+    )
+    preloaded = [
+        replace(config, provider=_PreloadedCatalogProvider(config.provider, schema))
+        for config, schema in zip(catalogs, schemas)
+    ]
+    manager = await loop.run_in_executor(
+        executor, functools.partial(cls, version, catalogs=preloaded, **kwargs)
+    )
+    if compile_validators:
+      await asyncio.gather(*(
+          loop.run_in_executor(executor, _compile_catalog, catalog)
+          for catalog in manager._supported_catalogs
+      ))
+    return manager
+
   @property
   def accepts_inline_catalogs(self) -> bool:
     return self._accepts_inline_catalogs
@@ -74,29 +213,199 @@ class A2uiSchemaManager(InferenceStrategy):
           f" {list(SPEC_VERSION_MAP.keys())}"
       )
 
-    # Load server-to-client and common types schemas
-    self._server_to_client_schema = self._apply_modifiers(
-        load_from_bundled_resource(
-            version, SERVER_TO_CLIENT_SCHEMA_KEY, SPEC_VERSION_MAP
-        )
+    # Load server-to-client and common types schemas, shared with the other
+    # managers of the process.
+    registry = self._schema_registry
+    self._server_to_client_schema = registry.apply_modifiers(
+        registry.bundled(version, SERVER_TO_CLIENT_SCHEMA_KEY, SPEC_VERSION_MAP),
+        self._schema_modifiers,
     )
-    self._common_types_schema = self._apply_modifiers(
-        load_from_bundled_resource(version, COMMON_TYPES_SCHEMA_KEY, SPEC_VERSION_MAP)
+    self._common_types_schema = registry.apply_modifiers(
+        registry.bundled(version, COMMON_TYPES_SCHEMA_KEY, SPEC_VERSION_MAP),
+        self._schema_modifiers,
     )
 
     # Process catalogs
     for config in catalogs:
-      catalog_schema = config.provider.load()
-      catalog_schema = self._apply_modifiers(catalog_schema)
-      catalog = A2uiCatalog(
-          version=version,
-          name=config.name,
-          catalog_schema=catalog_schema,
-          s2c_schema=self._server_to_client_schema,
-          common_types_schema=self._common_types_schema,
-      )
+      # Stamped before loading, so a concurrent edit is picked up by `reload`.
+      stamp = _provider_stamp(config.provider)
+      catalog = self._load_catalog(version, config)
+      self._catalog_configs.append(config)
+      self._catalog_stamps.append(stamp)
       self._supported_catalogs.append(catalog)
       self._catalog_example_paths[catalog.catalog_id] = config.examples_path
+      if config.examples_path:
+        self._examples_stamps[config.examples_path] = examples_stamp(
+            config.examples_path
+        )
+
+  def _load_catalog(self, version: str, config: CatalogConfig) -> A2uiCatalog:
+    """Loads a catalog, through the disk cache if one is configured."""
+    catalog_schema = config.provider.load()
+    key = None
+    if self._catalog_disk_cache is not None:
+      # Keyed before the modifiers run, since they may modify in place.
+      key = self._catalog_disk_cache.key(
+          version, catalog_schema, self._schema_modifiers
+      )
+    if key is None:
+      catalog_schema = self._schema_registry.apply_modifiers(
+          catalog_schema, self._schema_modifiers
+      )
+      return self._new_catalog(
+          version, config, catalog_schema, self._load_artifacts(config, catalog_schema)
+      )
+
+    def process():
+      modified_schema = self._apply_modifiers(catalog_schema)
+      # Stale artifacts are dropped by the catalog, so they are rebuilt here
+      # rather than persisted. Not interned, so the catalog returned below
+      # carries the artifacts.
+      catalog = self._build_catalog(
+          version,
+          config,
+          modified_schema,
+          self._load_artifacts(config, modified_schema),
+      )
+      return modified_schema, catalog.artifacts or build_catalog_artifacts(catalog)
+
+    modified_schema, artifacts = self._catalog_disk_cache.get_or_create(key, process)
+    return self._new_catalog(
+        version, config, self._schema_registry.intern(modified_schema), artifacts
+    )
+
+  def _new_catalog(
+      self,
+      version: str,
+      config: CatalogConfig,
+      catalog_schema: dict[str, Any],
+      artifacts: Optional[CatalogArtifacts] = None,
+  ) -> A2uiCatalog:
+    return intern_catalog(
+        self._build_catalog(version, config, catalog_schema, artifacts)
+    )
+
+  def _build_catalog(
+      self,
+      version: str,
+      config: CatalogConfig,
+      catalog_schema: dict[str, Any],
+      artifacts: Optional[CatalogArtifacts] = None,
+  ) -> A2uiCatalog:
+    return A2uiCatalog(
+        version=version,
+        name=config.name,
+        catalog_schema=catalog_schema,
+        s2c_schema=self._server_to_client_schema,
+        common_types_schema=self._common_types_schema,
+        artifacts=artifacts,
+    )
+
+  def _load_artifacts(
+      self, config: CatalogConfig, catalog_schema: dict[str, Any]
+  ) -> Optional[CatalogArtifacts]:
+    """Returns the build-time artifacts of a catalog, if they still apply."""
+    if self._schema_modifiers:
+      return None
+    # Providers may implement `load` only.
+    load_artifacts = getattr(config.provider, "load_artifacts", None)
+    artifacts = load_artifacts() if load_artifacts else None
+    if artifacts is None or artifacts.catalog_id != catalog_schema.get(CATALOG_ID_KEY):
+      return None
+    return artifacts
+
+  def reload(self) -> CatalogReload:
+    """Applies the changes of the catalog and example files since the last load.
+
+    Changed catalogs are loaded, and their validators and LLM instructions
+    compiled, before they replace the previous versions; unchanged catalogs keep
+    their compiled state. A catalog that fails to load keeps serving its
+    previous version. Changed examples are reindexed, reading only the changed
+    files.
+
+    Returns:
+      The changes that were applied.
+    """
+    with self._reload_lock:
+      reloaded = []
+      failed = []
+      catalogs = list(self._supported_catalogs)
+      for index, config in enumerate(self._catalog_configs):
+        stamp = _provider_stamp(config.provider)
+        if stamp is None or stamp == self._catalog_stamps[index]:
+          continue
+        catalog = None
+        try:
+          catalog = self._load_catalog(self._version, config)
+          _compile_catalog(catalog)
+        except Exception as e:
+          logging.warning(f"Could not reload catalog '{config.name}': {e}")
+          if catalog is not None:
+            self._schema_registry.release(catalog.catalog_schema)
+          failed.append(config.name)
+          continue
+        # The replaced schema is no longer shared once nobody else loads it.
+        self._schema_registry.release(catalogs[index].catalog_schema)
+        catalogs[index] = catalog
+        self._catalog_stamps[index] = stamp
+        reloaded.append(config.name)
+
+      if reloaded:
+        # Swap the catalogs in, then drop the entries built from the replaced
+        # ones only.
+        replaced = {
+            catalog_id
+            for old, new in zip(self._supported_catalogs, catalogs)
+            if old is not new
+            for catalog_id in (old.catalog_id, new.catalog_id)
+        }
+        self._catalog_example_paths = {
+            catalog.catalog_id: config.examples_path
+            for catalog, config in zip(catalogs, self._catalog_configs)
+        }
+        self._supported_catalogs = catalogs
+        generations = dict(self._catalog_generations)
+        for catalog_id in replaced:
+          generations[catalog_id] = generations.get(catalog_id, 0) + 1
+        self._catalog_generations = generations
+        if self._prompt_cache is not None:
+          self._prompt_cache.evict(lambda _, entry: entry[3][0] in replaced)
+        if self._inline_catalog_cache is not None:
+          self._inline_catalog_cache.evict(lambda key, _: key[1] in replaced)
+
+      changed_examples = []
+      for path, previous in self._examples_stamps.items():
+        stamp = examples_stamp(path)
+        self._examples_checks[path] = (time.monotonic(), stamp)
+        if stamp != previous:
+          # Reindexed here rather than by the next request selecting examples.
+          get_example_retriever(path)
+          self._examples_stamps[path] = stamp
+          changed_examples.append(path)
+
+      return CatalogReload(
+          catalogs=tuple(reloaded),
+          examples=tuple(changed_examples),
+          failed=tuple(failed),
+      )
+
+  def watch(
+      self,
+      interval: float = DEFAULT_WATCH_INTERVAL_SECONDS,
+      on_reload: Optional[Callable[[CatalogReload], None]] = None,
+  ) -> CatalogWatcher:
+    """Calls `reload` every `interval` seconds in a background thread.
+
+    Args:
+      interval: Seconds between two checks for changes.
+      on_reload: Optional callback receiving the changes of each reload that
+        changed something.
+
+    Returns:
+      The watcher; call its `stop` method (or use it as a context manager) to
+      stop watching.
+    """
+    return CatalogWatcher(self.reload, interval, on_reload)
 
   def _select_catalog(
       self, client_ui_capabilities: Optional[dict[str, Any]] = None
@@ -151,20 +460,7 @@ class A2uiSchemaManager(InferenceStrategy):
             base_catalog = agent_supported_catalogs[cscid]
             break
 
-      merged_schema = copy.deepcopy(base_catalog.catalog_schema)
-
-      for inline_catalog_schema in inline_catalogs:
-        inline_catalog_schema = self._apply_modifiers(inline_catalog_schema)
-        inline_components = inline_catalog_schema.get(CATALOG_COMPONENTS_KEY, {})
-        merged_schema[CATALOG_COMPONENTS_KEY].update(inline_components)
-
-      return A2uiCatalog(
-          version=self._version,
-          name=INLINE_CATALOG_NAME,
-          catalog_schema=merged_schema,
-          s2c_schema=self._server_to_client_schema,
-          common_types_schema=self._common_types_schema,
-      )
+      return self._merge_inline_catalogs(base_catalog, inline_catalogs)
 
     if not client_supported_catalog_ids:
       return self._supported_catalogs[0]
@@ -179,25 +475,143 @@ class A2uiSchemaManager(InferenceStrategy):
         f" are: {[c.catalog_id for c in self._supported_catalogs]}"
     )
 
+  def _merge_inline_catalogs(
+      self, base_catalog: A2uiCatalog, inline_catalogs: list[dict[str, Any]]
+  ) -> A2uiCatalog:
+    """Merges inline catalog components on top of the base catalog.
+
+    Merged catalogs are cached by the content of the inline catalogs, so
+    repeated requests reuse the same catalog and its compiled validator.
+
+    Raises:
+      ValueError: If the inline catalogs exceed `max_inline_catalog_bytes`.
+    """
+    try:
+      inline_json = canonical_json(inline_catalogs)
+    except (TypeError, ValueError) as e:
+      raise ValueError(f"Inline catalogs are not valid JSON: {e}") from e
+    inline_bytes = inline_json.encode(ENCODING)
+    inline_size = len(inline_bytes)
+    if inline_size > self._max_inline_catalog_bytes:
+      raise ValueError(
+          f"Inline catalogs are too large: {inline_size} bytes exceeds the limit"
+          f" of {self._max_inline_catalog_bytes} bytes."
+      )
+
+    inline_digest = hashlib.sha256(inline_bytes).hexdigest()
+    cache_key = self._inline_catalog_key(base_catalog.catalog_id, inline_digest)
+    if self._inline_catalog_cache is not None:
+      cached = self._inline_catalog_cache.get(cache_key)
+      if cached is not None:
+        return cached
+
+    merged_schema = copy.deepcopy(base_catalog.catalog_schema)
+
+    for inline_catalog_schema in inline_catalogs:
+      inline_catalog_schema = self._apply_modifiers(inline_catalog_schema)
+      inline_components = inline_catalog_schema.get(CATALOG_COMPONENTS_KEY, {})
+      # Cached catalogs are shared between requests, so don't alias the
+      # client's component definitions.
+      merged_schema[CATALOG_COMPONENTS_KEY].update(copy.deepcopy(inline_components))
+
+    catalog = A2uiCatalog(
+        version=self._version,
+        name=INLINE_CATALOG_NAME,
+        catalog_schema=merged_schema,
+        s2c_schema=self._server_to_client_schema,
+        common_types_schema=self._common_types_schema,
+        origin=CatalogOrigin(base_catalog.catalog_id, inline_digest=inline_digest),
+    )
+    if self._inline_catalog_cache is not None:
+      self._inline_catalog_cache.put(cache_key, catalog)
+    return catalog
+
+  def _inline_catalog_key(self, catalog_id: str, inline_digest: str) -> Hashable:
+    return (
+        self._catalog_generations.get(catalog_id, 0),
+        catalog_id,
+        inline_digest,
+    )
+
+  def inline_catalog_cache_info(self) -> Optional[CacheInfo]:
+    """Returns the hit/miss statistics of the merged inline catalog cache."""
+    if self._inline_catalog_cache is None:
+      return None
+    return self._inline_catalog_cache.cache_info()
+
+  def find_catalog(
+      self, name: str, origin: Optional[CatalogOrigin] = None
+  ) -> Optional[A2uiCatalog]:
+    """Returns the catalog `name`, derived from the loaded catalogs as in `origin`.
+
+    Rebuilds the catalogs that catalog references (see `catalog_refs`) point
+    to, e.g. catalogs pruned by another process. Catalogs merged with inline
+    catalogs are only found while they are in the inline catalog cache, since
+    the inline catalogs are not part of the reference.
+
+    Returns:
+      The catalog, or None if this manager cannot build it.
+    """
+    if origin is None:
+      return next((c for c in self._supported_catalogs if c.name == name), None)
+    catalog = next(
+        (c for c in self._supported_catalogs if c.catalog_id == origin.catalog_id),
+        None,
+    )
+    if catalog is not None and origin.inline_digest:
+      if self._inline_catalog_cache is None:
+        return None
+      catalog = self._inline_catalog_cache.get(
+          self._inline_catalog_key(origin.catalog_id, origin.inline_digest)
+      )
+    if catalog is None:
+      return None
+    return catalog.with_pruning(
+        list(origin.allowed_components), list(origin.allowed_messages)
+    )
+
   def get_selected_catalog(
       self,
       client_ui_capabilities: Optional[dict[str, Any]] = None,
       allowed_components: Optional[list[str]] = None,
       allowed_messages: Optional[list[str]] = None,
+      query: Optional[str] = None,
   ) -> A2uiCatalog:
-    """Gets the selected catalog after selection and component pruning."""
+    """Gets the selected catalog after selection and component pruning.
+
+    If `allowed_components` is not given, the components are predicted from
+    `query` by the `component_subsetter`, if any.
+    """
     catalog = self._select_catalog(client_ui_capabilities)
+    if not allowed_components and query is not None and self._component_subsetter:
+      allowed_components = self._component_subsetter.predict(catalog, query)
     pruned_catalog = catalog.with_pruning(allowed_components, allowed_messages)
     return pruned_catalog
 
-  def load_examples(self, catalog: A2uiCatalog, validate: bool = False) -> str:
-    """Loads examples for a catalog."""
+  def load_examples(
+      self,
+      catalog: A2uiCatalog,
+      validate: bool = False,
+      selection: Optional[ExampleSelection] = None,
+  ) -> str:
+    """Loads examples for a catalog, optionally only the most relevant ones."""
     if catalog.catalog_id in self._catalog_example_paths:
       return catalog.load_examples(
-          self._catalog_example_paths[catalog.catalog_id], validate=validate
+          self._catalog_example_paths[catalog.catalog_id],
+          validate=validate,
+          selection=selection,
       )
     return ""
 
+  def prompt_cache_info(self) -> Optional[CacheInfo]:
+    """Returns the hit/miss statistics of the prompt cache, if it is enabled."""
+    return self._prompt_cache.cache_info() if self._prompt_cache is not None else None
+
+  def clear_prompt_cache(self) -> None:
+    """Drops all memoized system prompts."""
+    if self._prompt_cache is not None:
+      self._prompt_cache.clear()
+
   def generate_system_prompt(
       self,
       role_description: str,
@@ -209,8 +623,55 @@ class A2uiSchemaManager(InferenceStrategy):
       include_schema: bool = False,
       include_examples: bool = False,
       validate_examples: bool = False,
+      schema_options: Optional[CompactRenderOptions] = None,
+      prefix_stable: bool = False,
+      example_selection: Optional[ExampleSelection] = None,
+      query: Optional[str] = None,
   ) -> str:
-    """Assembles the final system instruction for the LLM."""
+    """Assembles the final system instruction for the LLM.
+
+    Pass `schema_options` to embed a compact, optionally token-budgeted
+    rendering of the schema instead of the verbatim schemas.
+
+    With `prefix_stable`, the schema (with canonically sorted keys) and the
+    examples come first and the role, workflow and UI descriptions last, so
+    prompts of different agents using the same catalog share a prefix that LLM
+    providers can cache. See `generate_prompt_prefix`.
+
+    With `example_selection`, only the examples most relevant to its query are
+    included instead of all of them. In the prefix-stable layout, the selected
+    examples then come last, after the per-agent descriptions.
+
+    `query` is the user's request. With a `component_subsetter`, only the
+    components predicted for it are included.
+    """
+    if not allowed_components and query is not None and self._component_subsetter:
+      # Predict before the cache lookup, so requests needing the same
+      # components share cache entries.
+      allowed_components = self._component_subsetter.predict(
+          self._select_catalog(client_ui_capabilities), query
+      )
+    cache_key = self._prompt_cache_key(
+        role_description,
+        workflow_description,
+        ui_description,
+        client_ui_capabilities,
+        allowed_components,
+        allowed_messages,
+        include_schema,
+        include_examples,
+        validate_examples,
+        schema_options,
+        prefix_stable,
+        self._selected_examples_key(
+            client_ui_capabilities, include_examples, example_selection
+        ),
+    )
+    if cache_key is not None:
+      cached = self._prompt_cache.get(cache_key, is_fresh=self._prompt_entry_fresh)
+      if cached is not None:
+        return cached[0]
+
     parts = [role_description]
 
     workflow = DEFAULT_WORKFLOW_RULES
@@ -221,16 +682,272 @@ class A2uiSchemaManager(InferenceStrategy):
     if ui_description:
       parts.append(f"## UI Description:\n{ui_description}")
 
+    schema, examples, examples_path, stamp, catalog_key = self._render_catalog_context(
+        client_ui_capabilities,
+        allowed_components,
+        allowed_messages,
+        include_schema,
+        include_examples,
+        validate_examples,
+        schema_options,
+        example_selection,
+        canonical=prefix_stable,
+    )
+    if not prefix_stable:
+      parts = parts + [schema, examples]
+    elif example_selection is None:
+      parts = [schema, examples] + parts
+    else:
+      parts = [schema] + parts + [examples]
+
+    prompt = "\n\n".join(part for part in parts if part)
+    if cache_key is not None:
+      self._prompt_cache.put(cache_key, (prompt, examples_path, stamp, catalog_key))
+    return prompt
+
+  def generate_prompt_prefix(
+      self,
+      client_ui_capabilities: Optional[dict[str, Any]] = None,
+      allowed_components: Optional[list[str]] = None,
+      allowed_messages: Optional[list[str]] = None,
+      include_schema: bool = False,
+      include_examples: bool = False,
+      validate_examples: bool = False,
+      schema_options: Optional[CompactRenderOptions] = None,
+  ) -> "PromptPrefix":
+    """Returns the cacheable prefix of prefix-stable system prompts.
+
+    Every `generate_system_prompt(..., prefix_stable=True)` prompt built with
+    the same arguments starts with this prefix, whatever its role, workflow and
+    UI descriptions. Use `PromptPrefix.content_hash` to create and look up
+    explicit LLM context caches.
+    """
+    # Prefix entries share the prompt cache; a None role keeps their keys apart.
+    cache_key = self._prompt_cache_key(
+        None,
+        None,
+        None,
+        client_ui_capabilities,
+        allowed_components,
+        allowed_messages,
+        include_schema,
+        include_examples,
+        validate_examples,
+        schema_options,
+    )
+    if cache_key is not None:
+      cached = self._prompt_cache.get(cache_key, is_fresh=self._prompt_entry_fresh)
+      if cached is not None:
+        return cached[0]
+
+    schema, examples, examples_path, stamp, catalog_key = self._render_catalog_context(
+        client_ui_capabilities,
+        allowed_components,
+        allowed_messages,
+        include_schema,
+        include_examples,
+        validate_examples,
+        schema_options,
+        None,
+        canonical=True,
+    )
+    text = "\n\n".join(part for part in (schema, examples) if part)
+    prefix = PromptPrefix(
+        text=text, content_hash=hashlib.sha256(text.encode(ENCODING)).hexdigest()
+    )
+    if cache_key is not None:
+      self._prompt_cache.put(cache_key, (prefix, examples_path, stamp, catalog_key))
+    return prefix
+
+  def _selected_examples_key(
+      self,
+      client_ui_capabilities: Optional[dict[str, Any]],
+      include_examples: bool,
+      example_selection: Optional[ExampleSelection],
+  ) -> Optional[tuple[str, ...]]:
+    """Returns the files selected by `example_selection`, for the prompt cache key.
+
+    Keying on the selected files rather than the free-text query lets requests
+    that select the same examples share a cache entry. Selections are memoized
+    until the files change, which is checked at most once per
+    `examples_check_interval`, so repeated queries neither stat nor score.
+    """
+    if self._prompt_cache is None or not include_examples or example_selection is None:
+      return None
+    catalog = self._select_catalog(client_ui_capabilities)
+    examples_path = self._catalog_example_paths.get(catalog.catalog_id)
+    if not examples_path:
+      return ()
+    stamp = self._checked_examples_stamp(examples_path)
+    selection_key = (
+        examples_path,
+        example_selection.query,
+        example_selection.top_k,
+        example_selection.max_tokens,
+    )
+    cached = self._selected_examples.get(
+        selection_key, is_fresh=lambda entry: entry[1] == stamp
+    )
+    if cached is not None:
+      return cached[0]
+    selected = get_example_retriever(
+        examples_path, self._examples_check_interval
+    ).select(
+        example_selection.query,
+        example_selection.top_k,
+        example_selection.max_tokens,
+    )
+    paths = tuple(example.path for example in selected)
+    self._selected_examples.put(selection_key, (paths, stamp))
+    return paths
+
+  def _render_catalog_context(
+      self,
+      client_ui_capabilities: Optional[dict[str, Any]],
+      allowed_components: Optional[list[str]],
+      allowed_messages: Optional[list[str]],
+      include_schema: bool,
+      include_examples: bool,
+      validate_examples: bool,
+      schema_options: Optional[CompactRenderOptions],
+      example_selection: Optional[ExampleSelection],
+      canonical: bool,
+  ) -> tuple[Optional[str], Optional[str], Optional[str], tuple, tuple[str, int]]:
+    """Renders the schema and examples sections of the system prompt.
+
+    Returns:
+      The schema and examples sections (None when omitted), and the examples
+      path and stamp and the catalog ID and generation for the prompt cache.
+    """
+    # Read before selecting the catalog, so a concurrent reload makes the entry
+    # stale rather than the reverse.
+    generations = self._catalog_generations
     selected_catalog = self.get_selected_catalog(
         client_ui_capabilities, allowed_components, allowed_messages
     )
 
+    schema = None
     if include_schema:
-      parts.append(selected_catalog.render_as_llm_instructions())
+      schema = selected_catalog.render_as_llm_instructions(
+          schema_options, canonical=canonical
+      )
 
+    examples = None
+    examples_path = None
     if include_examples:
-      examples_str = self.load_examples(selected_catalog, validate=validate_examples)
+      examples_path = self._catalog_example_paths.get(selected_catalog.catalog_id)
+      # Stamp the files before reading them, so a concurrent edit is picked up
+      # by the next call rather than cached with stale content.
+      stamp = examples_stamp(examples_path)
+      if examples_path:
+        self._examples_checks[examples_path] = (time.monotonic(), stamp)
+      examples_str = self.load_examples(
+          selected_catalog, validate=validate_examples, selection=example_selection
+      )
       if examples_str:
-        parts.append(f"### Examples:\n{examples_str}")
+        examples = f"### Examples:\n{examples_str}"
+    else:
+      stamp = examples_stamp(None)
+    catalog_id = (
+        selected_catalog.origin.catalog_id
+        if selected_catalog.origin
+        else selected_catalog.catalog_id
+    )
+    catalog_key = (catalog_id, generations.get(catalog_id, 0))
+    return schema, examples, examples_path, stamp, catalog_key
+
+  def _prompt_cache_key(
+      self,
+      role_description: str,
+      workflow_description: str,
+      ui_description: str,
+      client_ui_capabilities: Optional[dict[str, Any]],
+      allowed_components: Optional[list[str]],
+      allowed_messages: Optional[list[str]],
+      *options: Hashable,
+  ) -> Optional[Hashable]:
+    """Returns the prompt cache key, or None if the prompt can't be cached."""
+    if self._prompt_cache is None:
+      return None
+    try:
+      capabilities_key = (
+          canonical_json(client_ui_capabilities) if client_ui_capabilities else None
+      )
+    except (TypeError, ValueError):
+      return None
+    return (
+        role_description,
+        workflow_description,
+        ui_description,
+        capabilities_key,
+        tuple(allowed_components) if allowed_components else None,
+        tuple(allowed_messages) if allowed_messages else None,
+        options,
+    )
+
+  def _prompt_entry_fresh(
+      self, entry: tuple[Any, Optional[str], tuple, tuple[str, int]]
+  ) -> bool:
+    """Whether the catalog and example files of a prompt cache entry are unchanged.
+
+    The files are stat-ed at most once per `examples_check_interval`, so
+    prompt cache hits don't glob and stat the example directory every time.
+    """
+    _, examples_path, stamp, (catalog_id, generation) = entry
+    if self._catalog_generations.get(catalog_id, 0) != generation:
+      return False
+    if not examples_path:
+      return True
+    return stamp == self._checked_examples_stamp(examples_path)
+
+  def _checked_examples_stamp(self, examples_path: str) -> tuple:
+    """Returns the stamp of the example files, taken at most once per interval."""
+    now = time.monotonic()
+    checked = self._examples_checks.get(examples_path)
+    if checked is None or now - checked[0] >= self._examples_check_interval:
+      checked = (now, examples_stamp(examples_path))
+      self._examples_checks[examples_path] = checked
+    return checked[1]
+
+
+class _PreloadedCatalogProvider(A2uiCatalogProvider):
+  """Serves a catalog already loaded by another provider, then delegates to it."""
+
+  def __init__(self, source: Any, catalog_schema: dict[str, Any]):
+    self._source = source
+    self._catalog_schema = catalog_schema
+
+  def load(self) -> dict[str, Any]:
+    # Only the first load is preloaded; reloads get the current catalog.
+    catalog_schema, self._catalog_schema = self._catalog_schema, None
+    if catalog_schema is None:
+      return self._source.load()
+    return catalog_schema
+
+  def load_artifacts(self) -> Optional[CatalogArtifacts]:
+    load_artifacts = getattr(self._source, "load_artifacts", None)
+    return load_artifacts() if load_artifacts else None
+
+  def stamp(self) -> Optional[Hashable]:
+    return _provider_stamp(self._source)
+
+
+def _provider_stamp(provider: Any) -> Optional[Hashable]:
+  # Providers may implement `load` only.
+  stamp = getattr(provider, "stamp", None)
+  return stamp() if stamp else None
+
+
+async def _aload_catalog(provider: Any) -> dict[str, Any]:
+  # Providers may implement `load` only.
+  aload = getattr(provider, "aload", None)
+  if aload is not None:
+    return await aload()
+  import asyncio
+
+  return await asyncio.to_thread(provider.load)
+
 
-    return "\n\n".join(parts)
+def _compile_catalog(catalog: A2uiCatalog) -> None:
+  catalog.validator
+  catalog.render_as_llm_instructions()
@@ -0,0 +1,239 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Helpers for running A2UI validation off the calling thread or process."""
+
+import collections
+import itertools
+import json
+import mmap
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+if TYPE_CHECKING:
+  from .catalog import A2uiCatalog
+  from .validator import A2uiValidator
+
+# Validators preloaded in a worker process, keyed by catalog fingerprint.
+_WORKER_VALIDATORS: Dict[str, "A2uiValidator"] = {}
+
+# Number of batches kept in flight per worker by `validate_many`.
+_BATCHES_IN_FLIGHT_PER_WORKER = 2
+
+
+@dataclass(frozen=True)
+class ValidationResult:
+  """The outcome of validating one payload in `A2uiValidator.validate_many`.
+
+  Attributes:
+    index: The position of the payload in the input (blank JSONL lines are
+      not counted).
+    error: The validation or parse error message, or None if the payload is
+      valid.
+    elapsed: Wall-clock seconds spent parsing and validating the payload.
+  """
+
+  index: int
+  error: Optional[str]
+  elapsed: float
+
+  @property
+  def ok(self) -> bool:
+    return self.error is None
+
+
+def _init_worker_validators(catalogs: Sequence["A2uiCatalog"]) -> None:
+  """Process pool initializer that compiles one validator per catalog."""
+  from .validator import A2uiValidator
+
+  for catalog in catalogs:
+    validator = A2uiValidator(catalog)
+    _WORKER_VALIDATORS[validator.catalog_fingerprint] = validator
+
+
+def _get_worker_validator(fingerprint: str) -> "A2uiValidator":
+  validator = _WORKER_VALIDATORS.get(fingerprint)
+  if validator is None:
+    raise RuntimeError(
+        "No validator is preloaded for this catalog in the worker process. Create"
+        " the pool with create_validator_process_pool()."
+    )
+  return validator
+
+
+def _validate_in_worker(
+    fingerprint: str,
+    a2ui_json: Any,
+    root_id: Optional[str],
+    strict_integrity: bool,
+    catalog: Optional["A2uiCatalog"] = None,
+) -> None:
+  """Validates a payload with the validator preloaded in this worker process.
+
+  If `catalog` is given and no validator is preloaded for it (the pool was not
+  created with `create_validator_process_pool`), one is compiled and kept for
+  the following calls.
+  """
+  if catalog is not None and fingerprint not in _WORKER_VALIDATORS:
+    _init_worker_validators((catalog,))
+  _get_worker_validator(fingerprint).validate(
+      a2ui_json, root_id=root_id, strict_integrity=strict_integrity
+  )
+
+
+class _ValidatorProcessPool(ProcessPoolExecutor):
+  """A process pool whose workers preload the validators of `catalogs`."""
+
+  def __init__(self, catalogs: Sequence["A2uiCatalog"], max_workers: Optional[int]):
+    super().__init__(
+        max_workers=max_workers,
+        initializer=_init_worker_validators,
+        initargs=(tuple(catalogs),),
+    )
+    self.catalog_fingerprints = frozenset(catalog.fingerprint for catalog in catalogs)
+
+
+def _preloads_catalog(executor: Any, fingerprint: str) -> bool:
+  """Whether `executor` was created with a validator for the given catalog."""
+  return isinstance(executor, _ValidatorProcessPool) and (
+      fingerprint in executor.catalog_fingerprints
+  )
+
+
+def create_validator_process_pool(
+    catalogs: Sequence["A2uiCatalog"], max_workers: Optional[int] = None
+) -> ProcessPoolExecutor:
+  """Creates a process pool whose workers hold compiled validators.
+
+  Each worker compiles the validators for `catalogs` once, when it starts, so
+  individual validation calls only ship the payload across the process boundary.
+  Pass the returned executor to `A2uiValidator.validate_async`.
+
+  Args:
+    catalogs: The catalogs to preload in every worker.
+    max_workers: The maximum number of worker processes.
+
+  Returns:
+    A ProcessPoolExecutor ready for validation calls.
+  """
+  return _ValidatorProcessPool(catalogs, max_workers)
+
+
+def iter_jsonl(path: Union[str, os.PathLike]) -> Iterator[bytes]:
+  """Yields the non-blank lines of a JSONL file without loading it into memory.
+
+  The file is memory-mapped, so multi-GB corpora are paged in by the OS as the
+  iterator advances. Lines are returned as raw bytes, ready for `json.loads`.
+  """
+  with open(path, "rb") as f:
+    if os.fstat(f.fileno()).st_size == 0:
+      return
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+      for line in iter(mm.readline, b""):
+        line = line.strip()
+        if line:
+          yield line
+
+
+def _validate_one(
+    validator: "A2uiValidator", index: int, item: Any, strict_integrity: bool
+) -> ValidationResult:
+  start = time.perf_counter()
+  try:
+    if isinstance(item, (str, bytes)):
+      item = json.loads(item)
+    validator.validate(item, strict_integrity=strict_integrity)
+    error = None
+  except Exception as e:  # Report every failure; never abort the whole corpus.
+    error = str(e) or type(e).__name__
+  return ValidationResult(index, error, time.perf_counter() - start)
+
+
+def _validate_batch_in_worker(
+    fingerprint: str, batch: List[Tuple[int, Any]], strict_integrity: bool
+) -> List[ValidationResult]:
+  validator = _get_worker_validator(fingerprint)
+  return [
+      _validate_one(validator, index, item, strict_integrity) for index, item in batch
+  ]
+
+
+def validate_many(
+    validator: "A2uiValidator",
+    payloads: Union[Iterable[Any], str, os.PathLike],
+    workers: Optional[int] = None,
+    fail_fast: bool = False,
+    strict_integrity: bool = True,
+    batch_size: int = 16,
+) -> Iterator[ValidationResult]:
+  """Validates a stream of payloads, optionally sharded across processes.
+
+  See `A2uiValidator.validate_many` for details.
+  """
+  if isinstance(payloads, (str, os.PathLike)):
+    payloads = iter_jsonl(payloads)
+  indexed = enumerate(payloads)
+
+  if not workers or workers <= 1:
+    for index, item in indexed:
+      result = _validate_one(validator, index, item, strict_integrity)
+      yield result
+      if fail_fast and not result.ok:
+        return
+    return
+
+  batches = iter(lambda: list(itertools.islice(indexed, batch_size)), [])
+  pool = create_validator_process_pool([validator.catalog], max_workers=workers)
+  try:
+    pending = collections.deque(
+        pool.submit(
+            _validate_batch_in_worker,
+            validator.catalog_fingerprint,
+            batch,
+            strict_integrity,
+        )
+        for batch in itertools.islice(batches, workers * _BATCHES_IN_FLIGHT_PER_WORKER)
+    )
+    while pending:
+      results = pending.popleft().result()
+      # Keep the window full so workers stay busy while results are consumed.
+      for batch in itertools.islice(batches, 1):
+        pending.append(
+            pool.submit(
+                _validate_batch_in_worker,
+                validator.catalog_fingerprint,
+                batch,
+                strict_integrity,
+            )
+        )
+      for result in results:
+        yield result
+        if fail_fast and not result.ok:
+          return
+  finally:
+    pool.shutdown(wait=True, cancel_futures=True)
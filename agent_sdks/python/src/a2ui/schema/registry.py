@@ -0,0 +1,230 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""A process-wide registry of shared, fingerprinted schemas.
+
+Processes often hold several schema managers (one per protocol version per
+agent, for an orchestrator and its sub-agents), each of which would otherwise
+read the same bundled schemas and rebuild the same modified copies. The
+`SchemaRegistry` loads each bundled schema once, memoizes the result of each
+schema modifier per input schema, and interns schemas by content so equal
+schemas share one copy.
+
+Registered schemas are shared and must not be modified. Each `intern` and
+`apply_modifiers` call takes a reference to the returned schema, which holders
+return with `release` once they stop using it (e.g. when a reloaded catalog
+replaces its previous version), so schemas nobody holds are forgotten.
+"""
+
+import copy
+import sys
+import threading
+from typing import Any, Callable, Dict, NamedTuple, Optional, Sequence, Tuple
+
+from .disk_cache import modifier_identity
+from .utils import canonical_hash, load_from_bundled_resource
+
+Schema = Dict[str, Any]
+
+
+class RegistryStats(NamedTuple):
+  """Statistics of a `SchemaRegistry`.
+
+  Attributes:
+    schemas: The number of distinct schemas held.
+    hits: The number of loads, modifications and interning requests served
+      with an existing schema.
+    misses: The number of schemas that had to be loaded or built.
+    bytes_held: The estimated memory of the schemas held.
+    bytes_saved: The estimated memory of the duplicate copies not kept.
+  """
+
+  schemas: int
+  hits: int
+  misses: int
+  bytes_held: int
+  bytes_saved: int
+
+
+def _deep_sizeof(obj: Any) -> int:
+  """Estimates the memory of a JSON value, counting shared objects once."""
+  seen = set()
+  size = 0
+  stack = [obj]
+  while stack:
+    node = stack.pop()
+    if id(node) in seen:
+      continue
+    seen.add(id(node))
+    size += sys.getsizeof(node)
+    if isinstance(node, dict):
+      stack.extend(node.keys())
+      stack.extend(node.values())
+    elif isinstance(node, list):
+      stack.extend(node)
+  return size
+
+
+class SchemaRegistry:
+  """Shares bundled schemas and schema modifier results by content.
+
+  All methods are thread-safe.
+  """
+
+  def __init__(self):
+    self._lock = threading.RLock()
+    # Fingerprint -> (schema, estimated size).
+    self._schemas: Dict[str, Tuple[Schema, int]] = {}
+    # Fingerprint -> the number of references taken and not released.
+    self._refs: Dict[str, int] = {}
+    # id() of each registered schema -> its fingerprint.
+    self._fingerprints: Dict[int, str] = {}
+    self._bundled: Dict[Tuple[str, str], Optional[Schema]] = {}
+    # (Input fingerprint, modifier identities) -> the modified schema.
+    self._modified: Dict[Tuple[str, Tuple[str, ...]], Schema] = {}
+    self._hits = 0
+    self._misses = 0
+    self._bytes_saved = 0
+
+  def fingerprint(self, schema: Schema) -> str:
+    """Returns the content hash of `schema`, memoized for registered schemas."""
+    with self._lock:
+      fingerprint = self._fingerprints.get(id(schema))
+    return fingerprint if fingerprint is not None else canonical_hash(schema)
+
+  def intern(self, schema: Optional[Schema]) -> Optional[Schema]:
+    """Returns the registered schema equal to `schema`, registering it if new.
+
+    Takes a reference to the returned schema, see `release`.
+    """
+    if schema is None:
+      return None
+    fingerprint = self.fingerprint(schema)
+    with self._lock:
+      self._refs[fingerprint] = self._refs.get(fingerprint, 0) + 1
+      entry = self._schemas.get(fingerprint)
+      if entry is not None:
+        if entry[0] is not schema:
+          self._hits += 1
+          self._bytes_saved += entry[1]
+        return entry[0]
+      self._misses += 1
+      self._schemas[fingerprint] = (schema, _deep_sizeof(schema))
+      self._fingerprints[id(schema)] = fingerprint
+      return schema
+
+  def release(self, schema: Optional[Schema]) -> None:
+    """Returns a reference taken by `intern` or `apply_modifiers`.
+
+    The schema is forgotten, along with the modifier results computing it, once
+    all references to it are released. Holders may keep using it, it is just no
+    longer shared with new holders.
+    """
+    if schema is None:
+      return
+    fingerprint = self.fingerprint(schema)
+    with self._lock:
+      refs = self._refs.get(fingerprint, 0) - 1
+      if refs > 0:
+        self._refs[fingerprint] = refs
+        return
+      self._refs.pop(fingerprint, None)
+      entry = self._schemas.pop(fingerprint, None)
+      if entry is None:
+        return
+      self._fingerprints.pop(id(entry[0]), None)
+      for key in [key for key, value in self._modified.items() if value is entry[0]]:
+        del self._modified[key]
+
+  def bundled(
+      self, version: str, resource_key: str, spec_map: Dict[str, Dict[str, str]]
+  ) -> Optional[Schema]:
+    """Returns a bundled schema resource, reading it once per process."""
+    key = (version, resource_key)
+    with self._lock:
+      if key in self._bundled:
+        schema = self._bundled[key]
+        if schema is not None:
+          self._hits += 1
+          self._bytes_saved += self._schemas[self._fingerprints[id(schema)]][1]
+        return schema
+    schema = self.intern(load_from_bundled_resource(version, resource_key, spec_map))
+    with self._lock:
+      return self._bundled.setdefault(key, schema)
+
+  def apply_modifiers(
+      self,
+      schema: Optional[Schema],
+      modifiers: Sequence[Callable[[Schema], Schema]],
+  ) -> Optional[Schema]:
+    """Returns the shared result of applying `modifiers` to `schema` in order.
+
+    Results are memoized per input schema when all modifiers have a stable
+    name. Modifiers get a private copy of their input, so they may modify it in
+    place. Only the result is registered, and a reference to it taken, see
+    `release`.
+    """
+    if schema is None or not modifiers:
+      return self.intern(schema)
+    identities = tuple(modifier_identity(modifier) for modifier in modifiers)
+    key = (self.fingerprint(schema), identities) if all(identities) else None
+    with self._lock:
+      modified = self._modified.get(key) if key else None
+      if modified is not None:
+        fingerprint = self._fingerprints[id(modified)]
+        self._refs[fingerprint] += 1
+        self._hits += 1
+        self._bytes_saved += self._schemas[fingerprint][1]
+        return modified
+    modified = copy.deepcopy(schema)
+    for modifier in modifiers:
+      modified = modifier(modified)
+      if modified is None:
+        return None
+    modified = self.intern(modified)
+    if key:
+      with self._lock:
+        self._modified.setdefault(key, modified)
+    return modified
+
+  def stats(self) -> RegistryStats:
+    """Returns the number of schemas held and the memory saved by sharing."""
+    with self._lock:
+      return RegistryStats(
+          schemas=len(self._schemas),
+          hits=self._hits,
+          misses=self._misses,
+          bytes_held=sum(size for _, size in self._schemas.values()),
+          bytes_saved=self._bytes_saved,
+      )
+
+  def clear(self) -> None:
+    """Forgets all schemas, e.g. after the bundled resources changed."""
+    with self._lock:
+      self._schemas.clear()
+      self._refs.clear()
+      self._fingerprints.clear()
+      self._bundled.clear()
+      self._modified.clear()
+      self._hits = 0
+      self._misses = 0
+      self._bytes_saved = 0
+
+
+_default_registry = SchemaRegistry()
+
+
+def get_schema_registry() -> SchemaRegistry:
+  """Returns the registry shared by all schema managers of the process."""
+  return _default_registry
@@ -0,0 +1,469 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Renders catalogs as LLM instructions, optionally in a compact form.
+
+The full rendering embeds the server-to-client, common types and catalog
+schemas verbatim. `CompactRenderOptions` trims what the model doesn't need to
+generate valid messages (descriptions, validator-only keywords, indirections
+through single-use definitions) and can fit the schemas into a token budget by
+dropping the least-used components.
+"""
+
+import collections
+import json
+import logging
+import re
+from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from .constants import (
+    A2UI_SCHEMA_BLOCK_END,
+    A2UI_SCHEMA_BLOCK_START,
+    CATALOG_COMPONENTS_KEY,
+)
+
+if TYPE_CHECKING:
+  from .catalog import A2uiCatalog
+
+logger = logging.getLogger(__name__)
+
+S2C_SECTION = "Server To Client Schema"
+COMMON_TYPES_SECTION = "Common Types Schema"
+CATALOG_SECTION = "Catalog Schema"
+COMPONENTS_SECTION = "Components"
+
+# Keywords that constrain validation but carry little meaning for generation.
+VALIDATION_ONLY_KEYWORDS = frozenset({
+    "$schema",
+    "$id",
+    "$comment",
+    "$anchor",
+    "title",
+    "pattern",
+    "format",
+    "minLength",
+    "maxLength",
+    "minItems",
+    "maxItems",
+    "minProperties",
+    "maxProperties",
+    "uniqueItems",
+    "multipleOf",
+    "minimum",
+    "maximum",
+    "exclusiveMinimum",
+    "exclusiveMaximum",
+})
+# Dropped only when they are plain booleans rather than schemas.
+_BOOLEAN_VALIDATION_KEYWORDS = frozenset({
+    "additionalProperties",
+    "unevaluatedProperties",
+})
+# Keywords whose values map names to schemas.
+_NAME_MAP_KEYWORDS = frozenset({
+    "properties",
+    "patternProperties",
+    "$defs",
+    "definitions",
+    "dependentSchemas",
+})
+# Top-level keys of a catalog document that map names to schemas.
+_DOCUMENT_NAME_MAP_KEYS = frozenset({CATALOG_COMPONENTS_KEY, "functions", "styles"})
+# Keywords whose values are data, not schemas.
+_DATA_KEYWORDS = frozenset({"const", "enum", "default", "examples", "required"})
+
+_LOCAL_DEF_REF_PREFIX = "#/$defs/"
+_ABSOLUTE_REF_PATTERN = re.compile(r"^[a-z][a-z0-9+.-]*://[^#]*/")
+_SENTENCE_END_PATTERN = re.compile(r"(?<=[.!?])\s")
+_TOKEN_PATTERN = re.compile(r"[A-Za-z]+|\d+|\S")
+
+
+@dataclass(frozen=True)
+class CompactRenderOptions:
+  """Options for a compact `A2uiCatalog.render_as_llm_instructions`.
+
+  Attributes:
+    max_description_length: None keeps descriptions as they are, 0 strips them,
+      and a positive value keeps only their first sentence, truncated to that
+      many characters.
+    inline_single_use_defs: Whether to inline `$defs` referenced exactly once.
+    drop_validation_keywords: Whether to drop keywords only validators need
+      (`$schema`, `$id`, `pattern`, boolean `additionalProperties`, ...) and
+      shorten absolute `$ref` URLs.
+    component_signatures: Whether to render a TypeScript-like signature per
+      component instead of its JSON schema.
+    include_schemas: Whether to render the message, common types and catalog
+      schemas. Set to False when the model gets them another way, e.g. as
+      structured function arguments (see `a2ui.adk.function_schema`); only the
+      component signatures, if enabled, are rendered then.
+    max_tokens: Optional budget, in estimated tokens, for the rendered
+      instructions. Least-used components are dropped until it is met.
+    component_usage: How often each component is used, e.g. counted from
+      examples or traffic. Components without a count are dropped first; without
+      any usage data, components are dropped from the end of the catalog.
+  """
+
+  max_description_length: Optional[int] = 0
+  inline_single_use_defs: bool = True
+  drop_validation_keywords: bool = True
+  component_signatures: bool = False
+  include_schemas: bool = True
+  max_tokens: Optional[int] = None
+  component_usage: Union[Mapping[str, int], Tuple[Tuple[str, int], ...], None] = None
+
+  def __post_init__(self):
+    # Store usage as a sorted tuple so options stay hashable (and cacheable).
+    if isinstance(self.component_usage, Mapping):
+      object.__setattr__(
+          self, "component_usage", tuple(sorted(self.component_usage.items()))
+      )
+
+
+def estimate_tokens(text: str) -> int:
+  """Returns a rough, tokenizer-independent estimate of the tokens in `text`.
+
+  Words count as one token per four letters, numbers as one per three digits,
+  and every other non-space character as one token, which approximates BPE
+  tokenizers on JSON-heavy prompts.
+  """
+  tokens = 0
+  for match in _TOKEN_PATTERN.finditer(text):
+    piece = match.group()
+    if piece.isalpha():
+      tokens += (len(piece) + 3) // 4
+    elif piece.isdigit():
+      tokens += (len(piece) + 2) // 3
+    else:
+      tokens += 1
+  return tokens
+
+
+def render_sections(
+    catalog: "A2uiCatalog",
+    options: Optional[CompactRenderOptions] = None,
+    canonical: bool = False,
+) -> List[Tuple[str, str]]:
+  """Returns the (title, body) sections of the LLM instructions for `catalog`.
+
+  With `canonical`, schema keys are sorted, so equal schemas always render the
+  same regardless of how they were assembled.
+  """
+  if options is None:
+    s2c_schema = catalog.s2c_schema
+    common_types_schema = catalog.common_types_schema
+    catalog_schema = catalog.catalog_schema
+    signatures = None
+  else:
+    s2c_schema, common_types_schema, catalog_schema = _compact_documents(
+        catalog, options
+    )
+    signatures = None
+    if options.component_signatures:
+      components = catalog_schema.pop(CATALOG_COMPONENTS_KEY, None) or {}
+      items = sorted(components.items()) if canonical else components.items()
+      signatures = "\n".join(
+          _component_signature(name, schema, options) for name, schema in items
+      )
+
+  if options is not None and not options.include_schemas:
+    return [(COMPONENTS_SECTION, signatures)] if signatures else []
+
+  sections = [(S2C_SECTION, _dumps(s2c_schema, canonical) if s2c_schema else "{}")]
+  if (
+      common_types_schema
+      and "$defs" in common_types_schema
+      and common_types_schema["$defs"]
+  ):
+    sections.append((COMMON_TYPES_SECTION, _dumps(common_types_schema, canonical)))
+  sections.append((CATALOG_SECTION, _dumps(catalog_schema, canonical)))
+  if signatures:
+    sections.append((COMPONENTS_SECTION, signatures))
+  return sections
+
+
+def join_sections(sections: List[Tuple[str, str]]) -> str:
+  """Joins sections into the schema block embedded in the system prompt."""
+  parts = [A2UI_SCHEMA_BLOCK_START]
+  parts.extend(f"### {title}:\n{body}" for title, body in sections)
+  parts.append(A2UI_SCHEMA_BLOCK_END)
+  return "\n\n".join(parts)
+
+
+def render_within_budget(
+    catalog: "A2uiCatalog", options: CompactRenderOptions, canonical: bool = False
+) -> str:
+  """Renders `catalog`, dropping least-used components to meet `max_tokens`."""
+  rendered = join_sections(render_sections(catalog, options, canonical))
+  if options.max_tokens is None or estimate_tokens(rendered) <= options.max_tokens:
+    return rendered
+
+  components = list((catalog.catalog_schema or {}).get(CATALOG_COMPONENTS_KEY) or {})
+  usage = dict(options.component_usage or ())
+  # Least used first; among equals, components later in the catalog go first.
+  drop_order = sorted(
+      components,
+      key=lambda name: (usage.get(name, 0), -components.index(name)),
+  )
+  kept = set(components)
+  for name in drop_order[:-1]:
+    kept.discard(name)
+    pruned = catalog.with_pruning(
+        allowed_components=[c for c in components if c in kept]
+    )
+    rendered = join_sections(render_sections(pruned, options, canonical))
+    if estimate_tokens(rendered) <= options.max_tokens:
+      return rendered
+
+  logger.warning(
+      f"Catalog '{catalog.name}' does not fit in {options.max_tokens} tokens even"
+      " with a single component."
+  )
+  return rendered
+
+
+def _dumps(schema: Any, sort_keys: bool = False) -> str:
+  return json.dumps(schema, sort_keys=sort_keys, separators=(",", ":"))
+
+
+def _compact_documents(
+    catalog: "A2uiCatalog", options: CompactRenderOptions
+) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
+  documents = (
+      catalog.s2c_schema or {},
+      catalog.common_types_schema or {},
+      catalog.catalog_schema or {},
+  )
+  all_refs = collections.Counter()
+  for document in documents:
+    _count_refs(document, all_refs)
+  return tuple(
+      _CompactSchema(document, options, all_refs).render() for document in documents
+  )
+
+
+def _count_refs(node: Any, counter: "collections.Counter[str]") -> None:
+  stack = [node]
+  while stack:
+    node = stack.pop()
+    if isinstance(node, dict):
+      for k, v in node.items():
+        if k == "$ref" and isinstance(v, str):
+          counter[v] += 1
+        else:
+          stack.append(v)
+    elif isinstance(node, list):
+      stack.extend(node)
+
+
+class _CompactSchema:
+  """Builds the compact form of one schema document."""
+
+  def __init__(
+      self,
+      document: Dict[str, Any],
+      options: CompactRenderOptions,
+      all_refs: "collections.Counter[str]",
+  ):
+    self._document = document
+    self._options = options
+    self._inline: Dict[str, Any] = {}
+    defs = document.get("$defs")
+    if options.inline_single_use_defs and isinstance(defs, dict):
+      for name, definition in defs.items():
+        local_ref = _LOCAL_DEF_REF_PREFIX + name
+        # Only inline definitions used exactly once, through a plain local
+        # reference; any other reference to the name (from this or another
+        # document, or into the definition) keeps it.
+        suffix = f"#/$defs/{name}"
+        other_refs = sum(
+            count
+            for ref, count in all_refs.items()
+            if ref != local_ref and (ref.endswith(suffix) or f"{suffix}/" in ref)
+        )
+        if all_refs[local_ref] == 1 and not other_refs:
+          self._inline[local_ref] = definition
+
+  def render(self) -> Dict[str, Any]:
+    out = {}
+    for key, value in self._document.items():
+      if self._skip(key, value):
+        continue
+      if key in _DOCUMENT_NAME_MAP_KEYS | _NAME_MAP_KEYWORDS and isinstance(
+          value, dict
+      ):
+        out[key] = {
+            name: self._schema(schema, frozenset())
+            for name, schema in value.items()
+            if not (key == "$defs" and _LOCAL_DEF_REF_PREFIX + name in self._inline)
+        }
+        if key == "$defs" and not out[key]:
+          del out[key]
+      else:
+        out[key] = self._value(key, value, frozenset())
+    return out
+
+  def _skip(self, key: str, value: Any) -> bool:
+    if key == "description" and isinstance(value, str):
+      return not _shorten(value, self._options.max_description_length)
+    if not self._options.drop_validation_keywords:
+      return False
+    return key in VALIDATION_ONLY_KEYWORDS or (
+        key in _BOOLEAN_VALIDATION_KEYWORDS and isinstance(value, bool)
+    )
+
+  def _value(self, key: str, value: Any, expanding: frozenset) -> Any:
+    if key == "description" and isinstance(value, str):
+      return _shorten(value, self._options.max_description_length)
+    if key in _DATA_KEYWORDS:
+      return value
+    if key == "$ref" and isinstance(value, str):
+      if self._options.drop_validation_keywords:
+        return _ABSOLUTE_REF_PATTERN.sub("", value)
+      return value
+    if key in _NAME_MAP_KEYWORDS and isinstance(value, dict):
+      return {name: self._schema(schema, expanding) for name, schema in value.items()}
+    return self._schema(value, expanding)
+
+  def _schema(self, node: Any, expanding: frozenset) -> Any:
+    if isinstance(node, list):
+      return [self._schema(item, expanding) for item in node]
+    if not isinstance(node, dict):
+      return node
+
+    ref = node.get("$ref")
+    if ref in self._inline and ref not in expanding:
+      target = self._schema(self._inline[ref], expanding | {ref})
+      siblings = self._schema({k: v for k, v in node.items() if k != "$ref"}, expanding)
+      if not isinstance(target, dict):
+        return target
+      conflicts = set(target) & set(siblings) - {"description"}
+      if conflicts:
+        return {**siblings, "allOf": [target]}
+      return {**target, **siblings}
+
+    return {
+        key: self._value(key, value, expanding)
+        for key, value in node.items()
+        if not self._skip(key, value)
+    }
+
+
+def _shorten(description: str, max_length: Optional[int]) -> str:
+  if max_length is None:
+    return description
+  if max_length <= 0:
+    return ""
+  first_sentence = _SENTENCE_END_PATTERN.split(description.strip(), maxsplit=1)[0]
+  if len(first_sentence) > max_length:
+    first_sentence = first_sentence[: max_length - 3].rstrip() + "..."
+  return first_sentence
+
+
+def _component_signature(
+    name: str, schema: Dict[str, Any], options: CompactRenderOptions
+) -> str:
+  """Renders a component schema as e.g. `Text extends Base { text: string; }`."""
+  bases: List[str] = []
+  properties: Dict[str, Any] = {}
+  required: Set[str] = set()
+  _collect_object(schema, bases, properties, required)
+
+  fields = []
+  for prop, prop_schema in properties.items():
+    if isinstance(prop_schema, dict) and prop_schema.get("const") == name:
+      continue  # The `component` discriminator (v0.9).
+    optional = "" if prop in required else "?"
+    field = f"{prop}{optional}: {_ts_type(prop_schema)}"
+    description = (
+        prop_schema.get("description") if isinstance(prop_schema, dict) else None
+    )
+    if description:
+      field += f" /* {description} */"
+    fields.append(field)
+
+  head = f"{name} extends {', '.join(bases)}" if bases else name
+  signature = f"{head} {{ {'; '.join(fields)} }}" if fields else f"{head} {{}}"
+  if schema.get("description"):
+    signature += f" // {schema['description']}"
+  return signature
+
+
+def _collect_object(
+    schema: Any, bases: List[str], properties: Dict[str, Any], required: Set[str]
+) -> None:
+  if not isinstance(schema, dict):
+    return
+  if "$ref" in schema:
+    bases.append(_ref_name(schema["$ref"]))
+  properties.update(schema.get("properties") or {})
+  required.update(schema.get("required") or ())
+  for item in schema.get("allOf") or ():
+    _collect_object(item, bases, properties, required)
+
+
+def _ref_name(ref: str) -> str:
+  return ref.rstrip("/").rsplit("/", 1)[-1]
+
+
+def _ts_type(schema: Any, depth: int = 0) -> str:
+  if not isinstance(schema, dict):
+    return "any"
+  if "$ref" in schema:
+    return _ref_name(schema["$ref"])
+  if "const" in schema:
+    return json.dumps(schema["const"])
+  if "enum" in schema:
+    return " | ".join(json.dumps(value) for value in schema["enum"])
+  for keyword, separator in (("oneOf", " | "), ("anyOf", " | "), ("allOf", " & ")):
+    if keyword in schema:
+      types = [_ts_type(item, depth) for item in schema[keyword]]
+      if keyword == "allOf":
+        # Members that only add constraints (e.g. a `format`) don't change the type.
+        types = [t for t in types if t != "any"] or ["any"]
+      return separator.join(types)
+
+  schema_type = schema.get("type")
+  if isinstance(schema_type, list):
+    return " | ".join(_ts_type({**schema, "type": t}, depth) for t in schema_type)
+  if schema_type == "array":
+    item_type = _ts_type(schema.get("items"), depth)
+    return f"({item_type})[]" if " " in item_type else f"{item_type}[]"
+  if schema_type == "object" or "properties" in schema:
+    properties = schema.get("properties")
+    if properties and depth < 2:
+      required = set(schema.get("required") or ())
+      fields = "; ".join(
+          f"{prop}{'' if prop in required else '?'}: {_ts_type(value, depth + 1)}"
+          for prop, value in properties.items()
+      )
+      return f"{{ {fields} }}"
+    if isinstance(schema.get("additionalProperties"), dict):
+      return f"Record<string, {_ts_type(schema['additionalProperties'], depth)}>"
+    return "object"
+  if schema_type == "integer":
+    return "number"
+  if schema_type in ("string", "number", "boolean", "null"):
+    return schema_type
+  return "any"
@@ -0,0 +1,235 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Query-driven selection of the catalog components a request needs.
+
+Narrow agents use a handful of the components of their catalog, yet the prompt
+carries the schema of all of them. `ComponentUsageStats` records which
+components validated outputs used for which request terms, and a
+`ComponentSubsetter` uses those statistics to predict the components a new
+request needs, so the catalog can be pruned with `A2uiCatalog.with_pruning`.
+When the statistics don't cover the request well, no prediction is made and the
+full catalog is used.
+
+Usage Example:
+
+  ```python
+  stats = ComponentUsageStats()
+  # After each successful validation:
+  stats.record(user_message, a2ui_messages)
+
+  subsetter = ComponentSubsetter(stats)
+  catalog = subsetter.select_catalog(catalog, user_message)
+  ```
+"""
+
+import collections
+import threading
+from typing import Any, Dict, Iterable, List, Optional
+
+from .catalog import A2uiCatalog
+from .constants import CATALOG_COMPONENTS_KEY
+from .examples import tokenize
+from .utils import find_component_types
+
+DEFAULT_MAX_TERMS = 10_000
+
+
+class ComponentUsageStats:
+  """Thread-safe statistics of the components used per request term.
+
+  Each recorded output counts once per distinct term of its request and once
+  per distinct component type it uses.
+
+  Requests are free text, so the vocabulary is capped: once more than
+  `max_terms` terms are known, only the most frequent half is kept. Rare terms
+  don't inform predictions anyway (see `min_term_outputs`).
+
+  Args:
+    max_terms: The maximum number of request terms to keep statistics for.
+  """
+
+  def __init__(self, max_terms: int = DEFAULT_MAX_TERMS):
+    self._max_terms = max_terms
+    self._lock = threading.Lock()
+    self._outputs = 0
+    self._component_counts: "collections.Counter[str]" = collections.Counter()
+    self._term_counts: "collections.Counter[str]" = collections.Counter()
+    self._term_components: Dict[str, "collections.Counter[str]"] = {}
+
+  @property
+  def outputs(self) -> int:
+    """The number of recorded outputs."""
+    return self._outputs
+
+  @property
+  def component_usage(self) -> Dict[str, int]:
+    """The number of outputs using each component.
+
+    Suitable as `CompactRenderOptions.component_usage`.
+    """
+    with self._lock:
+      return dict(self._component_counts)
+
+  def record(self, query: str, a2ui_json: Any) -> None:
+    """Records the components used by a validated output for `query`.
+
+    Args:
+      query: The request the output was generated for.
+      a2ui_json: The validated A2UI messages.
+    """
+    self.record_components(query, find_component_types(a2ui_json))
+
+  def record_components(self, query: str, components: Iterable[str]) -> None:
+    """Records that the output for `query` used `components`."""
+    terms = set(tokenize(query))
+    components = set(components)
+    if not components:
+      return
+    with self._lock:
+      self._outputs += 1
+      self._component_counts.update(components)
+      self._term_counts.update(terms)
+      for term in terms:
+        self._term_components.setdefault(term, collections.Counter()).update(components)
+      if len(self._term_counts) > self._max_terms:
+        self._prune_terms()
+
+  def component_probabilities(
+      self, query: str, min_term_outputs: int = 3
+  ) -> Optional[Dict[str, float]]:
+    """Estimates how likely each component is to be needed for `query`.
+
+    Each component gets the highest of its overall usage rate and its usage
+    rate among outputs for requests sharing a term with `query`. Only terms seen
+    in at least `min_term_outputs` outputs are considered.
+
+    Returns:
+      The probabilities, or None if less than half of the terms of `query` are
+      known.
+    """
+    terms = set(tokenize(query))
+    with self._lock:
+      if not self._outputs:
+        return None
+      known = [t for t in terms if self._term_counts[t] >= min_term_outputs]
+      if not known or len(known) * 2 < len(terms):
+        return None
+      probabilities = {
+          component: count / self._outputs
+          for component, count in self._component_counts.items()
+      }
+      for term in known:
+        term_outputs = self._term_counts[term]
+        for component, count in self._term_components[term].items():
+          probabilities[component] = max(probabilities[component], count / term_outputs)
+      return probabilities
+
+  def to_dict(self) -> Dict[str, Any]:
+    """Returns the statistics as JSON-serializable data, e.g. to persist them."""
+    with self._lock:
+      return {
+          "outputs": self._outputs,
+          "components": dict(self._component_counts),
+          "terms": dict(self._term_counts),
+          "termComponents": {
+              term: dict(counts) for term, counts in self._term_components.items()
+          },
+      }
+
+  @classmethod
+  def from_dict(
+      cls, data: Dict[str, Any], max_terms: int = DEFAULT_MAX_TERMS
+  ) -> "ComponentUsageStats":
+    """Restores statistics saved with `to_dict`."""
+    stats = cls(max_terms)
+    stats._outputs = data.get("outputs", 0)
+    stats._component_counts.update(data.get("components", {}))
+    stats._term_counts.update(data.get("terms", {}))
+    for term, counts in data.get("termComponents", {}).items():
+      stats._term_components[term] = collections.Counter(counts)
+    if len(stats._term_counts) > max_terms:
+      stats._prune_terms()
+    return stats
+
+  def _prune_terms(self) -> None:
+    """Keeps the most frequent half of the terms."""
+    kept = self._term_counts.most_common(self._max_terms // 2)
+    self._term_counts = collections.Counter(dict(kept))
+    self._term_components = {
+        term: self._term_components.get(term, collections.Counter()) for term, _ in kept
+    }
+
+
+class ComponentSubsetter:
+  """Predicts the catalog components a request needs from usage statistics.
+
+  Args:
+    stats: The usage statistics to predict from.
+    min_outputs: The number of recorded outputs required before predicting.
+    min_probability: The estimated probability from which a component is kept.
+    min_term_outputs: The number of outputs a request term must have been seen
+      in to inform the prediction.
+    always_include: Components kept in every prediction, e.g. layout
+      containers.
+  """
+
+  def __init__(
+      self,
+      stats: ComponentUsageStats,
+      min_outputs: int = 50,
+      min_probability: float = 0.05,
+      min_term_outputs: int = 3,
+      always_include: Iterable[str] = (),
+  ):
+    self._stats = stats
+    self._min_outputs = min_outputs
+    self._min_probability = min_probability
+    self._min_term_outputs = min_term_outputs
+    self._always_include = frozenset(always_include)
+
+  @property
+  def stats(self) -> ComponentUsageStats:
+    return self._stats
+
+  def predict(self, catalog: A2uiCatalog, query: str) -> Optional[List[str]]:
+    """Returns the components of `catalog` predicted for `query`.
+
+    Returns:
+      The predicted components in catalog order, or None when the prediction
+      is not confident enough and the full catalog should be used.
+    """
+    if self._stats.outputs < self._min_outputs:
+      return None
+    probabilities = self._stats.component_probabilities(query, self._min_term_outputs)
+    if probabilities is None:
+      return None
+    components = (catalog.catalog_schema or {}).get(CATALOG_COMPONENTS_KEY) or {}
+    predicted = [
+        name
+        for name in components
+        if name in self._always_include
+        or probabilities.get(name, 0.0) >= self._min_probability
+    ]
+    return predicted or None
+
+  def select_catalog(self, catalog: A2uiCatalog, query: str) -> A2uiCatalog:
+    """Returns `catalog` pruned to the components predicted for `query`.
+
+    Falls back to `catalog` itself when no confident prediction can be made.
+    """
+    predicted = self.predict(catalog, query)
+    if predicted is None:
+      return catalog
+    return catalog.with_pruning(allowed_components=predicted)
@@ -14,11 +14,13 @@
 
 """Utilities for A2UI Schema manipulation."""
 
+import hashlib
 import json
 import logging
 import os
 import importlib.resources
-from typing import Any, Dict
+import tempfile
+from typing import Any, Dict, List
 
 from .constants import A2UI_ASSET_PACKAGE, SPECIFICATION_DIR, ENCODING
 from .catalog_provider import FileSystemCatalogProvider
@@ -127,3 +129,57 @@ def deep_update(d: dict, u: dict) -> dict:
     else:
       d[k] = v
   return d
+
+
+def canonical_json(obj: Any) -> str:
+  """Serializes `obj` to JSON with sorted keys and no insignificant whitespace.
+
+  Two structurally equal JSON values always produce the same string, regardless
+  of dict insertion order.
+  """
+  return json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
+def canonical_hash(obj: Any) -> str:
+  """Returns a stable SHA-256 hex digest of the canonical JSON form of `obj`."""
+  return hashlib.sha256(canonical_json(obj).encode(ENCODING)).hexdigest()
+
+
+def write_json_atomically(path: str, data: Any) -> None:
+  """Writes `data` as compact JSON to `path` through a temporary file.
+
+  Readers, including other processes, never observe a partially written file.
+
+  Raises:
+    OSError: If the file can't be written.
+  """
+  fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+  try:
+    with os.fdopen(fd, "w", encoding=ENCODING) as f:
+      json.dump(data, f, separators=(",", ":"), ensure_ascii=False)
+    os.replace(tmp_path, path)
+  except BaseException:
+    os.unlink(tmp_path)
+    raise
+
+
+def find_component_types(data: Any) -> List[str]:
+  """Returns the component types used in A2UI messages, in document order.
+
+  Handles both v0.9 (`"component": "Text"`) and v0.8 (`"component": {"Text":
+  {...}}`) components, anywhere in `data`.
+  """
+  types = []
+  stack = [data]
+  while stack:
+    node = stack.pop()
+    if isinstance(node, dict):
+      component = node.get("component")
+      if isinstance(component, str):
+        types.append(component)
+      elif isinstance(component, dict):
+        types.extend(component)
+      stack.extend(reversed(list(node.values())))
+    elif isinstance(node, list):
+      stack.extend(reversed(node))
+  return types
@@ -13,16 +13,34 @@
 # limitations under the License.
 
 import copy
+import functools
 import logging
+import os
 import re
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple, Union, Iterator
-
-from jsonschema import Draft202012Validator
+from concurrent.futures import Executor
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+    Iterator,
+)
 
-from .utils import wrap_as_json_array
+from .artifacts import CatalogArtifacts
+from .cache import CacheInfo, LruCache
+from .utils import canonical_hash, wrap_as_json_array
 
 if TYPE_CHECKING:
+  from jsonschema import Draft202012Validator, ValidationError
+
   from .catalog import A2uiCatalog
+  from .parallel import ValidationResult
 
 from .constants import (
     BASE_SCHEMA_URL,
@@ -42,6 +60,10 @@ RELAXED_PATH_PATTERN = re.compile(
 MAX_GLOBAL_DEPTH = 50
 MAX_FUNC_CALL_DEPTH = 5
 
+# Validation modes
+VALIDATION_MODE_COLLECT = "collect"
+VALIDATION_MODE_FAIL_FAST = "fail_fast"
+
 # Constants
 COMPONENTS = "components"
 ID = "id"
@@ -98,6 +120,123 @@ def _inject_additional_properties(
   return recursive_inject(schema), injected_keys
 
 
+def bundle_0_8_schemas(catalog: "A2uiCatalog") -> Dict[str, Any]:
+  """Returns the v0.8 message schema with the catalog components and styles inlined."""
+  if not catalog.s2c_schema:
+    return {}
+
+  bundled = copy.deepcopy(catalog.s2c_schema)
+
+  # Prepare catalog components and styles for injection
+  source_properties = {}
+  catalog_schema = catalog.catalog_schema
+  if catalog_schema:
+    if CATALOG_COMPONENTS_KEY in catalog_schema:
+      # Special mapping for v0.8: "components" -> "component"
+      source_properties["component"] = catalog_schema[CATALOG_COMPONENTS_KEY]
+    if CATALOG_STYLES_KEY in catalog_schema:
+      source_properties[CATALOG_STYLES_KEY] = catalog_schema[CATALOG_STYLES_KEY]
+
+  bundled, _ = _inject_additional_properties(bundled, source_properties)
+  return bundled
+
+
+class LazyValidationError(ValueError):
+  """A validation error whose message is only formatted when it is accessed.
+
+  Raised by the fail-fast validation mode, where callers frequently discard the
+  error (e.g. when sniffing partial messages in the streaming parser).
+  """
+
+  def __init__(self, format_message: Callable[[], str]):
+    super().__init__()
+    self._format_message = format_message
+    self._message: Optional[str] = None
+
+  def __str__(self) -> str:
+    if self._message is None:
+      self._message = self._format_message()
+    return self._message
+
+  def __reduce__(self):
+    # The formatter may not be picklable, so cross process boundaries as a
+    # plain ValueError with the formatted message.
+    return (ValueError, (str(self),))
+
+
+# Passed by `a2ui.schema.builder` to create `ValidatedMessages`.
+_BUILDER_TOKEN = object()
+
+
+def _read_only(self, *args, **kwargs):
+  raise TypeError("Validated A2UI messages are read-only")
+
+
+class _FrozenDict(dict):
+  """A read-only dict, shared between built messages instead of copied."""
+
+  __slots__ = ()
+  __setitem__ = __delitem__ = __ior__ = _read_only
+  clear = pop = popitem = setdefault = update = _read_only
+
+  def __reduce__(self):
+    return (dict, (dict(self),))
+
+
+class _FrozenList(list):
+  """A read-only list, shared between built messages instead of copied."""
+
+  __slots__ = ()
+  __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+  append = clear = extend = insert = pop = remove = reverse = sort = _read_only
+
+  def __reduce__(self):
+    return (list, (list(self),))
+
+
+def _freeze(value: Any) -> Any:
+  """Returns a read-only version of a JSON value, reusing frozen containers."""
+  if type(value) in (_FrozenDict, _FrozenList):
+    return value
+  if isinstance(value, dict):
+    return _FrozenDict((key, _freeze(item)) for key, item in value.items())
+  if isinstance(value, (list, tuple)):
+    return _FrozenList(map(_freeze, value))
+  return value
+
+
+class ValidatedMessages(tuple):
+  """An immutable sequence of A2UI messages validated against a catalog.
+
+  Only created by `a2ui.schema.builder.Surface.build`. A validator for the same
+  catalog skips the schema checks for these messages, but still runs the
+  integrity checks. The messages are read-only dicts and lists (mutating them
+  raises `TypeError`), so builds share them instead of copying them; copies
+  (including pickled ones) are plain, mutable tuples, dicts and lists, so they
+  are validated again.
+  """
+
+  def __new__(
+      cls, messages: Iterable[Dict[str, Any]], catalog: "A2uiCatalog", token: object
+  ):
+    if token is not _BUILDER_TOKEN:
+      raise TypeError("ValidatedMessages can only be created by a2ui.schema.builder")
+    instance = super().__new__(cls, map(_freeze, messages))
+    instance._catalog = catalog
+    return instance
+
+  @property
+  def catalog(self) -> "A2uiCatalog":
+    return self._catalog
+
+  def is_validated_for(self, catalog: "A2uiCatalog") -> bool:
+    """Returns whether these messages were validated against `catalog`."""
+    return self._catalog is catalog or self._catalog == catalog
+
+  def __reduce__(self):
+    return (tuple, (tuple(self),))
+
+
 class A2uiValidator:
   """Validates the A2UI JSON payload against the provided schema and checks for integrity.
 
@@ -116,25 +255,77 @@ class A2uiValidator:
   5.  **Path Syntax**:
       -   Validates JSON Pointer syntax for data paths.
 
+  Schema validation results can optionally be memoized in a `result_cache`.
+  Components (and messages) that already passed schema validation against the
+  same catalog are then skipped on later calls; only the cheap integrity,
+  topology, recursion and path checks run on every call. A single cache may be
+  shared between validators, since entries are keyed by the catalog content.
+
+  `ValidatedMessages` built for the same catalog (the output of
+  `a2ui.schema.builder.Surface.build`) skip the schema checks; the integrity
+  checks still run.
+
+  A validator is immutable once constructed and is safe to use concurrently from
+  multiple threads. `validate_async` offloads validation to an executor so that
+  large payloads do not block an event loop.
+
   Args:
-      a2ui_json: The JSON payload to validate.
-      a2ui_schema: The schema to validate against.
+      catalog: The catalog to validate against.
+      result_cache: Optional cache of previously validated components.
 
   Raises:
       jsonschema.ValidationError: If the payload does not match the schema.
       ValueError: If integrity, topology, or recursion checks fail.
   """
 
-  def __init__(self, catalog: "A2uiCatalog"):
+  def __init__(self, catalog: "A2uiCatalog", result_cache: Optional[LruCache] = None):
     self._catalog = catalog
     self.version = getattr(catalog, "version", VERSION_0_8)
+    self._result_cache = result_cache
+    self._ref_fields_map: Optional[Dict[str, tuple[Set[str], Set[str]]]] = None
     self._validator = self._build_validator()
 
   def get_version(self) -> str:
     """Returns the A2UI protocol version."""
     return self.version
 
-  def _build_validator(self) -> Draft202012Validator:
+  def cache_info(self) -> Optional[CacheInfo]:
+    """Returns the hit/miss statistics of the result cache, if one is attached."""
+    return self._result_cache.cache_info() if self._result_cache is not None else None
+
+  @property
+  def catalog(self) -> "A2uiCatalog":
+    """The catalog this validator was built for."""
+    return self._catalog
+
+  @property
+  def catalog_fingerprint(self) -> str:
+    """A stable content hash of the catalog this validator was built for."""
+    return self._catalog.fingerprint
+
+  def _cache_key(self, kind: str, instance: Any) -> Optional[Tuple[str, str, str]]:
+    """Returns the result cache key for `instance`, or None if caching is off."""
+    if self._result_cache is None:
+      return None
+    try:
+      instance_hash = canonical_hash(instance)
+    except (TypeError, ValueError):
+      return None
+    return (self.catalog_fingerprint, kind, instance_hash)
+
+  def _is_cached_valid(self, key: Optional[Tuple[str, str, str]]) -> bool:
+    return key is not None and self._result_cache.get(key) is not None
+
+  def _mark_valid(self, key: Optional[Tuple[str, str, str]]) -> None:
+    if key is not None:
+      self._result_cache.put(key, True)
+
+  def _is_prevalidated(self, a2ui_json: Any) -> bool:
+    return isinstance(a2ui_json, ValidatedMessages) and a2ui_json.is_validated_for(
+        self._catalog
+    )
+
+  def _build_validator(self) -> "Draft202012Validator":
     """Builds a validator for the A2UI schema."""
 
     if self._catalog.version == VERSION_0_8:
@@ -142,35 +333,19 @@ class A2uiValidator:
     return self._build_0_9_validator()
 
   def _bundle_0_8_schemas(self) -> Dict[str, Any]:
-    if not self._catalog.s2c_schema:
-      return {}
-
-    bundled = copy.deepcopy(self._catalog.s2c_schema)
-
-    # Prepare catalog components and styles for injection
-    source_properties = {}
-    catalog_schema = self._catalog.catalog_schema
-    if catalog_schema:
-      if CATALOG_COMPONENTS_KEY in catalog_schema:
-        # Special mapping for v0.8: "components" -> "component"
-        source_properties["component"] = catalog_schema[CATALOG_COMPONENTS_KEY]
-      if CATALOG_STYLES_KEY in catalog_schema:
-        source_properties[CATALOG_STYLES_KEY] = catalog_schema[CATALOG_STYLES_KEY]
-
-    bundled, _ = _inject_additional_properties(bundled, source_properties)
-    return bundled
+    return bundle_0_8_schemas(self._catalog)
 
-  def _build_0_8_validator(self) -> Draft202012Validator:
+  def _build_0_8_validator(self) -> "Draft202012Validator":
     """Builds a validator for the A2UI schema version 0.8."""
     bundled_schema = self._bundle_0_8_schemas()
     full_schema = wrap_as_json_array(bundled_schema)
 
+    from jsonschema import Draft202012Validator
     from referencing import Registry, Resource
     from referencing.jsonschema import DRAFT202012
 
     # Even in v0.8, we may have references to common_types.json or other files.
     base_uri = self._catalog.s2c_schema.get("$id", BASE_SCHEMA_URL)
-    import os
 
     def get_sibling_uri(uri, filename):
       return os.path.join(os.path.dirname(uri), filename)
@@ -200,10 +375,11 @@ class A2uiValidator:
 
     return Draft202012Validator(validator_schema, registry=registry)
 
-  def _build_0_9_validator(self) -> Draft202012Validator:
+  def _build_0_9_validator(self) -> "Draft202012Validator":
     """Builds a validator for the A2UI schema version 0.9+."""
     full_schema = wrap_as_json_array(self._catalog.s2c_schema)
 
+    from jsonschema import Draft202012Validator
     from referencing import Registry, Resource
     from referencing.jsonschema import DRAFT202012
 
@@ -213,7 +389,6 @@ class A2uiValidator:
     # these resolve to https://a2ui.org/specification/v0_9/catalog.json.
     # We must register them using these absolute URIs.
     base_uri = self._catalog.s2c_schema.get("$id", BASE_SCHEMA_URL)
-    import os
 
     def get_sibling_uri(uri, filename):
       return os.path.join(os.path.dirname(uri), filename)
@@ -273,93 +448,85 @@ class A2uiValidator:
       a2ui_json: Union[Dict[str, Any], List[Any]],
       root_id: Optional[str] = None,
       strict_integrity: bool = True,
+      mode: str = VALIDATION_MODE_COLLECT,
   ) -> None:
-    """Validates an A2UI messages against the schema."""
-    messages = a2ui_json if isinstance(a2ui_json, list) else [a2ui_json]
+    """Validates an A2UI messages against the schema.
+
+    Args:
+      a2ui_json: The A2UI messages to validate.
+      root_id: Optional root component ID.
+      strict_integrity: Whether to enforce root and orphan checks.
+      mode: `VALIDATION_MODE_COLLECT` reports every schema error.
+        `VALIDATION_MODE_FAIL_FAST` stops at the first violation and raises a
+        `LazyValidationError` whose message is only formatted when accessed.
+
+    Raises:
+      ValueError: If validation fails.
+    """
+    if mode not in (VALIDATION_MODE_COLLECT, VALIDATION_MODE_FAIL_FAST):
+      raise ValueError(f"Unknown validation mode: {mode}")
+    if self._is_prevalidated(a2ui_json):
+      self.check_integrity(list(a2ui_json), strict_integrity=strict_integrity)
+      return
+    messages = list(a2ui_json) if isinstance(a2ui_json, (list, tuple)) else [a2ui_json]
 
     if self.version == VERSION_0_9:
-      self._validate_0_9_custom(messages, root_id, strict_integrity)
+      self._validate_0_9_custom(messages, root_id, strict_integrity, mode)
     else:
       # Fallback to old behavior for v0.8
-      errors = list(self._validator.iter_errors(messages))
-      if errors:
-        error = errors[0]
-        msg = f"Validation failed: {error.message}"
-        if error.context:
-          msg += "\nContext failures:"
-          for sub_error in error.context:
-            msg += f"\n  - {sub_error.message}"
-        raise ValueError(msg)
+      keys = [self._cache_key("message", message) for message in messages]
+      unvalidated = [
+          message
+          for message, key in zip(messages, keys)
+          if not self._is_cached_valid(key)
+      ]
+      # Only the first error is reported, so don't enumerate the rest.
+      error = (
+          next(self._validator.iter_errors(unvalidated), None) if unvalidated else None
+      )
+      if error is not None:
+        if mode == VALIDATION_MODE_FAIL_FAST:
+          raise LazyValidationError(lambda: _format_v0_8_error(error))
+        raise ValueError(_format_v0_8_error(error))
 
-      for message in messages:
-        if not isinstance(message, dict):
-          continue
-
-        components = None
-        surface_id = None
-        if "surfaceUpdate" in message:  # v0.8
-          components = message["surfaceUpdate"].get(COMPONENTS)
-          surface_id = message["surfaceUpdate"].get("surfaceId")
-
-        if components:
-          ref_map = extract_component_ref_fields(self._catalog)
-          root_id = _find_root_id(messages, surface_id)
-          _validate_component_integrity(
-              root_id, components, ref_map, skip_root_check=not strict_integrity
-          )
-          analyze_topology(
-              root_id, components, ref_map, raise_on_orphans=strict_integrity
-          )
+      for key in keys:
+        self._mark_valid(key)
 
-        _validate_recursion_and_paths(message)
+    self.check_integrity(messages, strict_integrity=strict_integrity)
 
-  def _validate_0_9_custom(
+  def check_integrity(
       self,
-      messages: List[Dict[str, Any]],
-      root_id: Optional[str] = None,
+      a2ui_json: Union[Dict[str, Any], List[Any]],
       strict_integrity: bool = True,
   ) -> None:
-    all_errors = []
-    for idx, message in enumerate(messages):
-      if not isinstance(message, dict):
-        all_errors.append(f"messages[{idx}]: Is not an object")
-        continue
+    """Runs the integrity, topology, recursion and path checks only.
 
-      if "createSurface" in message:
-        val = self._get_sub_validator("CreateSurfaceMessage")
-        all_errors.extend(self._get_formatted_errors(val, message, f"messages[{idx}]"))
-      elif "updateComponents" in message:
-        all_errors.extend(
-            self._get_update_components_errors(message, f"messages[{idx}]")
-        )
-      elif "updateDataModel" in message:
-        val = self._get_sub_validator("UpdateDataModelMessage")
-        all_errors.extend(self._get_formatted_errors(val, message, f"messages[{idx}]"))
-      elif "deleteSurface" in message:
-        val = self._get_sub_validator("DeleteSurfaceMessage")
-        all_errors.extend(self._get_formatted_errors(val, message, f"messages[{idx}]"))
-      else:
-        keys = list(message.keys())
-        all_errors.append(f"messages[{idx}]: Unknown message type with keys {keys}")
+    Use this for messages whose components were already checked against the
+    schema, e.g. with `validate_component`.
 
-    if all_errors:
-      msg = "Validation failed:\n" + "\n".join(f"  - {err}" for err in all_errors)
-      raise ValueError(msg)
+    Args:
+      a2ui_json: The A2UI messages to check.
+      strict_integrity: Whether to enforce root and orphan checks.
 
-    # Integrity checks
+    Raises:
+      ValueError: If integrity, topology, or recursion checks fail.
+    """
+    messages = a2ui_json if isinstance(a2ui_json, list) else [a2ui_json]
+    update_key = "surfaceUpdate" if self.version == VERSION_0_8 else "updateComponents"
     for message in messages:
       if not isinstance(message, dict):
         continue
+
       components = None
       surface_id = None
-      if "updateComponents" in message and isinstance(
-          message["updateComponents"], dict
-      ):
-        components = message["updateComponents"].get(COMPONENTS)
-        surface_id = message["updateComponents"].get("surfaceId")
+      if update_key in message and isinstance(message[update_key], dict):
+        components = message[update_key].get(COMPONENTS)
+        surface_id = message[update_key].get("surfaceId")
 
       if components:
-        ref_map = extract_component_ref_fields(self._catalog)
+        if self._ref_fields_map is None:
+          self._ref_fields_map = extract_component_ref_fields(self._catalog)
+        ref_map = self._ref_fields_map
         root_id = _find_root_id(messages, surface_id)
         _validate_component_integrity(
             root_id, components, ref_map, skip_root_check=not strict_integrity
@@ -370,54 +537,209 @@ class A2uiValidator:
 
       _validate_recursion_and_paths(message)
 
-  def _get_sub_validator(self, def_name: str) -> Draft202012Validator:
+  def validate_component(self, component: Dict[str, Any]) -> None:
+    """Validates a single component against its schema in the catalog.
+
+    Only the schema is checked; references to other components are not resolved.
+
+    Args:
+      component: The component, in the shape used by `updateComponents` (v0.9)
+        or `surfaceUpdate` (v0.8).
+
+    Raises:
+      ValueError: If the component does not match the catalog.
+    """
+    if self.version == VERSION_0_8:
+      message = {"surfaceUpdate": {"surfaceId": "", COMPONENTS: [component]}}
+      error = next(self._validator.iter_errors([message]), None)
+      if error is not None:
+        raise ValueError(_format_v0_8_error(error))
+      return
+
+    comp_id = component.get(ID) if isinstance(component, dict) else None
+    path = f"components[id='{comp_id}']" if comp_id else "components[0]"
+    errors = [
+        _format_error(err)
+        for err in self._iter_single_component_errors(component, path)
+    ]
+    if errors:
+      raise ValueError(
+          "Validation failed:\n" + "\n".join(f"  - {err}" for err in errors)
+      )
+
+  async def validate_async(
+      self,
+      a2ui_json: Union[Dict[str, Any], List[Any]],
+      root_id: Optional[str] = None,
+      strict_integrity: bool = True,
+      executor: Optional[Executor] = None,
+  ) -> None:
+    """Validates A2UI messages without blocking the running event loop.
+
+    Args:
+      a2ui_json: The A2UI messages to validate.
+      root_id: Optional root component ID.
+      strict_integrity: Whether to enforce root and orphan checks.
+      executor: The executor to run validation in. Defaults to the event loop's
+        default thread pool. A process pool created with
+        `create_validator_process_pool` validates with the validator preloaded
+        in the worker instead of shipping this one across processes. Any other
+        `ProcessPoolExecutor` is sent the catalog with every call; each worker
+        compiles a validator for it once and keeps it.
+
+    Raises:
+      ValueError: If validation fails.
+    """
+    if self._is_prevalidated(a2ui_json):
+      self.check_integrity(list(a2ui_json), strict_integrity=strict_integrity)
+      return
+    import asyncio
+    from concurrent.futures import ProcessPoolExecutor
+
+    loop = asyncio.get_running_loop()
+    if isinstance(executor, ProcessPoolExecutor):
+      from .parallel import _validate_in_worker, _preloads_catalog
+
+      fingerprint = self.catalog_fingerprint
+      call = functools.partial(
+          _validate_in_worker,
+          fingerprint,
+          a2ui_json,
+          root_id,
+          strict_integrity,
+          None if _preloads_catalog(executor, fingerprint) else self._catalog,
+      )
+    else:
+      call = functools.partial(
+          self.validate,
+          a2ui_json,
+          root_id=root_id,
+          strict_integrity=strict_integrity,
+      )
+    await loop.run_in_executor(executor, call)
+
+  def validate_many(
+      self,
+      payloads: Union[Iterable[Any], str, os.PathLike],
+      workers: Optional[int] = None,
+      fail_fast: bool = False,
+      strict_integrity: bool = True,
+      batch_size: int = 16,
+  ) -> Iterator["ValidationResult"]:
+    """Validates many payloads, streaming one result per payload in input order.
+
+    Payloads may be parsed JSON values, raw JSON strings/bytes, or a path to a
+    JSONL file with one payload per line. JSONL files are memory-mapped and read
+    lazily, so corpora larger than memory can be validated.
+
+    Args:
+      payloads: An iterable of payloads, or the path to a JSONL file.
+      workers: The number of worker processes. Each worker compiles this
+        validator's catalog once. If None or 1, validation runs in-process.
+      fail_fast: If True, stop after the first invalid payload.
+      strict_integrity: Whether to enforce root and orphan checks.
+      batch_size: The number of payloads sent to a worker per task.
+
+    Returns:
+      An iterator of `ValidationResult`s, including per-payload timings.
+    """
+    from .parallel import validate_many
+
+    return validate_many(
+        self,
+        payloads,
+        workers=workers,
+        fail_fast=fail_fast,
+        strict_integrity=strict_integrity,
+        batch_size=batch_size,
+    )
+
+  def _validate_0_9_custom(
+      self,
+      messages: List[Dict[str, Any]],
+      root_id: Optional[str] = None,
+      strict_integrity: bool = True,
+      mode: str = VALIDATION_MODE_COLLECT,
+  ) -> None:
+    errors = self._iter_message_errors(messages)
+    if mode == VALIDATION_MODE_FAIL_FAST:
+      first_error = next(errors, None)
+      if first_error is not None:
+        raise LazyValidationError(
+            lambda: "Validation failed:\n  - " + _format_error(first_error)
+        )
+    else:
+      all_errors = [_format_error(err) for err in errors]
+      if all_errors:
+        msg = "Validation failed:\n" + "\n".join(f"  - {err}" for err in all_errors)
+        raise ValueError(msg)
+
+  def _iter_message_errors(
+      self, messages: List[Dict[str, Any]]
+  ) -> Iterator["_ErrorEntry"]:
+    """Lazily yields schema errors for v0.9 messages, in message order."""
+    for idx, message in enumerate(messages):
+      if not isinstance(message, dict):
+        yield f"messages[{idx}]: Is not an object"
+        continue
+
+      if "createSurface" in message:
+        yield from self._iter_schema_errors(
+            "CreateSurfaceMessage", message, f"messages[{idx}]"
+        )
+      elif "updateComponents" in message:
+        yield from self._iter_update_components_errors(message, f"messages[{idx}]")
+      elif "updateDataModel" in message:
+        yield from self._iter_schema_errors(
+            "UpdateDataModelMessage", message, f"messages[{idx}]"
+        )
+      elif "deleteSurface" in message:
+        yield from self._iter_schema_errors(
+            "DeleteSurfaceMessage", message, f"messages[{idx}]"
+        )
+      else:
+        keys = list(message.keys())
+        yield f"messages[{idx}]: Unknown message type with keys {keys}"
+
+  def _iter_schema_errors(
+      self, def_name: str, message: Dict[str, Any], path: str
+  ) -> Iterator["_ErrorEntry"]:
+    key = self._cache_key(def_name, message)
+    if self._is_cached_valid(key):
+      return
+    found = False
+    for err in self._get_sub_validator(def_name).iter_errors(message):
+      found = True
+      yield (path, err)
+    if not found:
+      self._mark_valid(key)
+
+  def _get_sub_validator(self, def_name: str) -> "Draft202012Validator":
     sub_schema = self._catalog.s2c_schema.get("$defs", {}).get(def_name)
     if not sub_schema:
       raise ValueError(f"Definition {def_name} not found in schema")
-    return Draft202012Validator(sub_schema, registry=self._validator._registry)
+    from jsonschema import Draft202012Validator
 
-  def _get_formatted_errors(
-      self, validator: Draft202012Validator, instance: Any, base_path: str
-  ) -> List[str]:
-    errors = list(validator.iter_errors(instance))
-    formatted = []
-    for err in errors:
-      path_str = ".".join(str(p) for p in err.path)
-      full_path = f"{base_path}.{path_str}" if path_str else base_path
-
-      message = err.message
-      if (
-          (
-              "Unevaluated properties are not allowed" in message
-              or "Additional properties are not allowed" in message
-          )
-          and "(" in message
-          and ")" in message
-      ):
-        message = message[message.find("(") + 1 : message.rfind(")")]
-
-      formatted.append(f"{full_path}: {message}")
-    return formatted
+    return Draft202012Validator(sub_schema, registry=self._validator._registry)
 
-  def _get_update_components_errors(
+  def _iter_update_components_errors(
       self, message: Dict[str, Any], path: str
-  ) -> List[str]:
-    errors = []
+  ) -> Iterator["_ErrorEntry"]:
     if "version" not in message or message["version"] != "v0.9":
-      errors.append(f"{path}: Invalid version, expected 'v0.9'")
+      yield f"{path}: Invalid version, expected 'v0.9'"
 
     uc = message.get("updateComponents")
     if not isinstance(uc, dict):
-      errors.append(f"{path}: Expected updateComponents to be an object")
-      return errors
+      yield f"{path}: Expected updateComponents to be an object"
+      return
 
     if "surfaceId" not in uc or not isinstance(uc["surfaceId"], str):
-      errors.append(f"{path}.updateComponents: Invalid or missing surfaceId")
+      yield f"{path}.updateComponents: Invalid or missing surfaceId"
 
     components = uc.get("components")
     if not isinstance(components, list):
-      errors.append(f"{path}.updateComponents: Expected components to be an array")
-      return errors
+      yield f"{path}.updateComponents: Expected components to be an array"
+      return
 
     for idx, comp in enumerate(components):
       comp_id = comp.get("id")
@@ -426,33 +748,85 @@ class A2uiValidator:
           if comp_id
           else f"{path}.updateComponents.components[{idx}]"
       )
-      errors.extend(self._get_single_component_errors(comp, comp_path))
+      yield from self._iter_single_component_errors(comp, comp_path)
 
-    return errors
-
-  def _get_single_component_errors(self, comp: Dict[str, Any], path: str) -> List[str]:
+  def _iter_single_component_errors(
+      self, comp: Dict[str, Any], path: str
+  ) -> Iterator["_ErrorEntry"]:
     if not isinstance(comp, dict):
-      return [f"{path}: Component is not an object"]
+      yield f"{path}: Component is not an object"
+      return
 
     comp_type = comp.get("component")
     if not comp_type:
-      return [f"{path}: Missing 'component' field"]
+      yield f"{path}: Missing 'component' field"
+      return
 
     catalog = self._catalog.catalog_schema
     if not catalog or "components" not in catalog:
-      return [f"{path}: Catalog schema or components missing"]
+      yield f"{path}: Catalog schema or components missing"
+      return
 
     comp_schema = catalog["components"].get(comp_type)
     if not comp_schema:
-      return [f"{path}: Unknown component: {comp_type}"]
+      yield f"{path}: Unknown component: {comp_type}"
+      return
+
+    key = self._cache_key("component", comp)
+    if self._is_cached_valid(key):
+      return
 
     temp_schema = {
         "$schema": "https://json-schema.org/draft/2020-12/schema",
         "$ref": f"catalog.json#/components/{comp_type}",
     }
 
+    from jsonschema import Draft202012Validator
+
     validator = Draft202012Validator(temp_schema, registry=self._validator._registry)
-    return self._get_formatted_errors(validator, comp, path)
+    found = False
+    for err in validator.iter_errors(comp):
+      found = True
+      yield (path, err)
+    if not found:
+      self._mark_valid(key)
+
+
+# A schema error is either a preformatted message, or a (base path, jsonschema
+# error) pair that is only formatted when the message is actually needed.
+_ErrorEntry = Union[str, Tuple[str, "ValidationError"]]
+
+
+def _format_error(entry: _ErrorEntry) -> str:
+  """Formats an error entry as '<path>: <message>'."""
+  if isinstance(entry, str):
+    return entry
+
+  base_path, err = entry
+  path_str = ".".join(str(p) for p in err.path)
+  full_path = f"{base_path}.{path_str}" if path_str else base_path
+
+  message = err.message
+  if (
+      (
+          "Unevaluated properties are not allowed" in message
+          or "Additional properties are not allowed" in message
+      )
+      and "(" in message
+      and ")" in message
+  ):
+    message = message[message.find("(") + 1 : message.rfind(")")]
+
+  return f"{full_path}: {message}"
+
+
+def _format_v0_8_error(error: "ValidationError") -> str:
+  msg = f"Validation failed: {error.message}"
+  if error.context:
+    msg += "\nContext failures:"
+    for sub_error in error.context:
+      msg += f"\n  - {sub_error.message}"
+  return msg
 
 
 def _find_root_id(
@@ -610,6 +984,9 @@ def extract_component_required_fields(
   Parses the catalog/schema to identify which component properties are required.
   Returns a map: { component_name: set_of_required_fields }
   """
+  if isinstance(getattr(catalog, "artifacts", None), CatalogArtifacts):
+    return dict(catalog.artifacts.required_fields)
+
   req_map = {}
 
   all_components = {}
@@ -665,6 +1042,9 @@ def extract_component_ref_fields(
   Parses the catalog/schema to identify which component properties reference other components.
   Returns a map: { component_name: (set_of_single_ref_fields, set_of_list_ref_fields) }
   """
+  if isinstance(getattr(catalog, "artifacts", None), CatalogArtifacts):
+    return dict(catalog.artifacts.ref_fields)
+
   ref_map = {}
 
   all_components = {}
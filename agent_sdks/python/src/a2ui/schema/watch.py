@@ -0,0 +1,107 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Hot reloading of catalogs and examples.
+
+`A2uiSchemaManager.watch` starts a `CatalogWatcher`, a background thread that
+periodically calls `A2uiSchemaManager.reload`. Changes are detected by polling
+cheap stamps (file modification times and sizes, HTTP validators), so an idle
+poll reads no files.
+
+Usage Example:
+
+  ```python
+  watcher = schema_manager.watch(interval=2.0)
+  ...
+  watcher.stop()
+  ```
+"""
+
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Callable, Optional, Tuple
+
+DEFAULT_WATCH_INTERVAL_SECONDS = 1.0
+
+
+@dataclass(frozen=True)
+class CatalogReload:
+  """The changes applied by a reload.
+
+  Attributes:
+    catalogs: The names of the catalogs that were reloaded.
+    examples: The example paths whose files changed.
+    failed: The names of the changed catalogs that could not be loaded. They
+      keep serving their previous version and are retried on the next reload.
+  """
+
+  catalogs: Tuple[str, ...] = ()
+  examples: Tuple[str, ...] = ()
+  failed: Tuple[str, ...] = ()
+
+  def __bool__(self) -> bool:
+    return bool(self.catalogs or self.examples or self.failed)
+
+
+class CatalogWatcher:
+  """Calls `reload` every `interval` seconds in a daemon thread until stopped.
+
+  Args:
+    reload: The function applying the changes, e.g. `A2uiSchemaManager.reload`.
+    interval: Seconds between two polls.
+    on_reload: Optional callback receiving each non-empty `CatalogReload`.
+  """
+
+  def __init__(
+      self,
+      reload: Callable[[], CatalogReload],
+      interval: float = DEFAULT_WATCH_INTERVAL_SECONDS,
+      on_reload: Optional[Callable[[CatalogReload], None]] = None,
+  ):
+    if interval <= 0:
+      raise ValueError(f"Watch interval must be positive, got {interval}")
+    self._reload = reload
+    self._interval = interval
+    self._on_reload = on_reload
+    self._stopped = threading.Event()
+    self._thread = threading.Thread(
+        target=self._run, name="a2ui-catalog-watcher", daemon=True
+    )
+    self._thread.start()
+
+  @property
+  def running(self) -> bool:
+    return self._thread.is_alive()
+
+  def stop(self, timeout: Optional[float] = None) -> None:
+    """Stops polling, waiting up to `timeout` seconds for a reload in progress."""
+    self._stopped.set()
+    if threading.current_thread() is not self._thread:
+      self._thread.join(timeout)
+
+  def __enter__(self) -> "CatalogWatcher":
+    return self
+
+  def __exit__(self, *exc_info) -> None:
+    self.stop()
+
+  def _run(self) -> None:
+    while not self._stopped.wait(self._interval):
+      try:
+        reload = self._reload()
+        if reload and self._on_reload is not None:
+          self._on_reload(reload)
+      except Exception as e:
+        logging.warning(f"Catalog reload failed: {e}")
@@ -14,13 +14,30 @@
 
 """Tests for the A2uiEventConverter class."""
 
+import asyncio
+import json
+import pickle
+import types
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from a2ui.adk.a2a.event_converter import A2uiEventConverter
 from a2ui.adk.a2a.part_converter import A2uiPartConverter
+from a2ui.basic_catalog import BasicCatalog
 from a2ui.schema.catalog import A2uiCatalog
+from a2ui.schema.catalog_refs import CatalogResolutionError, catalog_ref
+from a2a.types import DataPart
+from a2ui.parser.streaming import A2uiStreamParser
+from a2ui.schema.constants import (
+    A2UI_TOOL_ERROR_KEY,
+    A2UI_TOOL_NAME,
+    A2UI_VALIDATED_JSON_KEY,
+    VERSION_0_9,
+)
+from a2ui.schema.manager import A2uiSchemaManager
+from google.adk.events.event import Event
+from google.genai import types as genai_types
 
 
 def test_event_converter_injects_catalog():
@@ -93,3 +110,301 @@ def test_event_converter_propagates_fallback_text():
 
     assert isinstance(effective_part_converter.__self__, A2uiPartConverter)
     assert effective_part_converter.__self__._fallback_text == custom_fallback
+
+
+def test_event_converter_resolves_catalog_refs():
+  catalog = A2uiSchemaManager(
+      VERSION_0_9, catalogs=[BasicCatalog.get_config(VERSION_0_9)]
+  ).get_selected_catalog()
+  invocation_context_mock = MagicMock()
+  invocation_context_mock.session.state = {"system:a2ui_catalog": catalog_ref(catalog)}
+
+  with patch(
+      "google.adk.a2a.converters.event_converter.convert_event_to_a2a_events"
+  ) as mock_base_converter:
+    mock_base_converter.return_value = []
+
+    A2uiEventConverter()(MagicMock(), invocation_context_mock)
+
+    args, kwargs = mock_base_converter.call_args
+    assert args[4].__self__._catalog is catalog
+
+
+def test_event_converter_resolves_catalog_refs_with_schema_manager():
+  manager = A2uiSchemaManager(
+      VERSION_0_9, catalogs=[BasicCatalog.get_config(VERSION_0_9)]
+  )
+  catalog = manager.get_selected_catalog(allowed_components=["Text"])
+  # A reference from another worker, to a catalog not alive in this process.
+  ref = catalog_ref(catalog).replace(catalog.fingerprint, "0" * 64)
+  invocation_context_mock = MagicMock()
+  invocation_context_mock.session.state = {"system:a2ui_catalog": ref}
+
+  with pytest.raises(CatalogResolutionError):
+    A2uiEventConverter()(MagicMock(), invocation_context_mock)
+  # The rebuilt catalog must have the referenced content.
+  with pytest.raises(CatalogResolutionError, match="changed"):
+    A2uiEventConverter(schema_manager=manager)(MagicMock(), invocation_context_mock)
+
+  invocation_context_mock.session.state = {
+      "system:a2ui_catalog": ref.replace("0" * 64, catalog.fingerprint)
+  }
+  converter = _effective_part_converter(
+      A2uiEventConverter(schema_manager=manager),
+      invocation_context_mock.session.state,
+  )
+  assert converter._catalog is catalog
+
+
+def _effective_part_converter(converter, state):
+  invocation_context_mock = MagicMock()
+  invocation_context_mock.session.state = state
+  with patch(
+      "google.adk.a2a.converters.event_converter.convert_event_to_a2a_events"
+  ) as mock_base_converter:
+    mock_base_converter.return_value = []
+    converter(MagicMock(), invocation_context_mock)
+    args, kwargs = mock_base_converter.call_args
+    return args[4].__self__
+
+
+def test_event_converter_caches_part_converters_by_catalog_content():
+  catalog = A2uiSchemaManager(
+      VERSION_0_9, catalogs=[BasicCatalog.get_config(VERSION_0_9)]
+  ).get_selected_catalog()
+  converter = A2uiEventConverter()
+
+  first = _effective_part_converter(converter, {"system:a2ui_catalog": catalog})
+  # Persistent session services deserialize a new catalog for every event.
+  second = _effective_part_converter(
+      converter, {"system:a2ui_catalog": pickle.loads(pickle.dumps(catalog))}
+  )
+
+  assert second is first
+  assert converter.converter_cache_info().hits == 1
+
+  uncached = A2uiEventConverter(converter_cache_size=0)
+  assert uncached.converter_cache_info() is None
+  assert _effective_part_converter(
+      uncached, {"system:a2ui_catalog": catalog}
+  ) is not _effective_part_converter(uncached, {"system:a2ui_catalog": catalog})
+
+
+@pytest.mark.asyncio
+async def test_event_converter_convert_async_validates_off_the_event_loop():
+  catalog = A2uiSchemaManager(
+      VERSION_0_9, catalogs=[BasicCatalog.get_config(VERSION_0_9)]
+  ).get_selected_catalog()
+  message = {
+      "version": "v0.9",
+      "createSurface": {"surfaceId": "s", "catalogId": catalog.catalog_id},
+  }
+  context = types.SimpleNamespace(
+      session=types.SimpleNamespace(state={"system:a2ui_catalog": catalog}, id="s"),
+      app_name="app",
+      user_id="user",
+      invocation_id="invocation-1",
+      branch=None,
+  )
+  event = Event(
+      author="agent",
+      content=genai_types.Content(
+          role="model",
+          parts=[
+              genai_types.Part(text=f"<a2ui-json>{json.dumps([message])}</a2ui-json>")
+          ],
+      ),
+  )
+  converter = A2uiEventConverter()
+
+  with patch.object(
+      A2uiPartConverter, "convert", side_effect=AssertionError("sync conversion")
+  ), patch.object(
+      type(catalog.validator),
+      "validate_async",
+      autospec=True,
+      side_effect=lambda *args, **kwargs: asyncio.sleep(0),
+  ) as validate_async:
+    a2a_events = await converter.convert_async(
+        event, context, task_id="t", context_id="c"
+    )
+
+  validate_async.assert_called_once()
+  assert _a2ui_data(a2a_events) == [message]
+
+
+def _a2ui_data(a2a_events):
+  return [
+      part.root.data
+      for a2a_event in a2a_events
+      if a2a_event.status.message
+      for part in a2a_event.status.message.parts
+      if isinstance(part.root, DataPart)
+  ]
+
+
+def _streamed_messages(catalog):
+  return [
+      {
+          "version": "v0.9",
+          "createSurface": {"surfaceId": "s", "catalogId": catalog.catalog_id},
+      },
+      {
+          "version": "v0.9",
+          "updateComponents": {
+              "surfaceId": "s",
+              "components": [
+                  {"id": "root", "component": "Column", "children": ["title"]},
+                  {"id": "title", "component": "Text", "text": "Hello"},
+              ],
+          },
+      },
+  ]
+
+
+def _streaming_converter(catalog):
+  """Returns a function converting parts with a tool arg streaming converter."""
+  context = types.SimpleNamespace(
+      session=types.SimpleNamespace(state={"system:a2ui_catalog": catalog}, id="s"),
+      app_name="app",
+      user_id="user",
+      invocation_id="invocation-1",
+      branch=None,
+  )
+  converter = A2uiEventConverter(stream_tool_args=True)
+
+  def convert(*parts, partial=False):
+    event = Event(
+        author="agent",
+        partial=partial,
+        content=genai_types.Content(role="model", parts=list(parts)),
+    )
+    return _a2ui_data(converter(event, context, task_id="t", context_id="c"))
+
+  return convert
+
+
+def _stream_tool_call(convert, a2ui_json, call_id="call-1"):
+  """Streams the `a2ui_json` argument of a call and returns the data sent per chunk."""
+  chunks = [a2ui_json[i : i + 20] for i in range(0, len(a2ui_json), 20)]
+  streamed = []
+  for i, chunk in enumerate(chunks):
+    function_call = genai_types.FunctionCall(
+        name=A2UI_TOOL_NAME if i == 0 else None,
+        id=call_id if i == 0 else None,
+        partial_args=[
+            genai_types.PartialArg(
+                json_path="$.a2ui_json", string_value=chunk, will_continue=True
+            )
+        ],
+        will_continue=True,
+    )
+    streamed.append(
+        convert(genai_types.Part(function_call=function_call), partial=True)
+    )
+  streamed.append(
+      convert(
+          genai_types.Part(function_call=genai_types.FunctionCall(will_continue=False)),
+          partial=True,
+      )
+  )
+  call = genai_types.FunctionCall(
+      name=A2UI_TOOL_NAME, id=call_id, args={"a2ui_json": a2ui_json}
+  )
+  # The complete call is never sent itself.
+  assert convert(genai_types.Part(function_call=call)) == []
+  return streamed
+
+
+def test_event_converter_streams_tool_args():
+  catalog = A2uiSchemaManager(
+      VERSION_0_9, catalogs=[BasicCatalog.get_config(VERSION_0_9)]
+  ).get_selected_catalog()
+  messages = _streamed_messages(catalog)
+  a2ui_json = json.dumps(messages)
+  convert = _streaming_converter(catalog)
+
+  streamed = _stream_tool_call(convert, a2ui_json)
+
+  # The surface is created before the arguments are complete.
+  first = next(i for i, data in enumerate(streamed) if data)
+  assert first < len(streamed) - 2
+  assert streamed[first][0]["createSurface"]["surfaceId"] == "s"
+  streamed_ids = {
+      component["id"]
+      for data in streamed
+      for message in data
+      for component in message.get("updateComponents", {}).get("components", [])
+  }
+  assert {"root", "title"} <= streamed_ids
+
+  # The response only confirms what was already sent.
+  response = genai_types.FunctionResponse(
+      name=A2UI_TOOL_NAME, id="call-1", response={A2UI_VALIDATED_JSON_KEY: messages}
+  )
+  assert convert(genai_types.Part(function_response=response)) == []
+
+  # Calls that were not streamed are sent with their response.
+  response.id = "call-2"
+  assert convert(genai_types.Part(function_response=response)) == messages
+
+
+def test_event_converter_sends_the_rest_of_streams_that_failed_to_parse():
+  catalog = A2uiSchemaManager(
+      VERSION_0_9, catalogs=[BasicCatalog.get_config(VERSION_0_9)]
+  ).get_selected_catalog()
+  messages = _streamed_messages(catalog)
+  convert = _streaming_converter(catalog)
+  fed = []
+  process_chunk = A2uiStreamParser.process_chunk
+
+  def fail_after_create_surface(parser, chunk):
+    fed.append(chunk)
+    if "children" in "".join(fed):
+      raise ValueError("Unexpected chunk")
+    return process_chunk(parser, chunk)
+
+  with patch.object(A2uiStreamParser, "process_chunk", fail_after_create_surface):
+    streamed = _stream_tool_call(convert, json.dumps(messages))
+  assert [message for data in streamed for message in data] == messages[:1]
+
+  response = genai_types.FunctionResponse(
+      name=A2UI_TOOL_NAME, id="call-1", response={A2UI_VALIDATED_JSON_KEY: messages}
+  )
+  # The surface is not created again.
+  assert convert(genai_types.Part(function_response=response)) == messages[1:]
+
+
+def test_event_converter_deletes_surfaces_of_rejected_streams():
+  catalog = A2uiSchemaManager(
+      VERSION_0_9, catalogs=[BasicCatalog.get_config(VERSION_0_9)]
+  ).get_selected_catalog()
+  convert = _streaming_converter(catalog)
+  streamed = _stream_tool_call(convert, json.dumps(_streamed_messages(catalog)))
+  assert any(streamed)
+
+  response = genai_types.FunctionResponse(
+      name=A2UI_TOOL_NAME, id="call-1", response={A2UI_TOOL_ERROR_KEY: "Invalid"}
+  )
+  assert convert(genai_types.Part(function_response=response)) == [
+      {"version": "v0.9", "deleteSurface": {"surfaceId": "s"}}
+  ]
+
+
+def test_event_converter_keeps_existing_surfaces_of_rejected_streams():
+  catalog = A2uiSchemaManager(
+      VERSION_0_9, catalogs=[BasicCatalog.get_config(VERSION_0_9)]
+  ).get_selected_catalog()
+  convert = _streaming_converter(catalog)
+  update = {
+      "version": "v0.9",
+      "updateDataModel": {"surfaceId": "main", "path": "/title", "value": "Hi"},
+  }
+  streamed = _stream_tool_call(convert, json.dumps([update]))
+  assert [message for data in streamed for message in data] == [update]
+
+  # The surface was created by an earlier turn, so it is not deleted.
+  response = genai_types.FunctionResponse(
+      name=A2UI_TOOL_NAME, id="call-1", response={A2UI_TOOL_ERROR_KEY: "Invalid"}
+  )
+  assert convert(genai_types.Part(function_response=response)) == []
@@ -15,19 +15,37 @@
 """Tests for the A2uiPartConverter class."""
 
 import json
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from a2a import types as a2a_types
-from a2ui.a2a.parts import create_a2ui_part
+from a2ui.a2a.parts import create_a2ui_part, is_a2ui_part
 from a2ui.adk.a2a.part_converter import A2uiPartConverter
 from a2ui.adk.send_a2ui_to_client_toolset import SendA2uiToClientToolset
+from a2ui.basic_catalog import BasicCatalog
+from a2ui.schema.builder import Surface
 from a2ui.schema.catalog import A2uiCatalog
-from a2ui.schema.constants import A2UI_CLOSE_TAG, A2UI_OPEN_TAG
+from a2ui.schema.constants import (
+    A2UI_CLOSE_TAG,
+    A2UI_OPEN_TAG,
+    A2UI_TOOL_NAME,
+    A2UI_VALIDATED_JSON_KEY,
+    VERSION_0_9,
+)
+from a2ui.schema.manager import A2uiSchemaManager
+from a2ui.schema.validator import A2uiValidator
 from google.genai import types as genai_types
 
 
+@pytest.fixture(scope="module")
+def catalog_0_9():
+  manager = A2uiSchemaManager(
+      VERSION_0_9, catalogs=[BasicCatalog.get_config(VERSION_0_9)]
+  )
+  return manager.get_selected_catalog()
+
+
 def test_converter_class_convert_valid_tool_response():
   catalog_mock = MagicMock(spec=A2uiCatalog)
   converter = A2uiPartConverter(catalog_mock)
@@ -244,3 +262,84 @@ def test_converter_class_convert_tool_response_with_result_containing_invalid_a2
   a2a_parts = converter.convert(part)
   assert len(a2a_parts) == 1
   assert a2a_parts[0].root.text == custom_fallback
+
+
+@pytest.mark.asyncio
+async def test_converter_class_convert_async_text_with_a2ui():
+  catalog_mock = MagicMock(spec=A2uiCatalog)
+  executor = MagicMock()
+  converter = A2uiPartConverter(catalog_mock, validation_executor=executor)
+
+  valid_a2ui = [{"type": "Text", "text": "Hello"}]
+  catalog_mock.validator.validate_async = AsyncMock(return_value=None)
+
+  text = f"Here is the UI:\n{A2UI_OPEN_TAG}\n{json.dumps(valid_a2ui)}\n{A2UI_CLOSE_TAG}"
+  a2a_parts = await converter.convert_async(genai_types.Part(text=text))
+
+  assert len(a2a_parts) == 2
+  assert a2a_parts[0].root.text == "Here is the UI:"
+  assert a2a_parts[1] == create_a2ui_part(valid_a2ui[0])
+  catalog_mock.validator.validate_async.assert_awaited_once_with(
+      valid_a2ui, executor=executor
+  )
+  catalog_mock.validator.validate.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_converter_class_convert_async_invalid_a2ui_uses_fallback():
+  catalog_mock = MagicMock(spec=A2uiCatalog)
+  catalog_mock.validator.validate_async = AsyncMock(side_effect=ValueError("bad"))
+  converter = A2uiPartConverter(catalog_mock, fallback_text="Sorry")
+
+  text = f"{A2UI_OPEN_TAG}[{{}}]{A2UI_CLOSE_TAG}"
+  a2a_parts = await converter.convert_async(genai_types.Part(text=text))
+
+  assert len(a2a_parts) == 1
+  assert a2a_parts[0].root.text == "Sorry"
+
+
+def _built_messages(catalog):
+  return Surface(catalog, "s").text("root", text="Hello").build()
+
+
+def test_converter_class_accepts_built_messages_from_a2ui_tool(catalog_0_9):
+  converter = A2uiPartConverter(catalog_0_9)
+  messages = _built_messages(catalog_0_9)
+
+  function_response = genai_types.FunctionResponse(
+      name=A2UI_TOOL_NAME,
+      response={A2UI_VALIDATED_JSON_KEY: messages},
+  )
+  with patch.object(
+      A2uiValidator, "_validate_0_9_custom", autospec=True
+  ) as validate_schema:
+    a2a_parts = converter.convert(genai_types.Part(function_response=function_response))
+
+  assert a2a_parts == [create_a2ui_part(message) for message in messages]
+  validate_schema.assert_not_called()
+
+
+def test_converter_class_ignores_built_messages_from_other_tools(catalog_0_9):
+  converter = A2uiPartConverter(catalog_0_9)
+  function_response = genai_types.FunctionResponse(
+      name="render_booking_form",
+      response={A2UI_VALIDATED_JSON_KEY: _built_messages(catalog_0_9)},
+  )
+  a2a_parts = converter.convert(genai_types.Part(function_response=function_response))
+
+  assert not any(is_a2ui_part(part) for part in a2a_parts)
+
+
+def test_converter_class_validates_messages_built_for_another_catalog(catalog_0_9):
+  catalog_mock = MagicMock(spec=A2uiCatalog)
+  catalog_mock.validator.validate.side_effect = ValueError("invalid")
+  converter = A2uiPartConverter(catalog_mock)
+
+  function_response = genai_types.FunctionResponse(
+      name=A2UI_TOOL_NAME,
+      response={A2UI_VALIDATED_JSON_KEY: _built_messages(catalog_0_9)},
+  )
+  a2a_parts = converter.convert(genai_types.Part(function_response=function_response))
+
+  assert a2a_parts == []
+  catalog_mock.validator.validate.assert_called_once()
@@ -0,0 +1,152 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import glob
+import json
+import os
+from typing import Any, Optional
+from unittest.mock import MagicMock
+
+import pytest
+
+from a2ui.adk.function_schema import a2ui_messages_schema
+from a2ui.adk.send_a2ui_to_client_toolset import SendA2uiToClientToolset
+from a2ui.basic_catalog import BasicCatalog
+from a2ui.schema.catalog import A2uiCatalog
+from a2ui.schema.constants import VERSION_0_8, VERSION_0_9
+from a2ui.schema.manager import A2uiSchemaManager
+from a2ui.schema.rendering import estimate_tokens
+from google.adk.models import LlmRequest
+from google.adk.tools.tool_context import ToolContext
+from google.genai import types as genai_types
+
+_SPECIFICATION_DIR = os.path.join(
+    os.path.dirname(__file__), "../../../../specification"
+)
+_EXAMPLES_DIRS = {
+    VERSION_0_9: os.path.join(_SPECIFICATION_DIR, "v0_9/catalogs/basic/examples"),
+    VERSION_0_8: os.path.join(_SPECIFICATION_DIR, "v0_8/json/catalogs/basic/examples"),
+}
+_PYTHON_TYPES = {
+    genai_types.Type.STRING: str,
+    genai_types.Type.BOOLEAN: bool,
+    genai_types.Type.OBJECT: dict,
+    genai_types.Type.ARRAY: list,
+}
+
+
+def _basic_catalog(version: str):
+  return A2uiSchemaManager(
+      version, catalogs=[BasicCatalog.get_config(version)]
+  ).get_selected_catalog()
+
+
+def _bundled_examples(version: str) -> list[list[dict[str, Any]]]:
+  examples_dir = _EXAMPLES_DIRS[version]
+  if not os.path.isdir(examples_dir):
+    pytest.skip("Specification examples are not available")
+  examples = []
+  for path in sorted(glob.glob(os.path.join(examples_dir, "*.json"))):
+    with open(path, encoding="utf-8") as f:
+      data = json.load(f)
+    examples.append(data["messages"] if isinstance(data, dict) else data)
+  return examples
+
+
+def _mismatch(value: Any, schema: genai_types.Schema, path: str = "$") -> Optional[str]:
+  """Returns why `value` does not match `schema`, the way Gemini constrains it."""
+  if schema.any_of:
+    mismatches = [_mismatch(value, option, path) for option in schema.any_of]
+    return None if None in mismatches else mismatches[0]
+  if schema.type is None:
+    return None
+  if schema.type in (genai_types.Type.NUMBER, genai_types.Type.INTEGER):
+    matches = isinstance(value, (int, float)) and not isinstance(value, bool)
+  else:
+    matches = isinstance(value, _PYTHON_TYPES[schema.type])
+  if not matches:
+    return f"{path} is not {schema.type.value}"
+  if schema.enum and value not in schema.enum:
+    return f"{path} is not one of {schema.enum}"
+  if schema.type == genai_types.Type.OBJECT:
+    missing = [name for name in schema.required or [] if name not in value]
+    if missing:
+      return f"{path} misses {missing}"
+    for name, item in value.items():
+      if schema.properties:
+        if name not in schema.properties:
+          return f"{path}.{name} is not declared"
+        if mismatch := _mismatch(item, schema.properties[name], f"{path}.{name}"):
+          return mismatch
+  if schema.type == genai_types.Type.ARRAY and schema.items:
+    for i, item in enumerate(value):
+      if mismatch := _mismatch(item, schema.items, f"{path}[{i}]"):
+        return mismatch
+  return None
+
+
+def test_component_unions_are_flattened():
+  schema = a2ui_messages_schema(_basic_catalog(VERSION_0_9))
+
+  message = schema.items
+  assert message.required == ["version"]
+  assert "createSurface" in message.properties
+  component = message.properties["updateComponents"].properties["components"].items
+  assert component.type == genai_types.Type.OBJECT
+  assert component.required == ["id", "component"]
+  assert "Button" in component.properties["component"].enum
+  assert "$ref" not in json.dumps(schema.model_dump(mode="json", exclude_none=True))
+
+
+@pytest.mark.parametrize("version", [VERSION_0_9, VERSION_0_8])
+def test_schema_accepts_bundled_examples(version):
+  schema = a2ui_messages_schema(_basic_catalog(version))
+
+  for messages in _bundled_examples(version):
+    assert _mismatch(messages, schema) is None
+
+
+async def _request_tokens(catalog: A2uiCatalog, structured_args: bool) -> int:
+  """Estimates the tokens the A2UI tool adds to every LLM request."""
+  tool = SendA2uiToClientToolset._SendA2uiJsonToClientTool(
+      catalog, "", structured_args=structured_args
+  )
+  llm_request = LlmRequest()
+  tool_context_mock = MagicMock(spec=ToolContext)
+  tool_context_mock.invocation_id = "invocation"
+  await tool.process_llm_request(
+      tool_context=tool_context_mock, llm_request=llm_request
+  )
+  tools = [
+      tool.model_dump(mode="json", exclude_none=True)
+      for tool in llm_request.config.tools
+  ]
+  instructions = llm_request.config.system_instruction or ""
+  return estimate_tokens(instructions) + estimate_tokens(json.dumps(tools))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("version", [VERSION_0_9, VERSION_0_8])
+async def test_structured_args_reduce_tokens_per_step(version):
+  catalog = _basic_catalog(version)
+  string_input = await _request_tokens(catalog, structured_args=False)
+  structured_input = await _request_tokens(catalog, structured_args=True)
+
+  # The declared schema is sent with every step, and replaces most of the
+  # catalog instructions, so each step costs less even with the largest payload.
+  for messages in _bundled_examples(version):
+    string_output = estimate_tokens(json.dumps({"a2ui_json": json.dumps(messages)}))
+    structured_output = estimate_tokens(json.dumps({"a2ui_json": messages}))
+    assert structured_output < string_output
+    assert structured_input + structured_output < string_input + string_output
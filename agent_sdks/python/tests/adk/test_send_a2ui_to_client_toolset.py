@@ -13,13 +13,23 @@
 # limitations under the License.
 
 import json
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from a2ui.adk.send_a2ui_to_client_toolset import SendA2uiToClientToolset
-from a2ui.schema.catalog import A2uiCatalog
+from a2ui.adk.send_a2ui_to_client_toolset import (
+    SendA2uiToClientToolset,
+    relevant_examples_provider,
+)
+from a2ui.basic_catalog import BasicCatalog
+from a2ui.basic_catalog.provider import BundledCatalogProvider
+from a2ui.schema.catalog import A2uiCatalog, CatalogConfig
+from a2ui.schema.constants import A2UI_SCHEMA_BLOCK_START, VERSION_0_9
+from a2ui.schema.manager import A2uiSchemaManager
+from a2ui.schema.rendering import S2C_SECTION, render_sections
+from a2ui.schema.subsetting import ComponentUsageStats
 from google.adk.agents.readonly_context import ReadonlyContext
+from google.adk.models import LlmRequest
 from google.adk.tools.tool_context import ToolContext
 from google.genai import types as genai_types
 
@@ -111,6 +121,109 @@ async def test_toolset_get_tools_disabled():
   assert len(tools) == 0
 
 
+@pytest.mark.asyncio
+async def test_toolset_forwards_validation_executor():
+  executor = MagicMock()
+  catalog_mock = MagicMock(spec=A2uiCatalog)
+  toolset = SendA2uiToClientToolset(
+      a2ui_enabled=True,
+      a2ui_catalog=catalog_mock,
+      a2ui_examples="",
+      validation_executor=executor,
+  )
+  catalog_mock.validator.validate_async = AsyncMock(return_value=None)
+  tool_context_mock = MagicMock(spec=ToolContext)
+  tool_context_mock.actions = MagicMock(skip_summarization=False)
+
+  tool = toolset._ui_tools[0]
+  await tool.run_async(
+      args={tool.A2UI_JSON_ARG_NAME: "[]"}, tool_context=tool_context_mock
+  )
+  converter = await toolset.get_part_converter(MagicMock(spec=ReadonlyContext))
+
+  catalog_mock.validator.validate_async.assert_awaited_once_with([], executor=executor)
+  assert converter._validation_executor is executor
+
+
+def _invocation_context(invocation_id: str) -> MagicMock:
+  ctx = MagicMock(spec=ToolContext)
+  ctx.invocation_id = invocation_id
+  ctx.state = {}
+  return ctx
+
+
+@pytest.mark.asyncio
+async def test_toolset_resolves_providers_once_per_invocation():
+  catalog_mock = MagicMock(spec=A2uiCatalog)
+  catalog_provider = MagicMock(return_value=catalog_mock)
+  examples_provider = MagicMock(return_value="examples")
+  toolset = SendA2uiToClientToolset(
+      a2ui_enabled=True,
+      a2ui_catalog=catalog_provider,
+      a2ui_examples=examples_provider,
+  )
+  tool = toolset._ui_tools[0]
+
+  ctx = _invocation_context("invocation-1")
+  for _ in range(3):
+    await tool.process_llm_request(tool_context=ctx, llm_request=MagicMock())
+  await toolset.get_part_converter(ctx)
+  assert catalog_provider.call_count == 1
+  assert examples_provider.call_count == 1
+
+  await tool.process_llm_request(
+      tool_context=_invocation_context("invocation-2"), llm_request=MagicMock()
+  )
+  assert catalog_provider.call_count == 2
+
+  toolset.invalidate_cache("invocation-1")
+  await tool.process_llm_request(tool_context=ctx, llm_request=MagicMock())
+  assert catalog_provider.call_count == 3
+  assert examples_provider.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_toolset_renders_instructions_once_per_catalog():
+  # A name of its own, so no other test rendered this catalog instance.
+  a2ui_catalog = A2uiSchemaManager(
+      VERSION_0_9,
+      catalogs=[CatalogConfig("instructions", BundledCatalogProvider(VERSION_0_9))],
+  ).get_selected_catalog()
+  toolset = SendA2uiToClientToolset(
+      a2ui_enabled=True, a2ui_catalog=a2ui_catalog, a2ui_examples="examples"
+  )
+  tool = toolset._ui_tools[0]
+  instructions = []
+
+  # The catalog memoizes its instructions; the toolset keeps no copy of them.
+  with patch("a2ui.schema.catalog.render_sections", wraps=render_sections) as render:
+    for invocation_id in ("invocation-1", "invocation-2", "invocation-3"):
+      llm_request = MagicMock()
+      await tool.process_llm_request(
+          tool_context=_invocation_context(invocation_id), llm_request=llm_request
+      )
+      instructions.append(llm_request.append_instructions.call_args.args[0][0])
+      toolset.invalidate_cache()
+
+  render.assert_called_once()
+  assert instructions == [a2ui_catalog.render_as_llm_instructions()] * 3
+
+
+@pytest.mark.asyncio
+async def test_toolset_without_resolution_cache_calls_providers_every_time():
+  catalog_provider = MagicMock(return_value=MagicMock(spec=A2uiCatalog))
+  toolset = SendA2uiToClientToolset(
+      a2ui_enabled=True,
+      a2ui_catalog=catalog_provider,
+      a2ui_examples="examples",
+      resolution_cache_size=0,
+  )
+  ctx = _invocation_context("invocation-1")
+  await toolset.get_part_converter(ctx)
+  await toolset.get_part_converter(ctx)
+  assert catalog_provider.call_count == 2
+
+
 # endregion
 
 # region SendA2uiJsonToClientTool Tests
@@ -158,6 +271,22 @@ async def test_send_tool_resolve_examples():
   assert examples == "examples"
 
 
+@pytest.mark.asyncio
+async def test_send_tool_resolve_relevant_examples(tmp_path):
+  (tmp_path / "flight.json").write_text('{"name": "Flight status"}')
+  (tmp_path / "login.json").write_text('{"name": "Login form"}')
+  tool = SendA2uiToClientToolset._SendA2uiJsonToClientTool(
+      MagicMock(spec=A2uiCatalog), relevant_examples_provider(str(tmp_path), top_k=1)
+  )
+  ctx = MagicMock(spec=ReadonlyContext)
+  ctx.user_content = genai_types.Content(
+      role="user", parts=[genai_types.Part(text="Show me the login form")]
+  )
+
+  examples = await tool._resolve_a2ui_examples(ctx)
+  assert examples == '---BEGIN login---\n{"name": "Login form"}\n---END login---'
+
+
 @pytest.mark.asyncio
 async def test_send_tool_process_llm_request():
   catalog_mock = MagicMock(spec=A2uiCatalog)
@@ -180,6 +309,71 @@ async def test_send_tool_process_llm_request():
   assert "examples" in instructions
 
 
+@pytest.mark.asyncio
+async def test_send_tool_process_llm_request_declares_structured_args():
+  a2ui_catalog = A2uiSchemaManager(
+      VERSION_0_9, catalogs=[BasicCatalog.get_config(VERSION_0_9)]
+  ).get_selected_catalog()
+  tool = SendA2uiToClientToolset._SendA2uiJsonToClientTool(
+      a2ui_catalog, "examples", structured_args=True
+  )
+  llm_request = LlmRequest()
+
+  await tool.process_llm_request(
+      tool_context=_invocation_context("invocation-1"), llm_request=llm_request
+  )
+
+  (declaration,) = llm_request.config.tools[0].function_declarations
+  parameter = declaration.parameters.properties[tool.A2UI_JSON_ARG_NAME]
+  assert parameter.type == genai_types.Type.ARRAY
+  assert "updateComponents" in parameter.items.properties
+  # The instructions only hold what the declared schema doesn't.
+  instructions = llm_request.config.system_instruction
+  assert "\nButton extends " in instructions
+  assert S2C_SECTION not in instructions
+  # The description points to the declared schema, not the instructions.
+  assert A2UI_SCHEMA_BLOCK_START not in declaration.description
+  assert "declared schema" in declaration.description
+
+
+@pytest.mark.asyncio
+async def test_send_tool_process_llm_request_enables_argument_streaming():
+  catalog_mock = MagicMock(spec=A2uiCatalog)
+  catalog_mock.render_as_llm_instructions.return_value = "rendered_catalog"
+  tool = SendA2uiToClientToolset._SendA2uiJsonToClientTool(
+      catalog_mock, "examples", stream_args=True
+  )
+  llm_request = LlmRequest()
+
+  await tool.process_llm_request(
+      tool_context=_invocation_context("invocation-1"), llm_request=llm_request
+  )
+
+  function_calling_config = llm_request.config.tool_config.function_calling_config
+  assert function_calling_config.stream_function_call_arguments is True
+
+
+@pytest.mark.asyncio
+async def test_send_tool_run_async_structured_args():
+  catalog_mock = MagicMock(spec=A2uiCatalog)
+  catalog_mock.validator.validate_async = AsyncMock(return_value=None)
+  tool = SendA2uiToClientToolset._SendA2uiJsonToClientTool(
+      catalog_mock, "examples", structured_args=True
+  )
+  tool_context_mock = MagicMock(spec=ToolContext)
+  tool_context_mock.actions = MagicMock(skip_summarization=False)
+
+  message = {"version": "v0.9", "deleteSurface": {"surfaceId": "s"}}
+  result = await tool.run_async(
+      args={tool.A2UI_JSON_ARG_NAME: [message]}, tool_context=tool_context_mock
+  )
+
+  assert result == {tool.VALIDATED_A2UI_JSON_KEY: [message]}
+  catalog_mock.validator.validate_async.assert_awaited_once_with(
+      [message], executor=None
+  )
+
+
 @pytest.mark.asyncio
 async def test_send_tool_run_async_valid():
   catalog_mock = MagicMock(spec=A2uiCatalog)
@@ -189,7 +383,7 @@ async def test_send_tool_run_async_valid():
   tool_context_mock.actions = MagicMock(skip_summarization=False)
 
   valid_a2ui = [{"type": "Text", "text": "Hello"}]
-  catalog_mock.validator.validate.return_value = None
+  catalog_mock.validator.validate_async = AsyncMock(return_value=None)
   args = {
       SendA2uiToClientToolset._SendA2uiJsonToClientTool.A2UI_JSON_ARG_NAME: json.dumps(
           valid_a2ui
@@ -203,7 +397,32 @@ async def test_send_tool_run_async_valid():
       )
   }
   assert tool_context_mock.actions.skip_summarization == True
-  catalog_mock.validator.validate.assert_called_once_with(valid_a2ui)
+  catalog_mock.validator.validate_async.assert_awaited_once_with(
+      valid_a2ui, executor=None
+  )
+
+
+@pytest.mark.asyncio
+async def test_send_tool_run_async_records_component_usage():
+  catalog_mock = MagicMock(spec=A2uiCatalog)
+  catalog_mock.validator.validate_async = AsyncMock(return_value=None)
+  stats = ComponentUsageStats()
+  tool = SendA2uiToClientToolset._SendA2uiJsonToClientTool(
+      catalog_mock, "examples", component_usage_stats=stats
+  )
+  tool_context_mock = MagicMock(spec=ToolContext)
+  tool_context_mock.actions = MagicMock(skip_summarization=False)
+  tool_context_mock.user_content = genai_types.Content(
+      role="user", parts=[genai_types.Part(text="Show my profile")]
+  )
+  a2ui = [{"updateComponents": {"components": [{"id": "root", "component": "Card"}]}}]
+
+  await tool.run_async(
+      args={tool.A2UI_JSON_ARG_NAME: json.dumps(a2ui)}, tool_context=tool_context_mock
+  )
+
+  assert stats.component_usage == {"Card": 1}
+  assert stats.to_dict()["termComponents"]["profile"] == {"Card": 1}
 
 
 @pytest.mark.asyncio
@@ -215,7 +434,7 @@ async def test_send_tool_run_async_valid_list():
   tool_context_mock.actions = MagicMock(skip_summarization=False)
 
   valid_a2ui = [{"type": "Text", "text": "Hello"}]
-  catalog_mock.validator.validate.return_value = None
+  catalog_mock.validator.validate_async = AsyncMock(return_value=None)
   args = {
       SendA2uiToClientToolset._SendA2uiJsonToClientTool.A2UI_JSON_ARG_NAME: json.dumps(
           valid_a2ui
@@ -229,7 +448,9 @@ async def test_send_tool_run_async_valid_list():
       )
   }
   assert tool_context_mock.actions.skip_summarization == True
-  catalog_mock.validator.validate.assert_called_once_with(valid_a2ui)
+  catalog_mock.validator.validate_async.assert_awaited_once_with(
+      valid_a2ui, executor=None
+  )
 
 
 @pytest.mark.asyncio
@@ -261,8 +482,8 @@ async def test_send_tool_run_async_invalid_json():
 @pytest.mark.asyncio
 async def test_send_tool_run_async_schema_validation_fail():
   catalog_mock = MagicMock(spec=A2uiCatalog)
-  catalog_mock.validator.validate.side_effect = Exception(
-      "'text' is a required property"
+  catalog_mock.validator.validate_async = AsyncMock(
+      side_effect=Exception("'text' is a required property")
   )
   tool = SendA2uiToClientToolset._SendA2uiJsonToClientTool(catalog_mock, "examples")
   invalid_a2ui = [{"type": "Text"}]  # Missing 'text'
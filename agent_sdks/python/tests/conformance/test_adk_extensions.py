@@ -48,7 +48,7 @@ cases_adk_extensions = get_conformance_cases("adk_extensions.yaml")
 def test_adk_extensions_conformance(name, test_case):
   from a2ui.adk.send_a2ui_to_client_toolset import SendA2uiToClientToolset
   from a2ui.schema.catalog import A2uiCatalog
-  from unittest.mock import MagicMock
+  from unittest.mock import AsyncMock, MagicMock
 
   action = test_case["action"]
   args = test_case.get("args", {})
@@ -58,7 +58,7 @@ def test_adk_extensions_conformance(name, test_case):
     tool_args = {"a2ui_json": a2ui_json_str} if a2ui_json_str else args
 
     catalog_mock = MagicMock(spec=A2uiCatalog)
-    catalog_mock.validator.validate.return_value = None
+    catalog_mock.validator.validate_async = AsyncMock(return_value=None)
 
     tool = SendA2uiToClientToolset._SendA2uiJsonToClientTool(catalog_mock, "examples")
 
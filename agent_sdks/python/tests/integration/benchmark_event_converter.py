@@ -0,0 +1,107 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Measures the events per second converted by A2uiEventConverter.
+
+Each event carries a text part with an A2UI block, as produced by a streaming
+turn. The session state holds the catalog either as a reference, or as a
+catalog object deserialized again for every event (as with persistent session
+services). Run with:
+
+  PYTHONPATH=src python tests/integration/benchmark_event_converter.py
+"""
+
+import json
+import pickle
+import time
+import types
+import warnings
+
+from a2ui.adk.a2a.event_converter import A2uiEventConverter
+from a2ui.basic_catalog import BasicCatalog
+from a2ui.schema.catalog_refs import catalog_ref
+from a2ui.schema.constants import A2UI_CLOSE_TAG, A2UI_OPEN_TAG, VERSION_0_9
+from a2ui.schema.manager import A2uiSchemaManager
+from google.adk.events.event import Event
+from google.genai import types as genai_types
+
+DURATION_SECONDS = 2.0
+
+
+def _event(catalog_id: str) -> Event:
+  messages = [
+      {
+          "version": "v0.9",
+          "createSurface": {"surfaceId": "s", "catalogId": catalog_id},
+      },
+      {
+          "version": "v0.9",
+          "updateComponents": {
+              "surfaceId": "s",
+              "components": [{"id": "root", "component": "Text", "text": "Hi"}],
+          },
+      },
+  ]
+  text = f"Here you go.{A2UI_OPEN_TAG}{json.dumps(messages)}{A2UI_CLOSE_TAG}"
+  return Event(
+      author="agent",
+      content=genai_types.Content(role="model", parts=[genai_types.Part(text=text)]),
+  )
+
+
+def _context(state_value):
+  return types.SimpleNamespace(
+      session=types.SimpleNamespace(state={"system:a2ui_catalog": state_value}, id="s"),
+      app_name="benchmark",
+      user_id="user",
+      invocation_id="invocation",
+      branch=None,
+  )
+
+
+def events_per_second(
+    converter: A2uiEventConverter, event: Event, state_value
+) -> float:
+  """Converts `event` repeatedly for `DURATION_SECONDS`."""
+  pickled = pickle.dumps(state_value)
+  count = 0
+  start = time.perf_counter()
+  while time.perf_counter() - start < DURATION_SECONDS:
+    value = pickle.loads(pickled)
+    converter(event, _context(value), task_id="task", context_id="context")
+    count += 1
+  return count / (time.perf_counter() - start)
+
+
+def main():
+  warnings.simplefilter("ignore")
+  catalog = A2uiSchemaManager(
+      VERSION_0_9, catalogs=[BasicCatalog.get_config(VERSION_0_9)]
+  ).get_selected_catalog()
+  event = _event(catalog.catalog_id)
+  states = {
+      "deserialized catalog": catalog,
+      "catalog reference": catalog_ref(catalog),
+  }
+  print(f"{'session state':<22} {'uncached (ev/s)':>16} {'cached (ev/s)':>14}")
+  for label, state_value in states.items():
+    uncached = events_per_second(
+        A2uiEventConverter(converter_cache_size=0), event, state_value
+    )
+    cached = events_per_second(A2uiEventConverter(), event, state_value)
+    print(f"{label:<22} {uncached:>16.0f} {cached:>14.0f}")
+
+
+if __name__ == "__main__":
+  main()
@@ -30,6 +30,7 @@ from a2ui.parser.constants import (
     MSG_TYPE_DATA_MODEL_UPDATE,
 )
 from a2ui.schema.catalog import A2uiCatalog
+from a2ui.schema.validator import LazyValidationError, VALIDATION_MODE_FAIL_FAST
 from a2ui.parser.streaming import A2uiStreamParser
 from a2ui.parser.response_part import ResponsePart
 
@@ -390,6 +391,39 @@ def test_streaming_msg_type_deduplication(mock_catalog):
   assert not parser.msg_types
 
 
+def test_partial_messages_are_validated_fail_fast(mock_catalog):
+  parser = A2uiStreamParser(catalog=mock_catalog)
+  format_error = MagicMock(return_value="formatted")
+
+  def validate(message, root_id=None, strict_integrity=True, mode=None):
+    if mode == VALIDATION_MODE_FAIL_FAST:
+      raise LazyValidationError(format_error)
+
+  parser._validator = MagicMock()
+  parser._validator.validate.side_effect = validate
+
+  messages = parser.process_chunk(
+      A2UI_OPEN_TAG
+      + '[{"version": "v0.9", "createSurface": {"surfaceId": "s1", "catalogId":'
+      ' "c1"}}, {"version": "v0.9", "updateComponents": {"surfaceId": "s1",'
+      ' "root": "root", "components": [{"id": "root", "component": "Text",'
+      ' "text": "Hello"}'
+  )
+
+  modes = [
+      call.kwargs.get("mode") for call in parser._validator.validate.call_args_list
+  ]
+  assert VALIDATION_MODE_FAIL_FAST in modes
+  # The invalid partial update is dropped without formatting the error.
+  assert all(
+      MSG_TYPE_UPDATE_COMPONENTS not in message
+      for part in messages
+      for message in part.a2ui_json or []
+  )
+  # Dropped partial messages never pay for formatting the error.
+  format_error.assert_not_called()
+
+
 def test_v09_path_heuristic_relative_path(mock_catalog):
   """Tests that v0.9 allows relative paths (no leading slash)."""
   parser = A2uiStreamParser(catalog=mock_catalog)
@@ -0,0 +1,228 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import copy
+import json
+import pickle
+from unittest.mock import patch
+
+import pytest
+
+from a2ui.basic_catalog import BasicCatalog
+from a2ui.schema.builder import Surface
+from a2ui.schema.constants import VERSION_0_8, VERSION_0_9
+from a2ui.schema.manager import A2uiSchemaManager
+from a2ui.schema.validator import _BUILDER_TOKEN, A2uiValidator, ValidatedMessages
+
+
+@pytest.fixture(scope="module")
+def catalog_0_9():
+  manager = A2uiSchemaManager(
+      VERSION_0_9, catalogs=[BasicCatalog.get_config(VERSION_0_9)]
+  )
+  return manager.get_selected_catalog()
+
+
+@pytest.fixture(scope="module")
+def catalog_0_8():
+  manager = A2uiSchemaManager(
+      VERSION_0_8, catalogs=[BasicCatalog.get_config(VERSION_0_8)]
+  )
+  return manager.get_selected_catalog()
+
+
+def _greeting(catalog):
+  return (
+      Surface(catalog, "greeting")
+      .column("root", children=["title", "body"])
+      .text("title", text="Hello", variant="h1")
+      .text("body", text={"path": "/message"})
+  )
+
+
+def test_build_v0_9(catalog_0_9):
+  messages = _greeting(catalog_0_9).data_model({"message": "Hi"}).build()
+
+  assert isinstance(messages, ValidatedMessages)
+  assert list(messages) == [
+      {
+          "version": "v0.9",
+          "createSurface": {
+              "surfaceId": "greeting",
+              "catalogId": catalog_0_9.catalog_id,
+          },
+      },
+      {
+          "version": "v0.9",
+          "updateComponents": {
+              "surfaceId": "greeting",
+              "components": [
+                  {"id": "root", "component": "Column", "children": ["title", "body"]},
+                  {
+                      "id": "title",
+                      "component": "Text",
+                      "text": "Hello",
+                      "variant": "h1",
+                  },
+                  {"id": "body", "component": "Text", "text": {"path": "/message"}},
+              ],
+          },
+      },
+      {
+          "version": "v0.9",
+          "updateDataModel": {"surfaceId": "greeting", "value": {"message": "Hi"}},
+      },
+  ]
+  # The output is also valid when validated from scratch.
+  catalog_0_9.validator.validate(list(messages))
+
+
+def test_build_v0_8(catalog_0_8):
+  messages = (
+      Surface(catalog_0_8, "greeting", root_id="main")
+      .column("main", children={"explicitList": ["title"]})
+      .text("title", text={"literalString": "Hello"}, weight=1)
+      .data_model([{"key": "name", "valueString": "Ada"}])
+      .build()
+  )
+
+  assert messages[0]["beginRendering"]["root"] == "main"
+  assert messages[1]["surfaceUpdate"]["components"][1] == {
+      "id": "title",
+      "component": {"Text": {"text": {"literalString": "Hello"}}},
+      "weight": 1,
+  }
+  assert messages[2] == {
+      "dataModelUpdate": {
+          "surfaceId": "greeting",
+          "contents": [{"key": "name", "valueString": "Ada"}],
+      }
+  }
+  catalog_0_8.validator.validate(list(messages))
+
+
+def test_component_is_validated_when_added(catalog_0_9):
+  surface = Surface(catalog_0_9, "s")
+  with pytest.raises(ValueError, match="'text' is a required property"):
+    surface.text("title", variant="h1")
+  with pytest.raises(ValueError, match="Unknown component: Carousel"):
+    surface.component("Carousel", "c")
+  with pytest.raises(AttributeError):
+    surface.carousel("c")
+
+
+def test_method_names_map_to_components(catalog_0_9):
+  surface = Surface(catalog_0_9, "s").choice_picker(
+      "root", options=[{"label": "A", "value": "a"}], value=["a"]
+  )
+  assert surface.build()[1]["updateComponents"]["components"][0]["component"] == (
+      "ChoicePicker"
+  )
+
+
+def test_build_checks_references(catalog_0_9):
+  surface = Surface(catalog_0_9, "s").column("root", children=["missing"])
+  with pytest.raises(ValueError, match="references non-existent component"):
+    surface.build()
+  with pytest.raises(ValueError, match="Missing root component"):
+    Surface(catalog_0_9, "s").text("title", text="Hi").build()
+
+
+def test_surfaces_are_immutable_and_share_components(catalog_0_9):
+  template = _greeting(catalog_0_9)
+  first = template.data_model({"message": "one"})
+  second = template.text("title", text="Replaced")
+
+  assert template.component_ids == ["root", "title", "body"]
+  assert second.component_ids == ["root", "title", "body"]
+  assert len(template.build()) == 2
+  first_components = first.build()[1]["updateComponents"]["components"]
+  second_components = second.build()[1]["updateComponents"]["components"]
+  assert first_components[1]["text"] == "Hello"
+  assert second_components[1]["text"] == "Replaced"
+  # Unchanged components are shared between surfaces, not copied.
+  assert first._components[0] is second._components[0]
+  assert first._components[2] is second._components[2]
+
+
+def test_built_messages_are_immutable_and_shared(catalog_0_9):
+  data = {"message": "Hello"}
+  surface = _greeting(catalog_0_9).data_model(data)
+  data["message"] = "Changed"
+  first = surface.build()
+  components = first[1]["updateComponents"]["components"]
+  with pytest.raises(TypeError):
+    components[1]["text"] = "Changed"
+  with pytest.raises(TypeError):
+    components.append({})
+  with pytest.raises(TypeError):
+    first[0] = {}
+  with pytest.raises(TypeError):
+    ValidatedMessages(list(first), catalog_0_9, object())
+  assert first[2]["updateDataModel"]["value"] == {"message": "Hello"}
+
+  # Builds share the messages, and derived surfaces share the components.
+  assert surface.build()[1] is first[1]
+  derived = surface.data_model({"message": "Bye"}).build()
+  assert derived[1]["updateComponents"]["components"][0] is components[0]
+
+  # Copies are plain, mutable JSON.
+  copied = pickle.loads(pickle.dumps(first))
+  copied[1]["updateComponents"]["components"][1]["text"] = "Changed"
+  assert type(copied) is tuple and copied != first
+  assert json.loads(json.dumps(first)) == list(first)
+
+
+def test_build_is_memoized(catalog_0_9):
+  surface = _greeting(catalog_0_9)
+  with patch.object(A2uiValidator, "validate", autospec=True) as validate:
+    surface.build()
+    surface.build()
+  assert validate.call_count == 1
+
+
+def test_validator_skips_prevalidated_messages(catalog_0_9):
+  messages = _greeting(catalog_0_9).build()
+  validator = catalog_0_9.validator
+  with patch.object(validator, "_validate_0_9_custom") as validate_schema:
+    validator.validate(messages)
+    validate_schema.assert_not_called()
+
+    # Plain copies are validated as usual.
+    validator.validate(list(messages))
+    validate_schema.assert_called_once()
+
+
+def test_validator_checks_integrity_of_prevalidated_messages(catalog_0_9):
+  messages = _greeting(catalog_0_9).build()
+  with pytest.raises(TypeError):
+    messages[1]["updateComponents"]["components"][0]["children"].append("missing")
+  # Prevalidated messages only skip the schema checks.
+  edited = copy.deepcopy(messages)
+  edited[1]["updateComponents"]["components"][0]["children"].append("missing")
+  prevalidated = ValidatedMessages(edited, catalog_0_9, _BUILDER_TOKEN)
+  with pytest.raises(ValueError, match="references non-existent component"):
+    catalog_0_9.validator.validate(prevalidated)
+
+
+def test_validator_rejects_messages_from_another_catalog(catalog_0_8, catalog_0_9):
+  messages = _greeting(catalog_0_9).build()
+  assert not messages.is_validated_for(catalog_0_8)
+  with pytest.raises(ValueError):
+    catalog_0_8.validator.validate(messages)
+
+
+def test_v0_9_surfaces_require_root_id(catalog_0_9):
+  with pytest.raises(ValueError, match="must use 'root'"):
+    Surface(catalog_0_9, "s", root_id="main")
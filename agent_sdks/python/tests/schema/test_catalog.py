@@ -14,15 +14,32 @@
 
 import json
 import os
+import pickle
 import pytest
+from dataclasses import replace
 from typing import Any, Dict, List
-from a2ui.schema.catalog import A2uiCatalog
+from unittest.mock import patch
+from a2ui.basic_catalog import BasicCatalog
+from a2ui.basic_catalog.provider import BundledCatalogProvider
+from a2ui.schema.artifacts import (
+    CatalogArtifacts,
+    build_catalog_artifacts,
+    dump_catalog_artifacts,
+)
+from a2ui.schema.catalog import A2uiCatalog, CatalogConfig, intern_catalog
+from a2ui.schema.http_catalog_provider import HttpCatalogProvider
 from a2ui.schema.constants import (
     A2UI_SCHEMA_BLOCK_START,
     A2UI_SCHEMA_BLOCK_END,
     VERSION_0_8,
     VERSION_0_9,
 )
+from a2ui.schema.manager import A2uiSchemaManager
+from a2ui.schema.rendering import CompactRenderOptions, estimate_tokens
+from a2ui.schema.validator import (
+    extract_component_ref_fields,
+    extract_component_required_fields,
+)
 from a2ui.basic_catalog.constants import BASIC_CATALOG_NAME
 
 
@@ -77,11 +94,12 @@ def test_catalog_config_from_path_schemes():
   )
   assert config.provider.path == "/absolute_path/to/catalog.json"
 
-  # Test HTTP raises NotImplementedError
-  with pytest.raises(NotImplementedError, match="HTTP support is coming soon."):
-    CatalogConfig.from_path(
-        name="test_http", catalog_path="http://a2ui.org/catalog.json"
-    )
+  # Test http(s):// scheme
+  config = CatalogConfig.from_path(
+      name="test_http", catalog_path="https://a2ui.org/catalog.json"
+  )
+  assert isinstance(config.provider, HttpCatalogProvider)
+  assert config.provider.url == "https://a2ui.org/catalog.json"
 
   # Test unsupported scheme raises ValueError
   with pytest.raises(ValueError, match="Unsupported catalog URL scheme"):
@@ -97,3 +115,432 @@ def test_basic_catalog_get_config_examples_path():
       version=VERSION_0_9, examples_path="file:///absolute/examples"
   )
   assert config.examples_path == "/absolute/examples"
+
+
+def test_catalog_caches_compiled_artifacts():
+  catalog = A2uiCatalog(
+      version=VERSION_0_9,
+      name="test",
+      s2c_schema={"$id": "https://a2ui.org/specification/v0_9/server_to_client.json"},
+      common_types_schema={},
+      catalog_schema={"catalogId": "test", "components": {}},
+  )
+
+  assert catalog.validator is catalog.validator
+  assert catalog.render_as_llm_instructions() is catalog.render_as_llm_instructions()
+
+  # Compiled artifacts are not pickled; they are rebuilt on first use.
+  restored = pickle.loads(pickle.dumps(catalog))
+  assert "validator" not in restored.__dict__
+  assert restored == catalog
+  assert restored.validator is not catalog.validator
+
+
+def _simple_catalog(name="test", components=None):
+  return A2uiCatalog(
+      version=VERSION_0_9,
+      name=name,
+      s2c_schema={},
+      common_types_schema={},
+      catalog_schema={"catalogId": "test", "components": components or {}},
+  )
+
+
+def test_catalogs_hash_by_content():
+  catalog = _simple_catalog(components={"Text": {}})
+  equal = _simple_catalog(components={"Text": {}})
+
+  assert equal == catalog
+  assert hash(equal) == hash(catalog)
+  assert {catalog: "cached"}[equal] == "cached"
+  assert _simple_catalog(components={"Image": {}}) != catalog
+  assert _simple_catalog(name="other", components={"Text": {}}) != catalog
+
+
+def test_intern_catalog_returns_live_equal_catalog():
+  catalog = intern_catalog(_simple_catalog(components={"Text": {}}))
+
+  assert intern_catalog(_simple_catalog(components={"Text": {}})) is catalog
+  assert intern_catalog(_simple_catalog(components={"Image": {}})) is not catalog
+
+
+def test_equal_prunings_share_one_catalog(pruning_catalog):
+  # Unknown components are ignored, so both prune to the same content.
+  pruned = pruning_catalog.with_pruning(allowed_components=["Column"])
+  assert (
+      pruning_catalog.with_pruning(allowed_components=["Column", "Missing"]) is pruned
+  )
+
+
+@pytest.fixture
+def pruning_catalog():
+  return A2uiCatalog(
+      version=VERSION_0_9,
+      name="test",
+      s2c_schema={
+          "oneOf": [
+              {"$ref": "#/$defs/CreateSurfaceMessage"},
+              {"$ref": "#/$defs/UpdateComponentsMessage"},
+          ],
+          "$defs": {
+              "CreateSurfaceMessage": {
+                  "properties": {"theme": {"$ref": "common_types.json#/$defs/Theme"}}
+              },
+              "UpdateComponentsMessage": {
+                  "properties": {"components": {"$ref": "#/$defs/ComponentList"}}
+              },
+              "ComponentList": {"type": "array"},
+          },
+      },
+      common_types_schema={
+          "$defs": {
+              "Theme": {"$ref": "#/$defs/Color"},
+              "Color": {"type": "string"},
+              "DynamicString": {"type": "string"},
+              "Unused": {"type": "number"},
+          }
+      },
+      catalog_schema={
+          "catalogId": "test",
+          "components": {
+              "Text": {
+                  "properties": {
+                      "text": {"$ref": "common_types.json#/$defs/DynamicString"}
+                  }
+              },
+              "Column": {"properties": {"children": {"type": "array"}}},
+          },
+          "$defs": {
+              "anyComponent": {
+                  "oneOf": [
+                      {"$ref": "#/components/Text"},
+                      {"$ref": "#/components/Column"},
+                  ]
+              }
+          },
+      },
+  )
+
+
+def test_with_pruning(pruning_catalog):
+  pruned = pruning_catalog.with_pruning(
+      allowed_components=["Column"], allowed_messages=["UpdateComponentsMessage"]
+  )
+
+  assert list(pruned.catalog_schema["components"]) == ["Column"]
+  assert pruned.catalog_schema["$defs"]["anyComponent"]["oneOf"] == [
+      {"$ref": "#/components/Column"}
+  ]
+  assert pruned.s2c_schema["oneOf"] == [{"$ref": "#/$defs/UpdateComponentsMessage"}]
+  assert list(pruned.s2c_schema["$defs"]) == [
+      "UpdateComponentsMessage",
+      "ComponentList",
+  ]
+  # Neither Text nor CreateSurfaceMessage is kept, so no common type is used.
+  assert pruned.common_types_schema["$defs"] == {}
+
+  pruned = pruning_catalog.with_pruning(allowed_components=["Text"])
+  assert list(pruned.common_types_schema["$defs"]) == [
+      "Theme",
+      "Color",
+      "DynamicString",
+  ]
+
+
+def test_with_pruning_shares_structure(pruning_catalog):
+  original_components = dict(pruning_catalog.catalog_schema["components"])
+  pruned = pruning_catalog.with_pruning(allowed_components=["Text"])
+
+  assert pruned.catalog_schema["components"]["Text"] is original_components["Text"]
+  assert pruned.s2c_schema is pruning_catalog.s2c_schema
+  assert pruning_catalog.catalog_schema["components"] == original_components
+
+
+def test_with_pruning_is_memoized(pruning_catalog):
+  first = pruning_catalog.with_pruning(["Text", "Column"], ["CreateSurfaceMessage"])
+  second = pruning_catalog.with_pruning(["Column", "Text"], ["CreateSurfaceMessage"])
+
+  assert first is second
+  assert pruning_catalog.with_pruning() is pruning_catalog.with_pruning([], [])
+  assert pruning_catalog.with_pruning(["Text"]) is not first
+
+
+@pytest.fixture
+def verbose_catalog():
+  return A2uiCatalog(
+      version=VERSION_0_9,
+      name="test",
+      s2c_schema={},
+      common_types_schema={
+          "$schema": "https://json-schema.org/draft/2020-12/schema",
+          "$id": "https://a2ui.org/specification/v0_9/common_types.json",
+          "$defs": {
+              "DynamicString": {
+                  "description": "A string. It may also be bound to the data model.",
+                  "oneOf": [{"type": "string"}, {"$ref": "#/$defs/DataBinding"}],
+              },
+              "DataBinding": {
+                  "type": "object",
+                  "properties": {"path": {"type": "string", "pattern": "^/"}},
+                  "required": ["path"],
+                  "additionalProperties": False,
+              },
+          },
+      },
+      catalog_schema={
+          "catalogId": "test",
+          "components": {
+              "Text": {
+                  "description": "Displays text.",
+                  "type": "object",
+                  "properties": {
+                      "component": {"const": "Text"},
+                      "text": {
+                          "$ref": (
+                              "https://a2ui.org/specification/v0_9/common_types.json#/$defs/DynamicString"
+                          )
+                      },
+                      "variant": {"enum": ["h1", "body"], "description": "Style."},
+                  },
+                  "required": ["component", "text"],
+              },
+              "Image": {
+                  "type": "object",
+                  "properties": {
+                      "component": {"const": "Image"},
+                      "url": {"type": "string", "format": "uri", "minLength": 1},
+                  },
+                  "required": ["component", "url"],
+              },
+              "Divider": {
+                  "type": "object",
+                  "properties": {"component": {"const": "Divider"}},
+                  "required": ["component"],
+              },
+          },
+      },
+  )
+
+
+def test_compact_rendering(verbose_catalog):
+  rendered = verbose_catalog.render_as_llm_instructions(CompactRenderOptions())
+  common_types = json.loads(
+      rendered.split("### Common Types Schema:\n")[1].split("\n\n")[0]
+  )
+
+  # Descriptions and validation keywords are dropped, and DataBinding, which is
+  # referenced once, is inlined.
+  assert common_types == {
+      "$defs": {
+          "DynamicString": {
+              "oneOf": [
+                  {"type": "string"},
+                  {
+                      "type": "object",
+                      "properties": {"path": {"type": "string"}},
+                      "required": ["path"],
+                  },
+              ]
+          }
+      }
+  }
+  assert '"$ref":"common_types.json#/$defs/DynamicString"' in rendered
+  assert '"format"' not in rendered
+  # The default rendering is unchanged.
+  assert "Displays text." in verbose_catalog.render_as_llm_instructions()
+
+  rendered = verbose_catalog.render_as_llm_instructions(
+      CompactRenderOptions(max_description_length=20, inline_single_use_defs=False)
+  )
+  assert '"description":"A string."' in rendered
+  assert '"DataBinding"' in rendered
+
+
+def test_compact_rendering_component_signatures(verbose_catalog):
+  rendered = verbose_catalog.render_as_llm_instructions(
+      CompactRenderOptions(component_signatures=True)
+  )
+
+  assert rendered.split("### Components:\n")[1].splitlines()[:3] == [
+      'Text { text: DynamicString; variant?: "h1" | "body" }',
+      "Image { url: string }",
+      "Divider {}",
+  ]
+  assert '"components"' not in rendered
+
+
+def test_compact_rendering_token_budget(verbose_catalog):
+  options = CompactRenderOptions(component_signatures=True)
+  full = verbose_catalog.estimate_llm_instruction_tokens(options)
+  assert full["total"] > full["Components"] > 0
+
+  budgeted = verbose_catalog.render_as_llm_instructions(
+      replace(options, max_tokens=full["total"] - 1, component_usage={"Image": 3})
+  )
+  # Unused components are dropped first, starting from the end of the catalog.
+  assert "Divider" not in budgeted
+  assert "Image { url: string }" in budgeted
+  assert estimate_tokens(budgeted) < full["total"]
+
+  budgeted = verbose_catalog.render_as_llm_instructions(replace(options, max_tokens=1))
+  assert "Text {" in budgeted
+
+
+def test_compact_rendering_of_basic_catalog():
+  manager = A2uiSchemaManager(
+      VERSION_0_9, catalogs=[BasicCatalog.get_config(VERSION_0_9)]
+  )
+  catalog = manager.get_selected_catalog()
+  options = CompactRenderOptions(component_signatures=True)
+
+  assert (
+      catalog.estimate_llm_instruction_tokens(options)["total"]
+      < catalog.estimate_llm_instruction_tokens()["total"] / 2
+  )
+  assert catalog.render_as_llm_instructions(
+      options
+  ) is catalog.render_as_llm_instructions(options)
+
+
+def test_estimate_tokens():
+  assert estimate_tokens("") == 0
+  assert estimate_tokens('{"text":"Hello"}') == 10
+  assert estimate_tokens("2026 components") == 2 + 3
+
+
+def test_canonical_rendering_ignores_key_order(verbose_catalog):
+  components = verbose_catalog.catalog_schema["components"]
+  reordered = replace(
+      verbose_catalog,
+      catalog_schema={
+          "components": dict(reversed(list(components.items()))),
+          "catalogId": "test",
+      },
+  )
+
+  assert (
+      reordered.render_as_llm_instructions()
+      != verbose_catalog.render_as_llm_instructions()
+  )
+  for options in (None, CompactRenderOptions(component_signatures=True)):
+    assert reordered.render_as_llm_instructions(
+        options, canonical=True
+    ) == verbose_catalog.render_as_llm_instructions(options, canonical=True)
+
+
+@pytest.mark.parametrize("version", [VERSION_0_8, VERSION_0_9])
+def test_catalog_artifacts_match_computed_values(version):
+  catalog = A2uiSchemaManager(
+      version, catalogs=[BasicCatalog.get_config(version)]
+  ).get_selected_catalog()
+  artifacts = CatalogArtifacts.from_dict(
+      json.loads(dump_catalog_artifacts(build_catalog_artifacts(catalog)))
+  )
+  plain = replace(catalog, artifacts=None)
+  precomputed = replace(catalog, artifacts=artifacts)
+
+  assert precomputed.fingerprint == plain.fingerprint
+  assert precomputed.render_as_llm_instructions() == plain.render_as_llm_instructions()
+  assert extract_component_required_fields(
+      precomputed
+  ) == extract_component_required_fields(plain)
+  assert {
+      name: (set(single), set(many))
+      for name, (single, many) in extract_component_ref_fields(precomputed).items()
+  } == extract_component_ref_fields(plain)
+
+  components = list(catalog.catalog_schema["components"])[:2]
+  pruned = precomputed.with_pruning(allowed_components=components)
+  assert pruned == plain.with_pruning(allowed_components=components)
+  # Artifacts describe the full catalog only.
+  assert pruned.artifacts is None
+  assert precomputed.with_pruning() is precomputed
+
+
+class _PrecomputedCatalogProvider(BundledCatalogProvider):
+
+  def __init__(self, version: str, artifacts: CatalogArtifacts):
+    super().__init__(version)
+    self._artifacts = artifacts
+
+  def load_artifacts(self):
+    return self._artifacts
+
+
+def test_catalog_ignores_stale_artifacts():
+  catalog = A2uiSchemaManager(
+      VERSION_0_9, catalogs=[BasicCatalog.get_config(VERSION_0_9)]
+  ).get_selected_catalog()
+  artifacts = build_catalog_artifacts(catalog)
+
+  class _EditedCatalogProvider(_PrecomputedCatalogProvider):
+
+    def load(self):
+      schema = super().load()
+      components = dict(schema["components"])
+      del components["Text"]
+      return {**schema, "components": components}
+
+  # The artifacts were shipped by an SDK version whose catalog still had 'Text'.
+  edited = A2uiSchemaManager(
+      VERSION_0_9,
+      catalogs=[
+          CatalogConfig(
+              name=BASIC_CATALOG_NAME,
+              provider=_EditedCatalogProvider(
+                  VERSION_0_9, replace(artifacts, sdk_version="0.0.1")
+              ),
+          )
+      ],
+  ).get_selected_catalog()
+
+  assert edited.artifacts is None
+  assert edited.fingerprint != catalog.fingerprint
+  assert edited != catalog
+  assert "Text" not in edited.catalog_schema["components"]
+  assert '"Text"' not in edited.render_as_llm_instructions()
+
+
+def test_catalog_with_artifacts_hashes_its_schemas_lazily():
+  catalog = A2uiSchemaManager(
+      VERSION_0_9, catalogs=[BasicCatalog.get_config(VERSION_0_9)]
+  ).get_selected_catalog()
+  artifacts = build_catalog_artifacts(catalog)
+
+  with patch("a2ui.schema.catalog.canonical_hash") as canonical_hash:
+    precomputed = replace(catalog, artifacts=artifacts)
+    assert precomputed.artifacts is artifacts
+    assert precomputed.render_as_llm_instructions() == artifacts.llm_instructions
+  canonical_hash.assert_not_called()
+
+
+def test_manager_uses_catalog_artifacts_without_modifiers():
+  catalog = A2uiSchemaManager(
+      VERSION_0_9, catalogs=[BasicCatalog.get_config(VERSION_0_9)]
+  ).get_selected_catalog()
+  artifacts = build_catalog_artifacts(catalog)
+  # Equal catalogs are interned by name and content, so the catalogs below get
+  # fresh names.
+  config = CatalogConfig(
+      name="precomputed",
+      provider=_PrecomputedCatalogProvider(VERSION_0_9, artifacts),
+  )
+
+  manager = A2uiSchemaManager(VERSION_0_9, catalogs=[config])
+  assert manager.get_selected_catalog().artifacts is artifacts
+
+  modified = A2uiSchemaManager(
+      VERSION_0_9,
+      catalogs=[config],
+      schema_modifiers=[lambda schema: {**schema, "description": "Modified"}],
+  )
+  assert modified.get_selected_catalog().artifacts is None
+
+  mismatched = CatalogConfig(
+      name="mismatched",
+      provider=_PrecomputedCatalogProvider(
+          VERSION_0_9, replace(artifacts, catalog_id="other")
+      ),
+  )
+  manager = A2uiSchemaManager(VERSION_0_9, catalogs=[mismatched])
+  assert manager.get_selected_catalog().artifacts is None
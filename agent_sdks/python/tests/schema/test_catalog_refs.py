@@ -0,0 +1,139 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import gc
+import pickle
+
+import pytest
+from a2ui.basic_catalog import BasicCatalog
+from a2ui.schema.catalog_refs import (
+    CatalogRegistry,
+    CatalogResolutionError,
+    catalog_ref,
+    is_catalog_ref,
+    resolve_catalog,
+)
+from a2ui.basic_catalog.provider import BundledCatalogProvider
+from a2ui.schema.catalog import CatalogConfig, find_interned_catalog
+from a2ui.schema.constants import INLINE_CATALOGS_KEY, VERSION_0_9
+from a2ui.schema.manager import A2uiSchemaManager
+
+
+@pytest.fixture
+def manager():
+  return A2uiSchemaManager(VERSION_0_9, catalogs=[BasicCatalog.get_config(VERSION_0_9)])
+
+
+def test_catalog_ref_round_trip(manager):
+  catalog = manager.get_selected_catalog(allowed_components=["Text", "Button"])
+  ref = catalog_ref(catalog)
+
+  assert is_catalog_ref(ref)
+  assert resolve_catalog(ref) is catalog
+  # Orders of magnitude smaller than the catalog stored in session state.
+  assert len(ref) * 50 < len(pickle.dumps(catalog))
+
+
+def test_resolve_falls_back_to_live_catalogs(manager):
+  catalog = manager.get_selected_catalog()
+  ref = CatalogRegistry().register(catalog)
+
+  # Another registry (e.g. after a restart) finds the catalog the manager loaded.
+  assert CatalogRegistry().resolve(ref) is catalog
+
+
+def test_resolve_passes_catalogs_through(manager):
+  catalog = manager.get_selected_catalog()
+
+  assert resolve_catalog(catalog) is catalog
+  assert resolve_catalog(None) is None
+
+
+def _new_manager(**kwargs):
+  # A name of its own, so no catalog of another test is alive.
+  return A2uiSchemaManager(
+      VERSION_0_9,
+      catalogs=[CatalogConfig("refs", BundledCatalogProvider(VERSION_0_9))],
+      **kwargs,
+  )
+
+
+def _dropped_ref(get_catalog):
+  """Returns the reference of a catalog that is then no longer alive."""
+  catalog = get_catalog()
+  ref = CatalogRegistry().register(catalog)
+  key = (catalog.name, catalog.fingerprint)
+  del catalog
+  gc.collect()
+  assert find_interned_catalog(*key) is None
+  return ref
+
+
+def test_resolve_rebuilds_pruned_catalogs_with_schema_manager():
+  # E.g. a reference written by another worker, or before a restart.
+  ref = _dropped_ref(
+      lambda: _new_manager().get_selected_catalog(allowed_components=["Text"])
+  )
+  manager = _new_manager()
+
+  catalog = CatalogRegistry().resolve(ref, manager)
+
+  assert catalog == manager.get_selected_catalog(allowed_components=["Text"])
+  assert list(catalog.catalog_schema["components"]) == ["Text"]
+
+
+def test_resolve_rebuilds_inline_catalogs_cached_by_schema_manager():
+  capabilities = {
+      INLINE_CATALOGS_KEY: [{
+          "catalogId": "inline",
+          "components": {"Rating": {"type": "object"}},
+      }]
+  }
+  ref = _dropped_ref(
+      lambda: _new_manager(accepts_inline_catalogs=True).get_selected_catalog(
+          capabilities
+      )
+  )
+  manager = _new_manager(accepts_inline_catalogs=True)
+
+  # The inline catalogs are not part of the reference.
+  with pytest.raises(CatalogResolutionError, match="not loaded"):
+    CatalogRegistry().resolve(ref, manager)
+
+  selected = manager.get_selected_catalog(capabilities)
+  del selected
+  gc.collect()
+  catalog = CatalogRegistry().resolve(ref, manager)
+  assert "Rating" in catalog.catalog_schema["components"]
+
+
+def test_resolve_rejects_changed_catalogs():
+  catalog = _new_manager().get_selected_catalog(allowed_components=["Text"])
+  ref = CatalogRegistry().register(catalog)
+  fingerprint = catalog.fingerprint
+  stale_ref = ref.replace(fingerprint, "0" * len(fingerprint))
+
+  with pytest.raises(CatalogResolutionError, match="changed"):
+    CatalogRegistry().resolve(stale_ref, _new_manager())
+
+
+def test_resolve_unknown_or_invalid_refs():
+  with pytest.raises(CatalogResolutionError, match="not loaded"):
+    resolve_catalog("a2ui-catalog:0123:basic")
+  with pytest.raises(CatalogResolutionError, match="Malformed"):
+    resolve_catalog("a2ui-catalog:basic")
+  with pytest.raises(CatalogResolutionError, match="Malformed"):
+    resolve_catalog("a2ui-catalog:0123:basic?component=Text")
+  with pytest.raises(ValueError, match="Not an A2UI catalog"):
+    resolve_catalog({"components": {}})
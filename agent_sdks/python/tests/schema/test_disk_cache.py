@@ -0,0 +1,137 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+from a2ui.basic_catalog.provider import BundledCatalogProvider
+from a2ui.schema.artifacts import build_catalog_artifacts
+from a2ui.schema.catalog import CatalogConfig
+from a2ui.schema.common_modifiers import remove_strict_validation
+from a2ui.schema.constants import CATALOG_ID_KEY, VERSION_0_9
+from a2ui.schema.disk_cache import CatalogDiskCache, modifier_identity
+from a2ui.schema.manager import A2uiSchemaManager
+
+
+@pytest.fixture
+def catalog_config(tmp_path):
+  catalog_schema = BundledCatalogProvider(VERSION_0_9).load()
+  catalog_schema[CATALOG_ID_KEY] = "https://example.com/catalogs/custom.json"
+  catalog_path = tmp_path / "custom.json"
+  catalog_path.write_text(json.dumps(catalog_schema))
+  return CatalogConfig.from_path("custom", str(catalog_path))
+
+
+def _manager(config, cache_dir, modifiers=(remove_strict_validation,)):
+  return A2uiSchemaManager(
+      VERSION_0_9,
+      catalogs=[config],
+      schema_modifiers=list(modifiers),
+      catalog_cache_dir=str(cache_dir),
+  )
+
+
+def test_catalog_cache_reuses_processed_catalog(catalog_config, tmp_path):
+  cache_dir = tmp_path / "cache"
+  with patch(
+      "a2ui.schema.manager.build_catalog_artifacts", wraps=build_catalog_artifacts
+  ) as build:
+    first = _manager(catalog_config, cache_dir).get_selected_catalog()
+    second = _manager(catalog_config, cache_dir).get_selected_catalog()
+
+  assert build.call_count == 1
+  assert second == first
+  assert second.artifacts == build_catalog_artifacts(first)
+  assert second.render_as_llm_instructions() == first.render_as_llm_instructions()
+  assert not list(cache_dir.glob("*.tmp"))
+
+
+def test_catalog_cache_keys_on_content_and_modifiers(catalog_config, tmp_path):
+  cache_dir = tmp_path / "cache"
+  _manager(catalog_config, cache_dir)
+  _manager(catalog_config, cache_dir, modifiers=())
+  assert len(list(cache_dir.glob("*.json"))) == 2
+
+  # Modifiers without a stable name are not cached.
+  _manager(catalog_config, cache_dir, modifiers=(lambda schema: schema,))
+  assert len(list(cache_dir.glob("*.json"))) == 2
+  assert modifier_identity(remove_strict_validation) == (
+      "a2ui.schema.common_modifiers.remove_strict_validation"
+  )
+
+
+def test_catalog_cache_ignores_corrupted_entries(catalog_config, tmp_path):
+  cache_dir = tmp_path / "cache"
+  expected = _manager(catalog_config, cache_dir).get_selected_catalog()
+  (entry,) = cache_dir.glob("*.json")
+  entry.write_text('{"format": 1, "catalogSchema": ')
+
+  catalog = _manager(catalog_config, cache_dir).get_selected_catalog()
+
+  assert catalog == expected
+  assert json.loads(entry.read_text())["format"] == 1
+
+
+def test_catalog_cache_creates_entries_once(tmp_path):
+  cache = CatalogDiskCache(str(tmp_path))
+  calls = []
+  results = []
+
+  def create():
+    calls.append(1)
+    time.sleep(0.1)
+    catalog = _manager(
+        CatalogConfig("basic", BundledCatalogProvider(VERSION_0_9)), tmp_path / "other"
+    ).get_selected_catalog()
+    return catalog.catalog_schema, build_catalog_artifacts(catalog)
+
+  threads = [
+      threading.Thread(
+          target=lambda: results.append(cache.get_or_create("key", create))
+      )
+      for _ in range(4)
+  ]
+  for thread in threads:
+    thread.start()
+  for thread in threads:
+    thread.join()
+
+  assert len(calls) == 1
+  assert len(results) == 4
+  assert not list(tmp_path.glob("*.lock"))
+
+
+def test_catalog_cache_breaks_abandoned_locks(tmp_path):
+  cache = CatalogDiskCache(str(tmp_path))
+  lock = tmp_path / "key.lock"
+  lock.touch()
+  os.utime(lock, (0, 0))
+  holds_lock = []
+
+  def create():
+    # The abandoned lock was replaced by one held by this process.
+    holds_lock.append(lock.exists() and lock.stat().st_mtime > 0)
+    catalog = _manager(
+        CatalogConfig("basic", BundledCatalogProvider(VERSION_0_9)), tmp_path / "other"
+    ).get_selected_catalog()
+    return catalog.catalog_schema, build_catalog_artifacts(catalog)
+
+  cache.get_or_create("key", create)
+
+  assert holds_lock == [True]
+  assert not list(tmp_path.glob("*.lock*"))
@@ -0,0 +1,138 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+
+import pytest
+
+from a2ui.schema.examples import (
+    ExampleRetriever,
+    get_example_retriever,
+    tokenize,
+)
+
+
+def _write_example(directory, file_name, name, components, text):
+  content = {
+      "name": name,
+      "description": f"Example of {name.lower()}.",
+      "messages": [{
+          "version": "v0.9",
+          "updateComponents": {
+              "surfaceId": "s",
+              "components": [
+                  {"id": f"c{i}", "component": component, "text": text}
+                  for i, component in enumerate(components)
+              ],
+          },
+      }],
+  }
+  (directory / file_name).write_text(json.dumps(content, indent=2))
+
+
+@pytest.fixture
+def examples_dir(tmp_path):
+  _write_example(tmp_path, "01_flight.json", "Flight Status", ["Card"], "Departs")
+  _write_example(tmp_path, "02_login.json", "Login Form", ["TextField"], "Password")
+  _write_example(
+      tmp_path, "03_survey.json", "Survey", ["ChoicePicker"], "Pick your favorites"
+  )
+  return tmp_path
+
+
+def test_tokenize():
+  assert tokenize("ChoicePicker, 2 items!") == [
+      "choicepicker",
+      "choice",
+      "picker",
+      "2",
+      "items",
+  ]
+
+
+def test_rank(examples_dir):
+  retriever = ExampleRetriever(str(examples_dir))
+
+  assert [e.name for e, _ in retriever.rank("enter a password")][0] == "02_login"
+  # Component types are indexed, including the words in camelCase names.
+  assert [e.name for e, _ in retriever.rank("a picker")][0] == "03_survey"
+  # Without matches, the file order is kept.
+  assert [e.name for e, _ in retriever.rank("unrelated")] == [
+      "01_flight",
+      "02_login",
+      "03_survey",
+  ]
+
+
+def test_select_within_budget(examples_dir):
+  retriever = ExampleRetriever(str(examples_dir))
+  tokens = {e.name: e.tokens for e in retriever.examples}
+
+  assert [e.name for e in retriever.select("flight password", top_k=1)] == ["01_flight"]
+  selected = retriever.select(
+      "flight password", top_k=3, max_tokens=tokens["01_flight"] + 1
+  )
+  assert [e.name for e in selected] == ["01_flight"]
+
+  rendered = retriever.render("login", top_k=1)
+  assert rendered.startswith("---BEGIN 02_login---\n{")
+  assert rendered.endswith("---END 02_login---")
+
+
+def test_get_example_retriever_reindexes_changed_files(examples_dir):
+  retriever = get_example_retriever(str(examples_dir))
+  assert get_example_retriever(str(examples_dir)) is retriever
+
+  _write_example(examples_dir, "04_weather.json", "Weather", ["Icon"], "Sunny")
+  updated = get_example_retriever(str(examples_dir))
+  assert updated is not retriever
+  assert [e.name for e in updated.select("sunny weather", top_k=1)] == ["04_weather"]
+
+
+def test_get_example_retriever_throttles_checks(examples_dir):
+  retriever = get_example_retriever(str(examples_dir))
+  _write_example(examples_dir, "04_weather.json", "Weather", ["Icon"], "Sunny")
+
+  # Changes are only noticed once the check interval has passed.
+  assert get_example_retriever(str(examples_dir), check_interval=3600) is retriever
+  assert get_example_retriever(str(examples_dir)) is not retriever
+
+
+def test_get_example_retriever_reuses_unchanged_examples(examples_dir):
+  retriever = get_example_retriever(str(examples_dir))
+  os.remove(examples_dir / "03_survey.json")
+  _write_example(examples_dir, "02_login.json", "Login Form", ["TextField"], "PIN")
+
+  updated = get_example_retriever(str(examples_dir))
+
+  assert [e.name for e in updated.examples] == ["01_flight", "02_login"]
+  assert updated.examples[0] is retriever.examples[0]
+  assert updated.examples[1] is not retriever.examples[1]
+  assert "pin" in updated.examples[1].term_counts
+
+
+def test_rank_basic_catalog_examples():
+  examples_dir = os.path.join(
+      os.path.dirname(__file__),
+      "../../../../specification/v0_9/catalogs/basic/examples",
+  )
+  if not os.path.isdir(examples_dir):
+    pytest.skip("Specification examples are not available")
+  retriever = get_example_retriever(examples_dir)
+
+  assert retriever.select("status of flight UA 123", top_k=1)[0].name == (
+      "01_flight-status"
+  )
+  assert retriever.select("log in with a password", top_k=1)[0].name == "09_login-form"
@@ -0,0 +1,161 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from a2ui.schema.http_catalog_provider import HttpCatalogProvider
+
+CATALOG = {
+    "catalogId": "https://example.com/catalogs/remote.json",
+    "components": {"Text": {"type": "object"}},
+}
+
+
+class _CatalogServer:
+  """A local stand-in for a catalog host, recording the requests it gets."""
+
+  def __init__(self):
+    self.catalog = CATALOG
+    self.etag = '"v1"'
+    self.status = 200
+    self.delay = 0.0
+    self.requests = []
+    server = self
+
+    class Handler(BaseHTTPRequestHandler):
+      protocol_version = "HTTP/1.1"
+
+      def do_GET(self):
+        server.requests.append((self.client_address, dict(self.headers)))
+        time.sleep(server.delay)
+        if server.status != 200:
+          self._respond(server.status, b"")
+        elif self.headers.get("If-None-Match") == server.etag:
+          self._respond(304, b"")
+        else:
+          self._respond(200, json.dumps(server.catalog).encode())
+
+      def _respond(self, status, body):
+        self.send_response(status)
+        self.send_header("ETag", server.etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+      def log_message(self, *args):
+        pass
+
+    self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    self._httpd.daemon_threads = True
+    self.url = f"http://127.0.0.1:{self._httpd.server_port}/catalog.json"
+    threading.Thread(
+        target=self._httpd.serve_forever, args=(0.05,), daemon=True
+    ).start()
+
+  def close(self):
+    self._httpd.shutdown()
+    self._httpd.server_close()
+
+
+@pytest.fixture
+def server():
+  server = _CatalogServer()
+  yield server
+  server.close()
+
+
+def test_load_fetches_once(server):
+  provider = HttpCatalogProvider(server.url)
+
+  assert provider.load() == CATALOG
+  assert provider.load() == CATALOG
+  assert len(server.requests) == 1
+
+
+def test_warm_start_does_not_wait_for_network(server, tmp_path):
+  HttpCatalogProvider(server.url, cache_dir=str(tmp_path)).load()
+  server.delay = 2.0
+
+  # A new process: the cached copy is stale, so it is revalidated in the
+  # background while the cached catalog is served.
+  provider = HttpCatalogProvider(server.url, cache_dir=str(tmp_path), max_age=0)
+  start = time.monotonic()
+  catalog = provider.load()
+
+  assert catalog == CATALOG
+  assert time.monotonic() - start < 0.5
+
+
+def test_warm_start_survives_unreachable_server(server, tmp_path):
+  HttpCatalogProvider(server.url, cache_dir=str(tmp_path)).load()
+  server.close()
+
+  provider = HttpCatalogProvider(server.url, cache_dir=str(tmp_path), max_age=0)
+  assert provider.load() == CATALOG
+
+
+def test_refresh_revalidates_with_etag(server):
+  provider = HttpCatalogProvider(server.url)
+  provider.load()
+
+  assert provider.refresh() == CATALOG
+  assert server.requests[-1][1]["If-None-Match"] == '"v1"'
+
+  server.catalog = {**CATALOG, "components": {}}
+  server.etag = '"v2"'
+  assert provider.refresh() == server.catalog
+  assert provider.load() == server.catalog
+
+
+def test_concurrent_loads_share_one_request(server):
+  server.delay = 0.3
+  results = []
+  threads = [
+      threading.Thread(
+          target=lambda: results.append(HttpCatalogProvider(server.url).load())
+      )
+      for _ in range(8)
+  ]
+  for thread in threads:
+    thread.start()
+  for thread in threads:
+    thread.join()
+
+  assert results == [CATALOG] * 8
+  assert len(server.requests) == 1
+
+
+def test_connections_are_reused(server):
+  provider = HttpCatalogProvider(server.url)
+  provider.load()
+  provider.refresh()
+
+  (first_client, _), (second_client, _) = server.requests
+  assert first_client == second_client
+
+
+def test_load_raises_when_nothing_is_cached(server):
+  server.status = 500
+  with pytest.raises(IOError, match="HTTP 500"):
+    HttpCatalogProvider(server.url).load()
+
+
+def test_returned_catalogs_are_independent(server):
+  provider = HttpCatalogProvider(server.url)
+  provider.load()["components"].clear()
+  assert provider.load() == CATALOG
@@ -0,0 +1,99 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import copy
+
+from a2ui.basic_catalog.provider import BasicCatalog
+from a2ui.schema.common_modifiers import remove_strict_validation
+from a2ui.schema.constants import VERSION_0_9
+from a2ui.schema.manager import A2uiSchemaManager
+from a2ui.schema.registry import SchemaRegistry, get_schema_registry
+
+
+def _manager(**kwargs):
+  return A2uiSchemaManager(
+      VERSION_0_9, catalogs=[BasicCatalog.get_config(VERSION_0_9)], **kwargs
+  )
+
+
+def test_managers_share_schemas():
+  first = _manager().get_selected_catalog()
+  second = _manager().get_selected_catalog()
+
+  assert second.s2c_schema is first.s2c_schema
+  assert second.common_types_schema is first.common_types_schema
+  assert second.catalog_schema is first.catalog_schema
+  stats = get_schema_registry().stats()
+  assert stats.schemas == 3
+  assert stats.bytes_saved > 0
+
+
+def test_managers_share_modifier_results():
+  modifiers = [remove_strict_validation]
+  first = _manager(schema_modifiers=modifiers).get_selected_catalog()
+  second = _manager(schema_modifiers=modifiers).get_selected_catalog()
+  unmodified = _manager().get_selected_catalog()
+
+  assert second.s2c_schema is first.s2c_schema
+  assert second.catalog_schema is first.catalog_schema
+  assert unmodified.s2c_schema is not first.s2c_schema
+
+
+def test_modifiers_do_not_modify_shared_schemas():
+  registry = SchemaRegistry()
+  schema = registry.intern({"type": "object", "additionalProperties": False})
+  original = copy.deepcopy(schema)
+
+  def strip(schema):
+    schema.pop("additionalProperties")
+    return schema
+
+  modified = registry.apply_modifiers(schema, [strip])
+
+  assert schema == original
+  assert modified == {"type": "object"}
+  assert registry.stats().schemas == 2
+
+
+def test_intern_returns_equal_registered_schema():
+  registry = SchemaRegistry()
+  first = registry.intern({"a": [1, 2]})
+
+  assert registry.intern({"a": [1, 2]}) is first
+  assert registry.intern({"a": [2, 1]}) is not first
+  assert registry.stats().hits == 1
+
+
+def _strip_a(schema):
+  schema.pop("a")
+  return schema
+
+
+def test_release_forgets_schemas_nobody_holds():
+  registry = SchemaRegistry()
+  first = registry.intern({"a": 1})
+  registry.intern({"a": 1})
+  modified = registry.apply_modifiers(first, [_strip_a])
+  assert registry.apply_modifiers({"a": 1}, [_strip_a]) is modified
+  registry.release(modified)
+  registry.release(first)
+  assert registry.intern({"a": 1}) is first
+  registry.release(first)
+  registry.release(first)
+  assert registry.stats().schemas == 1
+
+  registry.release(modified)
+  assert registry.stats().schemas == 0
+  # The memoized result went with it.
+  assert registry.apply_modifiers({"a": 1}, [_strip_a]) is not modified
@@ -9,13 +9,20 @@
 # Unless required by applicable law or agreed to in writing, software
 # distributed under the License is distributed on an "AS IS" BASIS,
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+import asyncio
+import hashlib
 import io
+import time
 import pytest
 import json
 import os
 from unittest.mock import patch, MagicMock, PropertyMock
 from a2ui.schema.manager import A2uiSchemaManager, A2uiCatalog, CatalogConfig
+from a2ui.schema.registry import get_schema_registry
 from a2ui.basic_catalog import BasicCatalog
+from a2ui.basic_catalog.provider import BundledCatalogProvider
+from a2ui.schema.examples import ExampleRetriever, ExampleSelection, examples_stamp
+from a2ui.schema.rendering import CompactRenderOptions
 from a2ui.basic_catalog.constants import BASIC_CATALOG_NAME
 from a2ui.schema.constants import (
     DEFAULT_WORKFLOW_RULES,
@@ -125,3 +132,459 @@ def test_schema_manager_fallback_local_assets(mock_importlib_resources):
     assert len(manager._supported_catalogs) >= 1
     catalog = manager._supported_catalogs[0]
     assert "LocalText" in catalog.catalog_schema["components"]
+
+
+def _manager_with_examples(examples_path, **kwargs):
+  config = BasicCatalog.get_config(VERSION_0_9)
+  config = CatalogConfig(
+      name=config.name, provider=config.provider, examples_path=str(examples_path)
+  )
+  return A2uiSchemaManager(VERSION_0_9, catalogs=[config], **kwargs)
+
+
+def test_generate_system_prompt_is_cached(tmp_path):
+  (tmp_path / "greeting.json").write_text('{"greeting": 1}')
+  manager = _manager_with_examples(tmp_path)
+
+  with patch.object(
+      A2uiSchemaManager,
+      "get_selected_catalog",
+      autospec=True,
+      side_effect=A2uiSchemaManager.get_selected_catalog,
+  ) as get_selected_catalog:
+    first = manager.generate_system_prompt(
+        "role", include_schema=True, include_examples=True
+    )
+    second = manager.generate_system_prompt(
+        "role", include_schema=True, include_examples=True
+    )
+
+  assert first is second
+  assert get_selected_catalog.call_count == 1
+  info = manager.prompt_cache_info()
+  assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+
+def test_generate_system_prompt_cache_key(tmp_path):
+  manager = _manager_with_examples(tmp_path)
+  catalog_id = manager.supported_catalog_ids[0]
+
+  base = manager.generate_system_prompt("role", include_schema=True)
+  pruned = manager.generate_system_prompt(
+      "role", include_schema=True, allowed_components=["Text"]
+  )
+  assert base != pruned
+  compact = manager.generate_system_prompt(
+      "role", include_schema=True, schema_options=CompactRenderOptions()
+  )
+  assert len(compact) < len(base)
+
+  # Client capabilities are normalized, so key order does not matter.
+  manager.generate_system_prompt(
+      "role",
+      client_ui_capabilities={"a": 1, SUPPORTED_CATALOG_IDS_KEY: [catalog_id]},
+  )
+  manager.generate_system_prompt(
+      "role",
+      client_ui_capabilities={SUPPORTED_CATALOG_IDS_KEY: [catalog_id], "a": 1},
+  )
+  info = manager.prompt_cache_info()
+  assert (info.hits, info.misses) == (1, 4)
+
+
+def test_generate_system_prompt_prefix_stable(tmp_path):
+  (tmp_path / "greeting.json").write_text('{"greeting": 1}')
+  manager = _manager_with_examples(tmp_path)
+  kwargs = {"include_schema": True, "include_examples": True}
+
+  prefix = manager.generate_prompt_prefix(**kwargs)
+  first = manager.generate_system_prompt("first role", prefix_stable=True, **kwargs)
+  second = manager.generate_system_prompt(
+      "second role", ui_description="ui", prefix_stable=True, **kwargs
+  )
+
+  assert first.startswith(prefix.text + "\n\n")
+  assert second.startswith(prefix.text + "\n\n")
+  assert first.endswith(DEFAULT_WORKFLOW_RULES)
+  assert prefix.text.index("A2UI JSON SCHEMA") < prefix.text.index("greeting")
+  assert manager.generate_prompt_prefix(**kwargs) is prefix
+  assert prefix.content_hash == hashlib.sha256(prefix.text.encode()).hexdigest()
+
+  # The default layout keeps the role first.
+  assert manager.generate_system_prompt("first role", **kwargs).startswith("first role")
+  assert manager.generate_prompt_prefix(include_schema=True) != prefix
+
+
+def test_generate_system_prompt_selects_examples(tmp_path):
+  (tmp_path / "flight.json").write_text('{"name": "Flight status"}')
+  (tmp_path / "login.json").write_text('{"name": "Login form"}')
+  manager = _manager_with_examples(tmp_path)
+
+  prompt = manager.generate_system_prompt(
+      "role",
+      include_examples=True,
+      example_selection=ExampleSelection("Is my flight on time?", top_k=1),
+  )
+  assert "---BEGIN flight---" in prompt
+  assert "---BEGIN login---" not in prompt
+
+  # In the prefix-stable layout, query-specific examples come last.
+  prompt = manager.generate_system_prompt(
+      "role",
+      include_schema=True,
+      include_examples=True,
+      prefix_stable=True,
+      example_selection=ExampleSelection("login"),
+  )
+  assert prompt.startswith(manager.generate_prompt_prefix(include_schema=True).text)
+  assert prompt.index("role") < prompt.index("---BEGIN login---")
+
+
+def test_generate_system_prompt_keys_selections_by_examples(tmp_path):
+  (tmp_path / "flight.json").write_text('{"name": "Flight status"}')
+  (tmp_path / "login.json").write_text('{"name": "Login form"}')
+  manager = _manager_with_examples(tmp_path)
+
+  def prompt(query):
+    return manager.generate_system_prompt(
+        "role",
+        include_examples=True,
+        example_selection=ExampleSelection(query, top_k=1),
+    )
+
+  first = prompt("Is my flight on time?")
+  assert prompt("Where is my flight?") is first
+  assert "---BEGIN login---" in prompt("Show the login form")
+  info = manager.prompt_cache_info()
+  assert (info.hits, info.misses, info.currsize) == (1, 2, 2)
+
+
+def test_generate_system_prompt_cache_invalidated_by_examples(tmp_path):
+  example = tmp_path / "greeting.json"
+  example.write_text('{"greeting": 1}')
+  manager = _manager_with_examples(tmp_path, examples_check_interval=0)
+
+  first = manager.generate_system_prompt("role", include_examples=True)
+  example.write_text('{"greeting": 22}')
+  os.utime(example, ns=(0, 0))
+  second = manager.generate_system_prompt("role", include_examples=True)
+  (tmp_path / "farewell.json").write_text('{"farewell": 1}')
+  third = manager.generate_system_prompt("role", include_examples=True)
+
+  assert '{"greeting": 1}' in first
+  assert '{"greeting": 22}' in second
+  assert "---BEGIN farewell---" in third
+  assert manager.prompt_cache_info().hits == 0
+
+
+def test_generate_system_prompt_throttles_example_checks(tmp_path):
+  example = tmp_path / "greeting.json"
+  example.write_text('{"greeting": 1}')
+  manager = _manager_with_examples(tmp_path, examples_check_interval=3600)
+  manager.generate_system_prompt("role", include_examples=True)
+
+  with patch("a2ui.schema.manager.examples_stamp", side_effect=examples_stamp) as stamp:
+    for _ in range(3):
+      manager.generate_system_prompt("role", include_examples=True)
+  stamp.assert_not_called()
+  assert manager.prompt_cache_info().hits == 3
+
+  # A reload checks the files right away.
+  example.write_text('{"greeting": 22}')
+  os.utime(example, ns=(0, 0))
+  manager.reload()
+  assert '{"greeting": 22}' in manager.generate_system_prompt(
+      "role", include_examples=True
+  )
+
+
+def test_generate_system_prompt_memoizes_example_selections(tmp_path):
+  (tmp_path / "flight.json").write_text('{"name": "Flight status"}')
+  (tmp_path / "login.json").write_text('{"name": "Login form"}')
+  manager = _manager_with_examples(tmp_path, examples_check_interval=3600)
+
+  def prompt():
+    return manager.generate_system_prompt(
+        "role",
+        include_examples=True,
+        example_selection=ExampleSelection("Is my flight on time?", top_k=1),
+    )
+
+  first = prompt()
+  with (
+      patch("a2ui.schema.manager.examples_stamp") as manager_stamp,
+      patch("a2ui.schema.examples.examples_stamp") as retriever_stamp,
+      patch.object(ExampleRetriever, "rank") as rank,
+  ):
+    for _ in range(3):
+      assert prompt() is first
+  manager_stamp.assert_not_called()
+  retriever_stamp.assert_not_called()
+  rank.assert_not_called()
+
+  # A reload checks the files right away, and examples are selected again.
+  (tmp_path / "flight.json").write_text('{"name": "Login"}')
+  os.utime(tmp_path / "flight.json", ns=(0, 0))
+  (tmp_path / "login.json").write_text('{"name": "Flight status, on time"}')
+  manager.reload()
+  assert "Flight status, on time" in prompt()
+
+
+def test_generate_system_prompt_cache_disabled(tmp_path):
+  manager = _manager_with_examples(tmp_path, prompt_cache_size=0)
+
+  assert manager.generate_system_prompt("role") == manager.generate_system_prompt(
+      "role"
+  )
+  assert manager.prompt_cache_info() is None
+
+
+def test_clear_prompt_cache(tmp_path):
+  manager = _manager_with_examples(tmp_path)
+  manager.generate_system_prompt("role")
+  manager.clear_prompt_cache()
+
+  assert manager.prompt_cache_info().currsize == 0
+
+
+def _inline_capabilities(component_name="Rating"):
+  return {
+      INLINE_CATALOGS_KEY: [{
+          "catalogId": "inline",
+          "components": {
+              component_name: {
+                  "type": "object",
+                  "properties": {"value": {"type": "number"}},
+              }
+          },
+      }]
+  }
+
+
+def test_inline_catalog_merges_are_cached():
+  manager = A2uiSchemaManager(
+      VERSION_0_9,
+      catalogs=[BasicCatalog.get_config(VERSION_0_9)],
+      accepts_inline_catalogs=True,
+  )
+  capabilities = _inline_capabilities()
+
+  first = manager._select_catalog(capabilities)
+  # An equal payload from another request (a fresh dict) hits the cache.
+  second = manager._select_catalog(json.loads(json.dumps(capabilities)))
+  other = manager._select_catalog(_inline_capabilities("Gauge"))
+
+  assert first is second
+  assert first.validator is second.validator
+  assert other is not first
+  assert "Rating" in first.catalog_schema["components"]
+  assert "Gauge" in other.catalog_schema["components"]
+  assert "Rating" not in manager._supported_catalogs[0].catalog_schema["components"]
+  info = manager.inline_catalog_cache_info()
+  assert (info.hits, info.misses, info.currsize) == (1, 2, 2)
+
+  # The cached catalog does not alias the client's payload.
+  capabilities[INLINE_CATALOGS_KEY][0]["components"]["Rating"]["type"] = "string"
+  assert first.catalog_schema["components"]["Rating"]["type"] == "object"
+
+
+def test_inline_catalog_cache_is_bounded():
+  manager = A2uiSchemaManager(
+      VERSION_0_9,
+      catalogs=[BasicCatalog.get_config(VERSION_0_9)],
+      accepts_inline_catalogs=True,
+      inline_catalog_cache_size=1,
+  )
+  first = manager._select_catalog(_inline_capabilities("Rating"))
+  manager._select_catalog(_inline_capabilities("Gauge"))
+
+  assert manager._select_catalog(_inline_capabilities("Rating")) is not first
+  assert manager.inline_catalog_cache_info().currsize == 1
+
+
+def test_oversized_inline_catalog_is_rejected():
+  manager = A2uiSchemaManager(
+      VERSION_0_9,
+      catalogs=[BasicCatalog.get_config(VERSION_0_9)],
+      accepts_inline_catalogs=True,
+      max_inline_catalog_bytes=64,
+  )
+  with patch("copy.deepcopy") as deepcopy:
+    with pytest.raises(ValueError, match="Inline catalogs are too large"):
+      manager._select_catalog(_inline_capabilities("X" * 64))
+  deepcopy.assert_not_called()
+
+
+class _SlowCatalogProvider(BundledCatalogProvider):
+  """A provider whose loads take a while, e.g. a remote catalog."""
+
+  def __init__(self, catalog_id: str):
+    super().__init__(VERSION_0_9)
+    self._catalog_id = catalog_id
+
+  def load(self):
+    time.sleep(0.2)
+    return {**super().load(), "catalogId": self._catalog_id}
+
+  async def aload(self):
+    await asyncio.sleep(0.2)
+    return {**super().load(), "catalogId": self._catalog_id}
+
+
+def _slow_catalogs(count):
+  return [
+      CatalogConfig(f"catalog{i}", _SlowCatalogProvider(f"https://example.com/{i}"))
+      for i in range(count)
+  ]
+
+
+@pytest.mark.asyncio
+async def test_create_async_matches_sync_construction():
+  manager = await A2uiSchemaManager.create_async(
+      VERSION_0_9, catalogs=_slow_catalogs(3), prompt_cache_size=0
+  )
+  expected = A2uiSchemaManager(VERSION_0_9, catalogs=_slow_catalogs(3))
+
+  assert manager.supported_catalog_ids == expected.supported_catalog_ids
+  assert manager.generate_system_prompt("role") == expected.generate_system_prompt(
+      "role"
+  )
+  assert manager.prompt_cache_info() is None
+  # Validators were compiled during creation.
+  assert all("validator" in c.__dict__ for c in manager._supported_catalogs)
+
+
+@pytest.mark.asyncio
+async def test_create_async_loads_catalogs_concurrently():
+  start = time.monotonic()
+  await A2uiSchemaManager.create_async(
+      VERSION_0_9, catalogs=_slow_catalogs(5), compile_validators=False
+  )
+  assert time.monotonic() - start < 0.2 * 3
+
+
+def _write_catalog(path, components):
+  catalog = BundledCatalogProvider(VERSION_0_9).load()
+  catalog["catalogId"] = "https://example.com/catalogs/custom.json"
+  catalog["components"] = {
+      name: catalog["components"][name] for name in ["Text", *components]
+  }
+  path.write_text(json.dumps(catalog))
+  # Distinct stamps even on file systems with a coarse clock.
+  os.utime(path, ns=(time.time_ns(), time.time_ns() + len(components)))
+
+
+@pytest.fixture
+def reloadable_manager(tmp_path):
+  catalog_path = tmp_path / "custom.json"
+  _write_catalog(catalog_path, ["Button"])
+  return catalog_path, A2uiSchemaManager(
+      VERSION_0_9,
+      catalogs=[
+          CatalogConfig.from_path("custom", str(catalog_path)),
+          BasicCatalog.get_config(VERSION_0_9),
+      ],
+  )
+
+
+def test_reload_swaps_only_changed_catalogs(reloadable_manager):
+  catalog_path, manager = reloadable_manager
+  old_custom, basic = manager._supported_catalogs
+  old_prompt = manager.generate_system_prompt("role", include_schema=True)
+
+  assert not manager.reload()
+
+  _write_catalog(catalog_path, ["Button", "Slider"])
+  reload = manager.reload()
+
+  assert reload.catalogs == ("custom",)
+  new_custom, same_basic = manager._supported_catalogs
+  assert same_basic is basic
+  assert "Slider" in new_custom.catalog_schema["components"]
+  # The new catalog is compiled before it is swapped in.
+  assert "validator" in new_custom.__dict__
+  # Holders of the old catalog keep using it.
+  assert "Slider" not in old_custom.catalog_schema["components"]
+  assert manager.generate_system_prompt("role", include_schema=True) != old_prompt
+
+
+def test_reload_keeps_cache_entries_of_unchanged_catalogs(tmp_path):
+  catalog_path = tmp_path / "custom.json"
+  _write_catalog(catalog_path, ["Button"])
+  manager = A2uiSchemaManager(
+      VERSION_0_9,
+      catalogs=[
+          CatalogConfig.from_path("custom", str(catalog_path)),
+          BasicCatalog.get_config(VERSION_0_9),
+      ],
+      accepts_inline_catalogs=True,
+  )
+  basic_id = manager._supported_catalogs[1].catalog_id
+  inline = {
+      SUPPORTED_CATALOG_IDS_KEY: [basic_id],
+      INLINE_CATALOGS_KEY: [{"components": {"Custom": {"type": "object"}}}],
+  }
+
+  def prompts():
+    return [
+        manager.generate_system_prompt("role", include_schema=True),
+        manager.generate_system_prompt(
+            "role",
+            include_schema=True,
+            client_ui_capabilities={SUPPORTED_CATALOG_IDS_KEY: [basic_id]},
+        ),
+        manager.generate_system_prompt(
+            "role", include_schema=True, client_ui_capabilities=inline
+        ),
+    ]
+
+  custom, basic, merged = prompts()
+  _write_catalog(catalog_path, ["Button", "Slider"])
+  assert manager.reload().catalogs == ("custom",)
+  misses = manager.prompt_cache_info().misses
+
+  new_custom, same_basic, same_merged = prompts()
+  assert new_custom != custom and "Slider" in new_custom
+  assert same_basic is basic and same_merged is merged
+  assert manager.prompt_cache_info().misses == misses + 1
+  assert manager.inline_catalog_cache_info().currsize == 1
+
+
+def test_reload_releases_replaced_schemas(reloadable_manager):
+  catalog_path, manager = reloadable_manager
+  registry = get_schema_registry()
+  schemas = registry.stats().schemas
+
+  for components in (["Slider"], ["Button", "Slider"], ["CheckBox"]):
+    _write_catalog(catalog_path, components)
+    assert manager.reload().catalogs == ("custom",)
+
+  assert registry.stats().schemas == schemas
+
+
+def test_reload_keeps_catalog_that_fails_to_load(reloadable_manager):
+  catalog_path, manager = reloadable_manager
+  catalog = manager.get_selected_catalog()
+  catalog_path.write_text('{"catalogId": ')
+
+  reload = manager.reload()
+
+  assert reload.failed == ("custom",)
+  assert manager.get_selected_catalog() is catalog
+  _write_catalog(catalog_path, ["Slider"])
+  assert manager.reload().catalogs == ("custom",)
+
+
+def test_watch_reloads_in_background(reloadable_manager):
+  catalog_path, manager = reloadable_manager
+  reloads = []
+
+  with manager.watch(interval=0.02, on_reload=reloads.append) as watcher:
+    _write_catalog(catalog_path, ["Slider"])
+    deadline = time.monotonic() + 5
+    while not reloads and time.monotonic() < deadline:
+      time.sleep(0.01)
+
+  assert not watcher.running
+  assert reloads[0].catalogs == ("custom",)
+  assert "Slider" in manager.get_selected_catalog().catalog_schema["components"]
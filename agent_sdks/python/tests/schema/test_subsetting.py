@@ -0,0 +1,151 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+
+import pytest
+
+from a2ui.basic_catalog import BasicCatalog
+from a2ui.schema.constants import VERSION_0_9
+from a2ui.schema.manager import A2uiSchemaManager
+from a2ui.schema.subsetting import ComponentSubsetter, ComponentUsageStats
+
+
+@pytest.fixture(scope="module")
+def catalog():
+  manager = A2uiSchemaManager(
+      VERSION_0_9, catalogs=[BasicCatalog.get_config(VERSION_0_9)]
+  )
+  return manager.get_selected_catalog()
+
+
+def _messages(*components):
+  return [{
+      "version": "v0.9",
+      "updateComponents": {
+          "surfaceId": "s",
+          "components": [
+              {"id": f"c{i}", "component": component}
+              for i, component in enumerate(components)
+          ],
+      },
+  }]
+
+
+@pytest.fixture
+def stats():
+  stats = ComponentUsageStats()
+  for _ in range(30):
+    stats.record("show the weather forecast", _messages("Column", "Text", "Icon"))
+    stats.record("book a table", _messages("Column", "TextField", "Button"))
+  return stats
+
+
+def test_stats_record(stats):
+  assert stats.outputs == 60
+  assert stats.component_usage == {
+      "Column": 60,
+      "Text": 30,
+      "Icon": 30,
+      "TextField": 30,
+      "Button": 30,
+  }
+  # Outputs without components are not counted.
+  stats.record("hello", [])
+  assert stats.outputs == 60
+
+
+def test_predict(catalog, stats):
+  subsetter = ComponentSubsetter(
+      stats, min_outputs=10, min_probability=0.6, always_include=["Row"]
+  )
+
+  assert subsetter.predict(catalog, "weather in Paris") is None
+  assert subsetter.predict(catalog, "weather forecast for Paris") == [
+      "Text",
+      "Icon",
+      "Row",
+      "Column",
+  ]
+
+  pruned = subsetter.select_catalog(catalog, "book a table for two")
+  assert list(pruned.catalog_schema["components"]) == [
+      "Row",
+      "Column",
+      "Button",
+      "TextField",
+  ]
+  assert pruned is catalog.with_pruning(["Row", "Column", "Button", "TextField"])
+
+
+def test_predict_falls_back_to_full_catalog(catalog, stats):
+  # Not enough recorded outputs.
+  subsetter = ComponentSubsetter(stats, min_outputs=100)
+  assert subsetter.predict(catalog, "weather forecast") is None
+  # Unknown request terms.
+  subsetter = ComponentSubsetter(stats, min_outputs=10)
+  assert subsetter.select_catalog(catalog, "play some music") is catalog
+
+
+def test_stats_cap_the_vocabulary():
+  stats = ComponentUsageStats(max_terms=10)
+  for _ in range(5):
+    stats.record_components("weather forecast", ["Icon"])
+  for i in range(100):
+    stats.record_components(f"request {i}", ["Text"])
+
+  terms = stats.to_dict()["terms"]
+  assert len(terms) <= 10
+  assert set(stats.to_dict()["termComponents"]) == set(terms)
+  # Frequent terms survive the pruning of rare ones.
+  assert terms["weather"] == 5 and terms["request"] == 100
+  assert stats.component_probabilities("weather forecast")["Icon"] == 1.0
+
+  restored = ComponentUsageStats.from_dict(stats.to_dict(), max_terms=4)
+  restored_terms = restored.to_dict()["terms"]
+  assert len(restored_terms) == 2 and restored_terms["request"] == 100
+
+
+def test_stats_round_trip(stats):
+  restored = ComponentUsageStats.from_dict(json.loads(json.dumps(stats.to_dict())))
+  assert restored.to_dict() == stats.to_dict()
+  assert restored.component_probabilities(
+      "weather forecast"
+  ) == stats.component_probabilities("weather forecast")
+
+
+def test_schema_manager_subsets_prompt(stats):
+  manager = A2uiSchemaManager(
+      VERSION_0_9,
+      catalogs=[BasicCatalog.get_config(VERSION_0_9)],
+      component_subsetter=ComponentSubsetter(
+          stats, min_outputs=10, min_probability=0.6
+      ),
+  )
+
+  full = manager.generate_system_prompt("role", include_schema=True)
+  subset = manager.generate_system_prompt(
+      "role", include_schema=True, query="weather forecast"
+  )
+  assert len(subset) < len(full)
+  assert '"TextField"' in full and '"TextField"' not in subset
+  assert (
+      manager.generate_system_prompt(
+          "role", include_schema=True, query="unknown request"
+      )
+      == full
+  )
+  assert list(
+      manager.get_selected_catalog(query="book a table").catalog_schema["components"]
+  ) == ["Column", "Button", "TextField"]
@@ -15,11 +15,17 @@
 import json
 import copy
 import pytest
-from unittest.mock import MagicMock
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
 from a2ui.schema.manager import A2uiSchemaManager, A2uiCatalog, CatalogConfig
+from a2ui.schema.cache import LruCache
 from a2ui.schema.common_modifiers import remove_strict_validation
+from a2ui.schema.parallel import create_validator_process_pool
 from a2ui.schema.constants import VERSION_0_8, VERSION_0_9
 from a2ui.schema.validator import (
+    VALIDATION_MODE_FAIL_FAST,
+    A2uiValidator,
+    LazyValidationError,
     _find_root_id as find_root_id,
     extract_component_ref_fields,
     analyze_topology,
@@ -630,3 +636,234 @@ class TestValidator:
     single_refs, list_refs = ref_map["MyComp"]
     assert "ref" in single_refs
     assert "multi" in list_refs
+
+  def _valid_payload(self, version):
+    if version == VERSION_0_8:
+      return [
+          {"beginRendering": {"surfaceId": "s1", "root": "root"}},
+          {
+              "surfaceUpdate": {
+                  "surfaceId": "s1",
+                  "components": [
+                      {"id": "root", "component": {"Column": {"children": ["t1"]}}},
+                      {"id": "t1", "component": {"Text": {"text": "Hello"}}},
+                  ],
+              }
+          },
+      ]
+    return [
+        {
+            "version": "v0.9",
+            "createSurface": {"surfaceId": "s1", "catalogId": "c1"},
+        },
+        {
+            "version": "v0.9",
+            "updateComponents": {
+                "surfaceId": "s1",
+                "components": [
+                    {"id": "root", "component": "Column", "children": ["t1"]},
+                    {"id": "t1", "component": "Text", "text": "Hello"},
+                ],
+            },
+        },
+    ]
+
+  def test_result_cache_skips_revalidation(self, test_catalog):
+    cache = LruCache(maxsize=16)
+    validator = A2uiValidator(test_catalog, result_cache=cache)
+    payload = self._valid_payload(test_catalog.version)
+    assert validator.cache_info().currsize == 0
+
+    validator.validate(payload)
+    first = validator.cache_info()
+    assert first.hits == 0
+    assert first.currsize > 0
+
+    # A structurally identical payload (different key order) hits the cache.
+    def reverse_keys(obj):
+      if isinstance(obj, dict):
+        return {k: reverse_keys(obj[k]) for k in reversed(list(obj))}
+      if isinstance(obj, list):
+        return [reverse_keys(item) for item in obj]
+      return obj
+
+    validator.validate(reverse_keys(payload))
+    second = validator.cache_info()
+    assert second.hits == first.misses
+    assert second.misses == first.misses
+
+  def test_result_cache_shared_between_validators(self, catalog_0_9):
+    cache = LruCache(maxsize=16)
+    payload = self._valid_payload(VERSION_0_9)
+
+    A2uiValidator(catalog_0_9, result_cache=cache).validate(payload)
+    A2uiValidator(catalog_0_9, result_cache=cache).validate(payload)
+
+    assert cache.cache_info().hits == cache.cache_info().misses
+
+  def test_result_cache_still_runs_integrity_checks(self, catalog_0_9):
+    cache = LruCache(maxsize=16)
+    validator = A2uiValidator(catalog_0_9, result_cache=cache)
+    validator.validate(self._valid_payload(VERSION_0_9))
+
+    # Same (cached) components, but the reference target is now missing.
+    payload = self._valid_payload(VERSION_0_9)
+    payload[1]["updateComponents"]["components"][1]["id"] = "other"
+    with pytest.raises(ValueError, match="references non-existent component 't1'"):
+      validator.validate(payload)
+
+  def test_result_cache_does_not_store_failures(self, catalog_0_9):
+    cache = LruCache(maxsize=16)
+    validator = A2uiValidator(catalog_0_9, result_cache=cache)
+    payload = self._valid_payload(VERSION_0_9)
+    payload[1]["updateComponents"]["components"][1]["usageHint"] = "h1"
+
+    for _ in range(2):
+      with pytest.raises(ValueError, match="'usageHint' was unexpected"):
+        validator.validate(payload)
+
+  def test_validator_without_cache_has_no_cache_info(self, catalog_0_9):
+    assert catalog_0_9.validator.cache_info() is None
+
+  @pytest.mark.asyncio
+  async def test_validate_async(self, test_catalog):
+    validator = test_catalog.validator
+    await validator.validate_async(self._valid_payload(test_catalog.version))
+
+    with pytest.raises(ValueError):
+      await validator.validate_async([{"unknownMessage": {}}])
+
+  @pytest.mark.asyncio
+  async def test_validate_async_custom_executor(self, catalog_0_9):
+    with ThreadPoolExecutor(max_workers=2) as executor:
+      await catalog_0_9.validator.validate_async(
+          self._valid_payload(VERSION_0_9), executor=executor
+      )
+
+  @pytest.mark.asyncio
+  async def test_validate_async_process_pool(self, catalog_0_9):
+    validator = catalog_0_9.validator
+    with create_validator_process_pool([catalog_0_9], max_workers=1) as executor:
+      await validator.validate_async(
+          self._valid_payload(VERSION_0_9), executor=executor
+      )
+
+      invalid = self._valid_payload(VERSION_0_9)
+      invalid[1]["updateComponents"]["components"][1]["usageHint"] = "h1"
+      with pytest.raises(ValueError, match="'usageHint' was unexpected"):
+        await validator.validate_async(invalid, executor=executor)
+
+  @pytest.mark.asyncio
+  async def test_validate_async_foreign_process_pool(self, catalog_0_9):
+    validator = catalog_0_9.validator
+    with ProcessPoolExecutor(max_workers=1) as executor:
+      await validator.validate_async(
+          self._valid_payload(VERSION_0_9), executor=executor
+      )
+
+      invalid = self._valid_payload(VERSION_0_9)
+      invalid[1]["updateComponents"]["components"][1]["usageHint"] = "h1"
+      with pytest.raises(ValueError, match="'usageHint' was unexpected"):
+        await validator.validate_async(invalid, executor=executor)
+
+  def test_validator_is_thread_safe(self, catalog_0_9):
+    validator = A2uiValidator(catalog_0_9, result_cache=LruCache(maxsize=4))
+    valid = self._valid_payload(VERSION_0_9)
+    invalid = self._valid_payload(VERSION_0_9)
+    invalid[1]["updateComponents"]["components"][1]["usageHint"] = "h1"
+
+    def run(i):
+      try:
+        validator.validate(valid if i % 2 else invalid)
+        return True
+      except ValueError:
+        return False
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+      results = list(executor.map(run, range(200)))
+
+    assert results == [bool(i % 2) for i in range(200)]
+
+  def test_validate_many_in_process(self, catalog_0_9):
+    valid = self._valid_payload(VERSION_0_9)
+    payloads = [valid, [{"unknownMessage": {}}], json.dumps(valid), "{not json"]
+
+    results = list(catalog_0_9.validator.validate_many(payloads))
+
+    assert [r.index for r in results] == [0, 1, 2, 3]
+    assert [r.ok for r in results] == [True, False, True, False]
+    assert "Unknown message type" in results[1].error
+    assert all(r.elapsed >= 0 for r in results)
+
+  def test_validate_many_fail_fast(self, catalog_0_9):
+    valid = self._valid_payload(VERSION_0_9)
+    payloads = [valid, [{"unknownMessage": {}}], valid]
+
+    results = list(catalog_0_9.validator.validate_many(payloads, fail_fast=True))
+
+    assert [r.ok for r in results] == [True, False]
+
+  def test_validate_many_jsonl_with_workers(self, catalog_0_9, tmp_path):
+    valid = json.dumps(self._valid_payload(VERSION_0_9))
+    corpus = tmp_path / "corpus.jsonl"
+    corpus.write_text(
+        "\n".join([valid] * 5 + ["", '[{"unknownMessage": {}}]', valid]) + "\n"
+    )
+
+    results = list(catalog_0_9.validator.validate_many(corpus, workers=2, batch_size=2))
+
+    assert [r.index for r in results] == list(range(7))
+    assert [r.ok for r in results] == [True] * 5 + [False, True]
+
+  def test_validate_many_empty_jsonl(self, catalog_0_9, tmp_path):
+    corpus = tmp_path / "empty.jsonl"
+    corpus.write_text("")
+    assert list(catalog_0_9.validator.validate_many(str(corpus))) == []
+
+  def test_fail_fast_reports_only_first_error(self, catalog_0_9):
+    payload = [
+        {"version": "v0.9", "deleteSurface": {}},
+        {"unknownMessage": {}},
+    ]
+
+    with pytest.raises(LazyValidationError) as excinfo:
+      catalog_0_9.validator.validate(payload, mode=VALIDATION_MODE_FAIL_FAST)
+
+    err_text = str(excinfo.value)
+    assert "'surfaceId' is a required property" in err_text
+    assert "unknownMessage" not in err_text
+
+    # Collect mode still reports every error.
+    with pytest.raises(ValueError) as excinfo:
+      catalog_0_9.validator.validate(payload)
+    assert "unknownMessage" in str(excinfo.value)
+
+  def test_fail_fast_defers_message_formatting(self, catalog_0_9):
+    with patch(
+        "a2ui.schema.validator._format_error", return_value="formatted"
+    ) as mock_format:
+      with pytest.raises(LazyValidationError) as excinfo:
+        catalog_0_9.validator.validate(
+            [{"unknownMessage": {}}], mode=VALIDATION_MODE_FAIL_FAST
+        )
+      mock_format.assert_not_called()
+
+      assert "formatted" in str(excinfo.value)
+      assert "formatted" in str(excinfo.value)
+      mock_format.assert_called_once()
+
+  def test_fail_fast_v0_8(self, catalog_0_8):
+    with pytest.raises(LazyValidationError, match="Validation failed"):
+      catalog_0_8.validator.validate(
+          [{"unknownMessage": {}}], mode=VALIDATION_MODE_FAIL_FAST
+      )
+
+  def test_fail_fast_still_runs_integrity_checks(self, catalog_0_9):
+    payload = self._valid_payload(VERSION_0_9)
+    payload[1]["updateComponents"]["components"][1]["id"] = "other"
+    with pytest.raises(ValueError, match="references non-existent component"):
+      catalog_0_9.validator.validate(payload, mode=VALIDATION_MODE_FAIL_FAST)
+
+  def test_unknown_validation_mode(self, catalog_0_9):
+    with pytest.raises(ValueError, match="Unknown validation mode"):
+      catalog_0_9.validator.validate([], mode="sometimes")
@@ -0,0 +1,119 @@
+# Copyright 2026 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Import-time budgets for the lightweight entry points of the SDK.
+
+Wall-clock budgets are flaky on shared CI machines, so they are only enforced
+when the A2UI_CHECK_IMPORT_TIMES environment variable is set:
+
+  A2UI_CHECK_IMPORT_TIMES=1 pytest tests/test_import_time.py
+
+Checking that the entry points don't load heavy dependencies always runs.
+
+Run directly to print the measured import times:
+
+  python tests/test_import_time.py
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+_SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+_RUNS = 3
+
+# Cumulative import time budgets, in milliseconds. They are generous on purpose:
+# they catch a heavy dependency creeping back into an import path, not jitter.
+IMPORT_BUDGETS_MS = {
+    "a2ui.parser.parser": 60,
+    "a2ui.parser.streaming": 120,
+    "a2ui.schema.manager": 120,
+    "a2ui.schema.validator": 80,
+    "a2ui.a2a.parts": 50,
+    "a2ui.a2a.extension": 50,
+    "a2ui.basic_catalog": 120,
+}
+
+# Dependencies only needed once a payload is validated or sent over A2A.
+HEAVY_MODULES = (
+    "jsonschema",
+    "referencing",
+    "a2a",
+    "pydantic",
+    "google.adk",
+    "google.genai",
+)
+
+
+def _run(code: str) -> subprocess.CompletedProcess:
+  env = dict(os.environ)
+  env["PYTHONPATH"] = os.pathsep.join(filter(None, [_SRC_DIR, env.get("PYTHONPATH")]))
+  return subprocess.run(
+      [sys.executable, "-X", "importtime", "-c", code],
+      env=env,
+      capture_output=True,
+      text=True,
+      check=True,
+  )
+
+
+def measure_import_ms(module: str, runs: int = _RUNS) -> float:
+  """Returns the best cumulative import time of `module` over `runs` runs."""
+  best = None
+  for _ in range(runs):
+    result = _run(f"import {module}")
+    for line in result.stderr.splitlines():
+      fields = [f.strip() for f in line.split("|")]
+      if len(fields) == 3 and fields[2] == module:
+        cumulative_ms = int(fields[1]) / 1000
+        best = cumulative_ms if best is None else min(best, cumulative_ms)
+  if best is None:
+    raise RuntimeError(f"No import time recorded for {module}")
+  return best
+
+
+@pytest.mark.skipif(
+    not os.environ.get("A2UI_CHECK_IMPORT_TIMES"),
+    reason="Set A2UI_CHECK_IMPORT_TIMES=1 to enforce import time budgets.",
+)
+@pytest.mark.parametrize("module", sorted(IMPORT_BUDGETS_MS))
+def test_import_time_within_budget(module):
+  elapsed = measure_import_ms(module)
+  assert elapsed <= IMPORT_BUDGETS_MS[module], (
+      f"Importing {module} took {elapsed:.1f}ms, over its"
+      f" {IMPORT_BUDGETS_MS[module]}ms budget"
+  )
+
+
+def test_entry_points_defer_heavy_dependencies():
+  modules = ", ".join(sorted(IMPORT_BUDGETS_MS))
+  result = _run(
+      f"import json, sys\nimport {modules}\nprint(json.dumps(sorted(sys.modules)))"
+  )
+  loaded = json.loads(result.stdout)
+  eager = [
+      name
+      for name in loaded
+      if any(name == heavy or name.startswith(heavy + ".") for heavy in HEAVY_MODULES)
+  ]
+  assert not eager
+
+
+if __name__ == "__main__":
+  print(f"{'module':<28} {'import (ms)':>12} {'budget (ms)':>12}")
+  for name in sorted(IMPORT_BUDGETS_MS):
+    print(f"{name:<28} {measure_import_ms(name):>12.1f} {IMPORT_BUDGETS_MS[name]:>12}")
@@ -19,6 +19,7 @@ from a2a.server.agent_execution import RequestContext
 from a2a.types import AgentCapabilities, AgentCard, AgentExtension, AgentSkill
 from a2ui.a2a.extension import try_activate_a2ui_extension
 from a2ui.adk.a2a.event_converter import A2uiEventConverter
+from a2ui.schema.catalog_refs import catalog_ref, resolve_catalog
 from a2ui.schema.constants import A2UI_CLIENT_CAPABILITIES_KEY
 from a2ui.schema.manager import A2uiSchemaManager
 from google.adk.a2a.converters.request_converter import AgentRunRequest
@@ -46,7 +47,7 @@ def get_a2ui_catalog(ctx: ReadonlyContext):
   Returns:
       The A2UI catalog or None if not found.
   """
-  return ctx.state.get(_A2UI_CATALOG_KEY)
+  return resolve_catalog(ctx.state.get(_A2UI_CATALOG_KEY))
 
 
 def get_a2ui_examples(ctx: ReadonlyContext):
@@ -138,7 +139,10 @@ class McpAppProxyAgentExecutor(A2aAgentExecutor):
               actions=EventActions(
                   state_delta={
                       _A2UI_ENABLED_KEY: True,
-                      _A2UI_CATALOG_KEY: a2ui_catalog,
+                      # A short reference, not the full schemas.
+                      _A2UI_CATALOG_KEY: (
+                          catalog_ref(a2ui_catalog) if a2ui_catalog else None
+                      ),
                       _A2UI_EXAMPLES_KEY: examples,
                   }
               ),